@@ -0,0 +1,105 @@
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Tuple
+from job_codec import BACKEND, validate_job
+from job_output import write_jobs, read_jobs, iter_jobs_file
+CITIES = ['Campo Grande', 'Dourados', 'Três Lagoas', 'Corumbá', 'Ponta Porã', 'Naviraí', 'Nova Andradina', 'Maracaju']
+SECTORS = ['Tecnologia', 'Saúde', 'Varejo', 'Agronegócio', 'Logística', 'Educação', 'Diversos']
+CONTRACTS = ['CLT', 'PJ', 'Estágio', 'Temporário', 'Não informado']
+TITLES = ['Analista de Sistemas', 'Auxiliar Administrativo', 'Vendedor Externo', 'Enfermeiro', 'Motorista', 'Desenvolvedor Python']
+def synthetic_jobs(count: int, seed: int = 1) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    jobs = []
+    for index in range(count):
+        salary = rng.choice([None, rng.randint(1400, 12000)])
+        jobs.append({
+            'id': f"job-{index}",
+            'titulo': rng.choice(TITLES),
+            'empresa': f"Empresa {rng.randint(1, 2000)}",
+            'empresa_id': rng.randint(1, 2000),
+            'cidade': rng.choice(CITIES),
+            'link': f"https://vagas.example.com/{index}",
+            'setor': rng.choice(SECTORS),
+            'estado': 'MS',
+            'localizacao_completa': '',
+            'tipo_contrato': rng.choice(CONTRACTS),
+            'trabalho_remoto': rng.random() < 0.2,
+            'data_coleta': '2024-05-01 10:00:00',
+            'data_publicacao': f"{rng.randint(1, 28):02d}/04/2024",
+            'ms_verified': True,
+            'extraction_method': 'benchmark',
+            'responsabilidades': ['Atender clientes', 'Elaborar relatórios'],
+            'requisitos': ['Ensino médio completo'],
+            'beneficios': ['Vale transporte', 'Plano de saúde'],
+            'salario': f"R$ {salary}" if salary else 'A combinar',
+            'descricao': ' '.join(rng.choice(TITLES) for _ in range(40)),
+            'portal_origem': rng.choice(['Gupy', 'InfoJobs']),
+            'latitude': -20.4 + rng.random(),
+            'longitude': -54.6 + rng.random(),
+            'modalidade': 'Presencial',
+            'salario_min': float(salary) if salary else None,
+            'salario_max': float(salary) if salary else None,
+            'salario_periodo': 'mensal' if salary else '',
+            'data_publicacao_iso': '2024-04-15'
+        })
+    return jobs
+LAYOUTS = ('pretty', 'compact')
+def stdlib_write(jobs: List[Dict[str, Any]], path: Path, layout: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        if layout == 'pretty':
+            json.dump({'jobs': jobs}, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump({'jobs': jobs}, f, ensure_ascii=False, separators=(',', ':'))
+def stdlib_read(path: Path) -> List[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)['jobs']
+    return [validate_job(job) for job in jobs]
+def codec_write(jobs: List[Dict[str, Any]], path: Path, layout: str):
+    write_jobs(jobs, path, layout, metadata={})
+def codec_read(path: Path) -> List[Dict[str, Any]]:
+    return read_jobs(path)
+def codec_stream(path: Path) -> List[Dict[str, Any]]:
+    return list(iter_jobs_file(path))
+def codec_read_raw(path: Path) -> List[Dict[str, Any]]:
+    return read_jobs(path, validate=False)
+def timed(function: Callable, *args, repeat: int = 3) -> Tuple[float, Any]:
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+def main():
+    parser = argparse.ArgumentParser(description='Compara json da stdlib com o codec de vagas (job_codec) no mesmo layout de arquivo.')
+    parser.add_argument('--jobs', type=int, default=100000, help='Número de vagas sintéticas (padrão: 100000).')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições por medição; usa o melhor tempo (padrão: 3).')
+    args = parser.parse_args()
+    jobs = synthetic_jobs(args.jobs)
+    print(f"📊 {args.jobs} vagas — backend do codec: {BACKEND}")
+    print(f"{'etapa':<34}{'stdlib (s)':>12}{'codec (s)':>12}{'ganho':>8}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for layout in LAYOUTS:
+            stdlib_file = Path(temp_dir) / f'stdlib_{layout}.json'
+            codec_file = Path(temp_dir) / f'codec_{layout}.json'
+            write_stdlib, _ = timed(stdlib_write, jobs, stdlib_file, layout, repeat=args.repeat)
+            write_codec, _ = timed(codec_write, jobs, codec_file, layout, repeat=args.repeat)
+            read_stdlib, stdlib_jobs = timed(stdlib_read, stdlib_file, repeat=args.repeat)
+            read_codec, codec_jobs = timed(codec_read, codec_file, repeat=args.repeat)
+            stream_codec, stream_jobs = timed(codec_stream, codec_file, repeat=args.repeat)
+            read_raw, _ = timed(codec_read_raw, codec_file, repeat=args.repeat)
+            if not stdlib_jobs == codec_jobs == stream_jobs:
+                raise SystemExit("❌ Resultados divergentes entre stdlib e codec")
+            print(f"[{layout}]")
+            print(f"{'  escrita':<34}{write_stdlib:>12.3f}{write_codec:>12.3f}{write_stdlib / write_codec:>7.1f}x")
+            print(f"{'  leitura + validação':<34}{read_stdlib:>12.3f}{read_codec:>12.3f}{read_stdlib / read_codec:>7.1f}x")
+            print(f"{'  leitura em fluxo + validação':<34}{read_stdlib:>12.3f}{stream_codec:>12.3f}{read_stdlib / stream_codec:>7.1f}x")
+            print(f"{'  leitura sem validação':<34}{'':>12}{read_raw:>12.3f}")
+            print(f"{'  tamanho (MB)':<34}{os.path.getsize(stdlib_file) / 1e6:>12.1f}{os.path.getsize(codec_file) / 1e6:>12.1f}")
+if __name__ == "__main__":
+    main()
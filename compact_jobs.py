@@ -0,0 +1,119 @@
+from collections.abc import MutableMapping
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+JOB_FIELDS = (
+    'id', 'titulo', 'empresa', 'empresa_id', 'cidade', 'link', 'setor', 'estado', 'localizacao_completa',
+    'tipo_contrato', 'trabalho_remoto', 'data_coleta', 'data_publicacao', 'ms_verified', 'extraction_method',
+    'responsabilidades', 'requisitos', 'beneficios', 'salario', 'descricao', 'portal_origem', 'latitude',
+    'longitude', 'modalidade', 'salario_min', 'salario_max', 'salario_periodo', 'data_publicacao_iso'
+)
+CATEGORICAL_FIELDS = (
+    'empresa', 'cidade', 'setor', 'estado', 'tipo_contrato', 'modalidade', 'portal_origem', 'salario_periodo'
+)
+_FIELD_SET = frozenset(JOB_FIELDS)
+_MISSING = object()
+class CategoryTable:
+    __slots__ = ('values', 'codes')
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+    def intern(self, value: str) -> str:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+            return value
+        return self.values[code]
+    def code(self, value: str) -> Optional[int]:
+        return self.codes.get(value)
+    def decode(self, code: int) -> str:
+        return self.values[code]
+    def __len__(self) -> int:
+        return len(self.values)
+class JobCategories:
+    __slots__ = ('tables',)
+    def __init__(self, fields: Iterable[str] = CATEGORICAL_FIELDS):
+        self.tables: Dict[str, CategoryTable] = {field: CategoryTable() for field in fields}
+    def intern(self, field: str, value: Any) -> Any:
+        table = self.tables.get(field)
+        if table is not None and type(value) is str:
+            return table.intern(value)
+        return value
+    def code(self, field: str, value: Any) -> Optional[int]:
+        table = self.tables.get(field)
+        return table.code(value) if table is not None and value is not None else None
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.tables.values())
+class CompactJob(MutableMapping):
+    __slots__ = JOB_FIELDS + ('_extra', '_categories')
+    def __init__(self, data: Optional[Iterable] = None, categories: Optional[JobCategories] = None, **kwargs):
+        for field in JOB_FIELDS:
+            object.__setattr__(self, field, _MISSING)
+        self._extra = None
+        self._categories = categories
+        if data is not None:
+            items = data.items() if hasattr(data, 'items') else data
+            for key, value in items:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+    def __setitem__(self, key: str, value: Any):
+        if key in _FIELD_SET:
+            setattr(self, key, value if self._categories is None else self._categories.intern(key, value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    def __delitem__(self, key: str):
+        if key in _FIELD_SET:
+            if getattr(self, key) is _MISSING:
+                raise KeyError(key)
+            setattr(self, key, _MISSING)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELD_SET:
+            return getattr(self, key) is not _MISSING
+        return self._extra is not None and key in self._extra
+    def __iter__(self) -> Iterator[str]:
+        for field in JOB_FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        if self._extra:
+            yield from self._extra
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    def __repr__(self) -> str:
+        return f"CompactJob({self.to_dict()!r})"
+    def copy(self) -> 'CompactJob':
+        return CompactJob(self, self._categories)
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self}
+    def category_code(self, field: str) -> Optional[int]:
+        return self._categories.code(field, self.get(field)) if self._categories is not None else None
+def compact_job(job: Any, categories: Optional[JobCategories] = None) -> CompactJob:
+    return job if isinstance(job, CompactJob) else CompactJob(job, categories)
+def compact_jobs(jobs: Iterable[Any], categories: Optional[JobCategories] = None) -> List[CompactJob]:
+    if categories is None:
+        categories = JobCategories()
+    return [compact_job(job, categories) for job in jobs]
+def to_plain_dicts(jobs: Iterable[Any]) -> List[Dict[str, Any]]:
+    return [job.to_dict() if isinstance(job, CompactJob) else job for job in jobs]
@@ -0,0 +1,122 @@
+import re
+import json
+import argparse
+import logging
+from typing import Dict, List, Any, Iterable
+from text_normalization import fold_term
+logger = logging.getLogger(__name__)
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    'responsabilidades': [
+        'missão do cargo', 'missão da vaga', 'missão', 'principais atividades', 'principais responsabilidades',
+        'atividades', 'responsabilidades', 'atribuições', 'o que você vai fazer', 'descrição das atividades'
+    ],
+    'requisitos': [
+        'requisitos e qualificações', 'requisitos obrigatórios', 'pré-requisitos', 'requisitos',
+        'qualificações', 'exigências'
+    ],
+    'diferenciais': ['diferenciais', 'será um diferencial', 'desejável', 'desejáveis'],
+    'beneficios': ['benefícios oferecidos', 'benefícios', 'oferecemos', 'o que oferecemos'],
+    'salario': ['faixa salarial', 'remuneração', 'salário']
+}
+_ACCENT_CLASSES = {
+    'a': '[aáàâãä]', 'e': '[eéèêë]', 'i': '[iíìîï]', 'o': '[oóòôõö]', 'u': '[uúùûü]', 'c': '[cç]'
+}
+_BULLET_CHARS = '•*●◦▪·⚫➢►-–'
+_ITEM_SPLIT_RE = re.compile(r'\s*(?:[\r\n]+|;|(?:^|\s)[•*●◦▪·⚫➢►](?=\s*\S)|(?:^|\n)\s*[-–]\s+)\s*')
+def _heading_pattern(heading: str) -> str:
+    parts = []
+    for char in fold_term(heading):
+        if char == ' ':
+            parts.append(r'\s+')
+        elif char == '-':
+            parts.append(r'[-\s]?')
+        else:
+            parts.append(_ACCENT_CLASSES.get(char, re.escape(char)))
+    return ''.join(parts)
+def _build_heading_regex() -> re.Pattern:
+    alternatives = []
+    for section, headings in SECTION_HEADINGS.items():
+        patterns = sorted((_heading_pattern(heading) for heading in headings), key=len, reverse=True)
+        alternatives.append(f"(?P<{section}>{'|'.join(patterns)})")
+    return re.compile(
+        r'(?P<prefix>^[ \t' + re.escape(_BULLET_CHARS) + r'#]*)?(?<!\w)(?:' + '|'.join(alternatives) + r')(?!\w)(?P<colon>[ \t]*:)?',
+        re.IGNORECASE | re.MULTILINE
+    )
+_HEADING_RE = _build_heading_regex()
+def _is_heading(match: re.Match) -> bool:
+    heading = match.group(_matched_section(match))
+    if match.group('colon'):
+        return True
+    if heading and heading.isupper():
+        return True
+    if match.group('prefix') is not None:
+        line_end = match.string.find('\n', match.end())
+        rest = match.string[match.end():line_end if line_end != -1 else len(match.string)]
+        return not rest.strip()
+    return False
+def _matched_section(match: re.Match) -> str:
+    for section in SECTION_HEADINGS:
+        if match.group(section) is not None:
+            return section
+    return ''
+def split_items(text: str) -> List[str]:
+    if not text:
+        return []
+    items = []
+    for item in _ITEM_SPLIT_RE.split(str(text)):
+        item = item.strip(' \t' + _BULLET_CHARS)
+        if item and any(char.isalnum() for char in item):
+            items.append(item)
+    return items
+def parse_sections(description: str) -> Dict[str, List[str]]:
+    sections: Dict[str, List[str]] = {section: [] for section in SECTION_HEADINGS}
+    if not description:
+        return sections
+    current_section = None
+    current_start = 0
+    for match in _HEADING_RE.finditer(description):
+        if not _is_heading(match):
+            continue
+        if current_section:
+            sections[current_section].extend(split_items(description[current_start:match.start()]))
+        current_section = _matched_section(match)
+        current_start = match.end()
+    if current_section:
+        sections[current_section].extend(split_items(description[current_start:]))
+    return sections
+def apply_sections(job: Dict[str, Any], sections: Dict[str, List[str]], overwrite: bool = False) -> Dict[str, Any]:
+    for field in ('responsabilidades', 'requisitos', 'beneficios'):
+        items = sections.get(field, [])
+        if field == 'requisitos':
+            items = items + sections.get('diferenciais', [])
+        if items and (overwrite or not job.get(field)):
+            job[field] = items
+        elif isinstance(job.get(field), str):
+            job[field] = split_items(job[field])
+    if sections.get('salario') and (overwrite or not job.get('salario') or job.get('salario') == 'A combinar'):
+        job['salario'] = ' '.join(sections['salario'])
+    return job
+def parse_job_descriptions(jobs: Iterable[Dict[str, Any]], overwrite: bool = False) -> int:
+    parsed_count = 0
+    for job in jobs:
+        description = job.get('descricao')
+        if not description:
+            continue
+        apply_sections(job, parse_sections(description), overwrite)
+        parsed_count += 1
+    return parsed_count
+def main():
+    parser = argparse.ArgumentParser(description='Extrai seções estruturadas das descrições de vagas já salvas.')
+    parser.add_argument('input_file', help='Arquivo JSON de vagas (lista ou objeto com chave "jobs").')
+    parser.add_argument('--output', '-o', help='Arquivo de saída (padrão: sobrescreve o arquivo de entrada).')
+    parser.add_argument('--overwrite', action='store_true', help='Substitui campos já preenchidos.')
+    args = parser.parse_args()
+    with open(args.input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    jobs = data.get('jobs', []) if isinstance(data, dict) else data
+    parsed_count = parse_job_descriptions(jobs, args.overwrite)
+    with open(args.output or args.input_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"✅ {parsed_count} descrições processadas de {len(jobs)} vagas")
+if __name__ == "__main__":
+    main()
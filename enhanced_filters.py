@@ -1,84 +1,262 @@
-from typing import Dict, List, Set, Optional, Union
-from functools import lru_cache
-import re
+from typing import Dict, List, Optional, Union, Callable, Any, Iterable, Tuple
+import logging
+from array import array
+from itertools import islice
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from job_enrichment import job_salary_range, job_publish_date
+from job_identity import stable_job_id
+from search_index import InvertedIndex, FacetIndex, RangeIndex, new_postings, top_k, intersect_many, postings_to_bitmap, bitmap_to_postings, facet_value, bit_count
+from search_analyzer import Analyzer, DEFAULT_ANALYZER, WORD_RE
+from text_normalization import fold_text
+from result_cache import ResultCache, DEFAULT_MAX_BYTES
+from index_snapshot import dump_snapshot, load_snapshot, snapshot_meta
+logger = logging.getLogger(__name__)
+INDEXED_FIELDS = {
+    'titles': 'titulo',
+    'companies': 'empresa',
+    'cities': 'cidade',
+    'sectors': 'setor'
+}
+TEXT_FIELD = 'descriptions'
+FACET_FIELDS = ('cidade', 'empresa', 'setor', 'tipo_contrato', 'trabalho_remoto')
+FACET_FILTERS = (
+    ('city', 'cidade', 'Todas'),
+    ('company', 'empresa', 'Todas'),
+    ('sector', 'setor', 'Todos'),
+    ('contract_type', 'tipo_contrato', 'Todos')
+)
+FIELD_WEIGHTS = {
+    'titles': 3.0,
+    'companies': 2.0,
+    'cities': 1.5,
+    'sectors': 1.5,
+    'descriptions': 1.0
+}
+SORT_OPTIONS = {
+    'relevance': 'Relevância',
+    'date': 'Mais recentes',
+    'salary': 'Maior salário'
+}
+DEFAULT_SORT = 'relevance'
+SORT_COLUMNS = {
+    'date': 'publish_date',
+    'salary': 'salary_high'
+}
+COMPACTION_RATIO = 0.25
+RANGE_FIELDS = ('publish_date', 'salary_low', 'salary_high')
+EPOCH = datetime(1970, 1, 1)
+def date_key(value: Optional[Union[date, datetime]]) -> Optional[float]:
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return (value - EPOCH).total_seconds()
+def salary_value(value: Any) -> Optional[float]:
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+def job_range_values(job: Dict) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    salary_min, salary_max = (salary_value(value) for value in job_salary_range(job))
+    return (
+        date_key(job_publish_date(job)),
+        salary_min if salary_min is not None else salary_max,
+        salary_max if salary_max is not None else salary_min
+    )
 class EnhancedJobFilter:
-    def __init__(self):
-        self.jobs_data: List[Dict] = []
-        self.filter_cache = {}
-        self.search_index = {}
+    def __init__(self, text_loader: Optional[Callable[[Dict], Dict]] = None, compress_postings: bool = False,
+                 analyzer: Optional[Analyzer] = None, field_weights: Optional[Dict[str, float]] = None,
+                 cache_bytes: int = DEFAULT_MAX_BYTES):
+        self.slots: List[Optional[Dict]] = []
+        self.slot_ids: Dict[str, int] = {}
+        self.deleted = 0
+        self.live_mask = 0
+        self.version = 0
+        self.cache = ResultCache(cache_bytes)
+        self.text_loader = text_loader
+        self.compress_postings = compress_postings
+        self.analyzer = analyzer or DEFAULT_ANALYZER
+        self.field_weights = dict(FIELD_WEIGHTS, **(field_weights or {}))
+        self.text_indexed = False
         self._build_search_index()
+    @property
+    def jobs_data(self) -> List[Dict]:
+        if not self.deleted:
+            return list(self.slots)
+        return [job for job in self.slots if job is not None]
     def set_jobs_data(self, jobs_data: List[Dict]):
-        self.jobs_data = jobs_data
-        self.filter_cache.clear()
+        self._reset(jobs_data)
+        self._changed()
+    def _reset(self, jobs_data: Iterable[Dict]):
+        self.slots = list(jobs_data)
+        self.slot_ids = {stable_job_id(job): i for i, job in enumerate(self.slots)}
+        self.deleted = 0
         self._build_search_index()
+        self.live_mask = self.facets.all_mask
     def _build_search_index(self):
-        self.search_index = {
-            'titles': {},
-            'companies': {},
-            'cities': {},
-            'sectors': {},
-            'descriptions': {}
-        }
-        for i, job in enumerate(self.jobs_data):
-            title = job.get('titulo', '').lower()
-            if title:
-                for word in self._tokenize(title):
-                    if word not in self.search_index['titles']:
-                        self.search_index['titles'][word] = set()
-                    self.search_index['titles'][word].add(i)
-            company = job.get('empresa', '').lower()
-            if company:
-                for word in self._tokenize(company):
-                    if word not in self.search_index['companies']:
-                        self.search_index['companies'][word] = set()
-                    self.search_index['companies'][word].add(i)
-            city = job.get('cidade', '').lower()
-            if city:
-                for word in self._tokenize(city):
-                    if word not in self.search_index['cities']:
-                        self.search_index['cities'][word] = set()
-                    self.search_index['cities'][word].add(i)
-            sector = job.get('setor', '').lower()
-            if sector:
-                for word in self._tokenize(sector):
-                    if word not in self.search_index['sectors']:
-                        self.search_index['sectors'][word] = set()
-                    self.search_index['sectors'][word].add(i)
-            description = job.get('descricao', '').lower()
-            if description:
-                for word in self._tokenize(description):
-                    if word not in self.search_index['descriptions']:
-                        self.search_index['descriptions'][word] = set()
-                    self.search_index['descriptions'][word].add(i)
+        self.search_index = InvertedIndex(list(INDEXED_FIELDS) + [TEXT_FIELD], self.compress_postings, self.field_weights)
+        self.text_indexed = False
+        columns = ([], [], [])
+        for i, job in enumerate(self.slots):
+            self._index_fields(i, job)
+            for column, value in zip(columns, job_range_values(job)):
+                column.append(value)
+        self.search_index.freeze(list(INDEXED_FIELDS))
+        self.facets = FacetIndex(FACET_FIELDS)
+        self.facets.build(self.slots)
+        self.ranges = {field: RangeIndex() for field in RANGE_FIELDS}
+        for field, column in zip(RANGE_FIELDS, columns):
+            self.ranges[field].build(column)
+    def _index_fields(self, i: int, job: Dict):
+        analyze_pairs = self.analyzer.analyze_pairs
+        for field, job_field in INDEXED_FIELDS.items():
+            value = job.get(job_field)
+            if value:
+                self.search_index.add_pairs(field, analyze_pairs(value), i)
+    def _index_text(self, i: int, job: Dict, search_index: Optional[InvertedIndex] = None):
+        description = job.get('descricao')
+        if description is None and self.text_loader is not None:
+            description = self.text_loader(job).get('descricao')
+        if description:
+            (search_index or self.search_index).add_pairs(TEXT_FIELD, self.analyzer.analyze_pairs(description), i)
+    def build_text_index(self) -> bool:
+        if self.text_indexed:
+            return False
+        search_index = self.search_index
+        text_index = InvertedIndex([TEXT_FIELD], self.compress_postings, self.field_weights)
+        for i, job in enumerate(self.slots):
+            if job is not None:
+                self._index_text(i, job, text_index)
+        text_index.freeze()
+        if search_index is not self.search_index:
+            return False
+        search_index.replace_field(TEXT_FIELD, text_index)
+        self.text_indexed = True
+        self._changed()
+        return True
+    def _snapshot_meta(self, source_hash: str) -> Dict[str, Any]:
+        return snapshot_meta(source_hash, compress=self.compress_postings, analyzer=self.analyzer.signature())
+    def save_snapshot(self, path: Union[str, Path], source_hash: str) -> bool:
+        if self.deleted:
+            logger.info(f"Índice com vagas removidas; compacte antes de salvar o snapshot em {path}")
+            return False
+        meta = self._snapshot_meta(source_hash)
+        ids = [None] * len(self.slots)
+        for job_id, i in self.slot_ids.items():
+            ids[i] = job_id
+        meta.update(size=len(self.slots), ids=ids, text_indexed=self.text_indexed)
+        try:
+            dump_snapshot(path, meta, self.search_index, self.facets, self.ranges)
+        except OSError as e:
+            logger.warning(f"Não foi possível salvar o snapshot do índice em {path}: {e}")
+            return False
+        return True
+    def load_snapshot(self, path: Union[str, Path], source_hash: str, jobs_data: List[Dict]) -> bool:
+        snapshot = load_snapshot(path, self._snapshot_meta(source_hash), self.field_weights)
+        if snapshot is None:
+            return False
+        header, search_index, facets, ranges = snapshot
+        ids = header['ids']
+        samples = {0, len(jobs_data) // 2, len(jobs_data) - 1} if jobs_data else set()
+        if (header['size'] != len(jobs_data) or set(search_index.fields) != set(INDEXED_FIELDS) | {TEXT_FIELD}
+                or any(ids[i] is not None and ids[i] != stable_job_id(jobs_data[i]) for i in samples)):
+            logger.info(f"Snapshot de índice não corresponde aos dados carregados: {path}")
+            return False
+        self.slots = list(jobs_data)
+        self.slot_ids = {job_id: i for i, job_id in enumerate(ids) if job_id is not None}
+        self.deleted = 0
+        self.search_index = search_index
+        self.facets = facets
+        self.ranges = ranges
+        self.text_indexed = header['text_indexed']
+        self.live_mask = facets.all_mask
+        self._changed()
+        return True
+    def add_jobs(self, jobs: Iterable[Dict]) -> int:
+        added = 0
+        for job in jobs:
+            job_id = stable_job_id(job)
+            self._remove_slot(self.slot_ids.get(job_id))
+            i = len(self.slots)
+            self.slots.append(job)
+            self.slot_ids[job_id] = i
+            self._index_fields(i, job)
+            if self.text_indexed:
+                self._index_text(i, job)
+            self.facets.add(job, i)
+            for field, value in zip(RANGE_FIELDS, job_range_values(job)):
+                self.ranges[field].add(i, value)
+            self.live_mask |= 1 << i
+            added += 1
+        if added:
+            self.search_index.freeze()
+            self._changed()
+        return added
+    def remove_jobs(self, job_ids: Iterable[str]) -> int:
+        removed = 0
+        for job_id in job_ids:
+            if self._remove_slot(self.slot_ids.pop(job_id, None)):
+                removed += 1
+        if removed:
+            self._changed()
+        return removed
+    def update_job(self, job: Dict) -> bool:
+        return self.add_jobs([job]) > 0
+    def _remove_slot(self, i: Optional[int]) -> bool:
+        if i is None or self.slots[i] is None:
+            return False
+        self.facets.remove(self.slots[i], i)
+        self.slots[i] = None
+        self.deleted |= 1 << i
+        self.live_mask &= ~(1 << i)
+        return True
+    def _changed(self):
+        if self.deleted and bit_count(self.deleted) > COMPACTION_RATIO * len(self.slots):
+            self.compact()
+        self.version += 1
+        self.cache.retain_version(self.version)
+    def compact(self):
+        text_indexed = self.text_indexed
+        self._reset(self.jobs_data)
+        if text_indexed:
+            self.build_text_index()
     def _tokenize(self, text: str) -> List[str]:
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [word for word in words if len(word) >= 2]
-    def _search_in_index(self, search_term: str) -> Set[int]:
-        if not search_term:
-            return set(range(len(self.jobs_data)))
-        search_words = self._tokenize(search_term.lower())
+        return self.analyzer.analyze(text)
+    def _all_indices(self) -> array:
+        return bitmap_to_postings(self.live_mask)
+    def _live_jobs(self, limit: Optional[int] = None) -> List[Dict]:
+        if not self.deleted:
+            return self.slots[:limit]
+        return list(islice((job for job in self.slots if job is not None), limit))
+    def _search_terms(self, search_term: str) -> Optional[List[List[str]]]:
+        search_words = self._tokenize(search_term) if search_term else []
         if not search_words:
-            return set(range(len(self.jobs_data)))
-        result_indices = None
-        for word in search_words:
-            word_matches = set()
-            for field_index in self.search_index.values():
-                if word in field_index:
-                    word_matches.update(field_index[word])
-            if not word_matches:
-                for field_index in self.search_index.values():
-                    for indexed_word, indices in field_index.items():
-                        if word in indexed_word or indexed_word in word:
-                            word_matches.update(indices)
-            if result_indices is None:
-                result_indices = word_matches
-            else:
-                result_indices = result_indices.intersection(word_matches)
-        return result_indices or set()
-    @lru_cache(maxsize=100)
+            return None
+        term_groups = []
+        for word in dict.fromkeys(search_words):
+            tokens = [word] if word in self.search_index else self.search_index.partial_matches(word)
+            term_groups.append(tokens)
+        return term_groups
+    def _search_in_index(self, search_term: str) -> array:
+        term_groups = self._search_terms(search_term)
+        if term_groups is None:
+            return self._all_indices()
+        word_postings = []
+        for tokens in term_groups:
+            matches = self.search_index.union_tokens(tokens)
+            if not matches:
+                return new_postings()
+            word_postings.append(matches)
+        return intersect_many(word_postings)
     def get_unique_values(self, field: str) -> List[str]:
+        return self.cache.get_or_compute((self.version, 'unique_values', field), lambda: self._unique_values(field))
+    def _unique_values(self, field: str) -> List[str]:
         values = set()
         for job in self.jobs_data:
             value = job.get(field, '')
@@ -92,111 +270,83 @@ class EnhancedJobFilter:
             'sectors': ['Todos'] + self.get_unique_values('setor'),
             'contract_types': ['Todos'] + self.get_unique_values('tipo_contrato')
         }
-    def apply_filters(self, filters: Dict) -> List[Dict]:
-        cache_key = self._create_cache_key(filters)
-        if cache_key in self.filter_cache:
-            return self.filter_cache[cache_key]
+    def _filter_mask(self, filters: Dict) -> int:
+        mask = self.live_mask
         if filters.get('search'):
-            search_indices = self._search_in_index(filters['search'])
-            filtered_jobs = [self.jobs_data[i] for i in search_indices]
+            mask &= postings_to_bitmap(self._search_in_index(filters['search']))
+        for filter_key, field, all_label in FACET_FILTERS:
+            value = filters.get(filter_key)
+            if value and value != all_label:
+                mask &= self.facets.mask(field, value)
+        if filters.get('remote_only'):
+            mask &= self.facets.mask('trabalho_remoto', True)
+        if mask and filters.get('date_range'):
+            mask &= self._date_mask(filters['date_range'])
+        if mask and filters.get('salary_range'):
+            mask &= self._salary_mask(filters['salary_range'])
+        return mask
+    def _date_mask(self, date_range: Dict) -> int:
+        return self.ranges['publish_date'].mask(date_key(date_range.get('start') or None), date_key(date_range.get('end') or None))
+    def _salary_mask(self, salary_range: Dict) -> int:
+        mask = self.live_mask
+        if salary_range.get('min'):
+            mask &= self.ranges['salary_high'].mask(low=salary_range['min'], include_missing=True)
+        if salary_range.get('max'):
+            mask &= self.ranges['salary_low'].mask(high=salary_range['max'], include_missing=True)
+        return mask
+    def apply_filters(self, filters: Dict, limit: Optional[int] = None) -> List[Dict]:
+        slots = self.slots
+        query = self._normalize_query(filters)
+        sort_by = filters.get('sort_by') or DEFAULT_SORT
+        if sort_by not in SORT_OPTIONS:
+            raise ValueError(f"Ordenação desconhecida: {sort_by}")
+        if sort_by == DEFAULT_SORT and not filters.get('search'):
+            if not query:
+                return self._live_jobs(limit)
+            positions = self.cache.get_or_compute((self.version, 'filters', query), lambda: self._filter_positions(filters))
+            if positions is None:
+                return self._live_jobs(limit)
+            return [slots[i] for i in positions[:limit]]
+        ranked = self.cache.get_or_compute(
+            (self.version, 'ranked', query, sort_by, limit),
+            lambda: self._rank_positions(filters, query, sort_by, limit)
+        )
+        return [slots[i] for i in ranked]
+    def _filter_positions(self, filters: Dict) -> Optional[array]:
+        mask = self._filter_mask(filters)
+        return None if mask == self.live_mask else bitmap_to_postings(mask)
+    def _rank_positions(self, filters: Dict, query: tuple, sort_by: str, limit: Optional[int]) -> array:
+        positions = self.cache.get_or_compute((self.version, 'filters', query), lambda: self._filter_positions(filters))
+        if positions is None:
+            positions = self._all_indices()
+        if sort_by == DEFAULT_SORT:
+            term_groups = self._search_terms(filters.get('search', ''))
+            if term_groups is None:
+                return new_postings(positions[:limit])
+            key = self.search_index.bm25_scores(term_groups, len(self.slots)).__getitem__
         else:
-            filtered_jobs = self.jobs_data.copy()
-        filtered_jobs = self._apply_city_filter(filtered_jobs, filters.get('city'))
-        filtered_jobs = self._apply_company_filter(filtered_jobs, filters.get('company'))
-        filtered_jobs = self._apply_sector_filter(filtered_jobs, filters.get('sector'))
-        filtered_jobs = self._apply_contract_filter(filtered_jobs, filters.get('contract_type'))
-        filtered_jobs = self._apply_remote_filter(filtered_jobs, filters.get('remote_only'))
-        filtered_jobs = self._apply_date_filter(filtered_jobs, filters.get('date_range'))
-        filtered_jobs = self._apply_salary_filter(filtered_jobs, filters.get('salary_range'))
-        self.filter_cache[cache_key] = filtered_jobs
-        return filtered_jobs
-    def _create_cache_key(self, filters: Dict) -> str:
-        return str(sorted(filters.items()))
-    def _apply_city_filter(self, jobs: List[Dict], city: Optional[str]) -> List[Dict]:
-        if not city or city == "Todas":
-            return jobs
-        return [job for job in jobs if job.get('cidade', '').strip() == city]
-    def _apply_company_filter(self, jobs: List[Dict], company: Optional[str]) -> List[Dict]:
-        if not company or company == "Todas":
-            return jobs
-        return [job for job in jobs if job.get('empresa', '').strip() == company]
-    def _apply_sector_filter(self, jobs: List[Dict], sector: Optional[str]) -> List[Dict]:
-        if not sector or sector == "Todos":
-            return jobs
-        return [job for job in jobs if job.get('setor', '').strip() == sector]
-    def _apply_contract_filter(self, jobs: List[Dict], contract_type: Optional[str]) -> List[Dict]:
-        if not contract_type or contract_type == "Todos":
-            return jobs
-        return [job for job in jobs if job.get('tipo_contrato', '').strip() == contract_type]
-    def _apply_remote_filter(self, jobs: List[Dict], remote_only: Optional[bool]) -> List[Dict]:
-        if not remote_only:
-            return jobs
-        return [job for job in jobs if job.get('trabalho_remoto', False)]
-    def _apply_date_filter(self, jobs: List[Dict], date_range: Optional[Dict]) -> List[Dict]:
-        if not date_range:
-            return jobs
-        filtered = []
-        for job in jobs:
-            job_date_str = job.get('data_publicacao', '')
-            if not job_date_str:
-                continue
-            try:
-                job_date = self._parse_date(job_date_str)
-                if job_date:
-                    if date_range.get('start') and job_date < date_range['start']:
-                        continue
-                    if date_range.get('end') and job_date > date_range['end']:
-                        continue
-                    filtered.append(job)
-            except:
-                filtered.append(job)
-        return filtered
-    def _apply_salary_filter(self, jobs: List[Dict], salary_range: Optional[Dict]) -> List[Dict]:
-        if not salary_range:
-            return jobs
-        filtered = []
-        for job in jobs:
-            salary_str = job.get('salario', '')
-            if not salary_str:
-                filtered.append(job)
-                continue
-            try:
-                salary = self._parse_salary(salary_str)
-                if salary:
-                    if salary_range.get('min') and salary < salary_range['min']:
-                        continue
-                    if salary_range.get('max') and salary > salary_range['max']:
-                        continue
-                filtered.append(job)
-            except:
-                filtered.append(job)
-        return filtered
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        if not date_str:
-            return None
-        formats = [
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%d-%m-%Y',
-            '%Y/%m/%d',
-            '%d/%m/%y',
-            '%Y-%m-%d %H:%M:%S'
-        ]
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
-        return None
-    def _parse_salary(self, salary_str: str) -> Optional[float]:
-        if not salary_str:
-            return None
-        clean_salary = re.sub(r'[R$\s,.]', '', salary_str.upper())
-        clean_salary = re.sub(r'[A-Z]', '', clean_salary)
-        try:
-            return float(clean_salary)
-        except ValueError:
-            return None
+            key = self.ranges[SORT_COLUMNS[sort_by]].column.__getitem__
+        return new_postings(top_k(positions, key, limit))
+    def get_facet_counts(self, filters: Optional[Dict] = None) -> Dict[str, Dict]:
+        mask = self._filter_mask(filters or {})
+        return {field: self.facets.counts(field, mask) for field in FACET_FIELDS}
+    def _normalize_query(self, filters: Dict) -> tuple:
+        query = []
+        if filters.get('search'):
+            terms = tuple(sorted(set(self._tokenize(filters['search']))))
+            if terms:
+                query.append(('search', terms))
+        for filter_key, field, all_label in FACET_FILTERS:
+            value = filters.get(filter_key)
+            if value and value != all_label:
+                query.append((filter_key, facet_value(value)))
+        if filters.get('remote_only'):
+            query.append(('remote_only', True))
+        for range_key in ('date_range', 'salary_range'):
+            bounds = tuple(sorted((key, value) for key, value in (filters.get(range_key) or {}).items() if value))
+            if bounds:
+                query.append((range_key, bounds))
+        return tuple(query)
     def get_statistics(self, jobs: Optional[List[Dict]] = None) -> Dict:
         if jobs is None:
             jobs = self.jobs_data
@@ -208,6 +358,7 @@ class EnhancedJobFilter:
             'companies': defaultdict(int),
             'sectors': defaultdict(int),
             'contract_types': defaultdict(int),
+            'work_modes': defaultdict(int),
             'remote_jobs': 0,
             'on_site_jobs': 0
         }
@@ -220,6 +371,7 @@ class EnhancedJobFilter:
             stats['sectors'][sector] += 1
             contract = job.get('tipo_contrato', 'Unknown')
             stats['contract_types'][contract] += 1
+            stats['work_modes'][job.get('modalidade', 'Não informado')] += 1
             if job.get('trabalho_remoto', False):
                 stats['remote_jobs'] += 1
             else:
@@ -228,21 +380,30 @@ class EnhancedJobFilter:
         stats['companies'] = dict(stats['companies'])
         stats['sectors'] = dict(stats['sectors'])
         stats['contract_types'] = dict(stats['contract_types'])
+        stats['work_modes'] = dict(stats['work_modes'])
         return stats
     def suggest_searches(self, partial_term: str, limit: int = 5) -> List[str]:
-        if not partial_term or len(partial_term) < 2:
+        if not partial_term or len(partial_term.strip()) < 2:
+            return []
+        words = WORD_RE.findall(partial_term)
+        if not words:
             return []
-        suggestions = set()
-        partial_lower = partial_term.lower()
-        for field_index in self.search_index.values():
-            for word in field_index.keys():
-                if word.startswith(partial_lower):
-                    suggestions.add(word)
-                elif partial_lower in word:
-                    suggestions.add(word)
-        return sorted(list(suggestions))[:limit]
+        partial_folded = fold_text(words[-1])
+        suggestions = [token for token, _ in self.search_index.prefix_index().complete(partial_folded, limit)]
+        if len(suggestions) < limit and len(partial_folded) >= 2:
+            seen = {fold_text(token) for token in suggestions}
+            infix = []
+            for term in self.search_index.ngrams.containing(partial_folded):
+                surface = self.search_index.surface(term)
+                if term in self.search_index and fold_text(surface) not in seen:
+                    seen.add(fold_text(surface))
+                    infix.append((-self.search_index.weighted_frequency(term), surface))
+            suggestions.extend(surface for _, surface in sorted(infix)[:limit - len(suggestions)])
+        return suggestions
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
     def clear_cache(self):
-        self.filter_cache.clear()
+        self.cache.clear()
 def test_enhanced_filters():
     sample_jobs = [
         {
@@ -0,0 +1,229 @@
+import os
+import sys
+import mmap
+import struct
+import logging
+from array import array
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Tuple, Union
+from job_codec import dumps, loads
+from search_index import (
+    InvertedIndex, FacetIndex, RangeIndex, NgramIndex, POSTING_TYPECODE, FREQUENCY_TYPECODE,
+    writable, encode_deltas, postings_to_bitmap, bitmap_to_postings
+)
+logger = logging.getLogger(__name__)
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_MAGIC = b'MSJIDX01'
+SNAPSHOT_SUFFIX = ".index"
+DEFAULT_INDEX_DIR = Path(".cache") / "index"
+PREFIX = struct.Struct('<8sQ')
+ALIGNMENT = 8
+OFFSET_TYPECODE = 'Q'
+def snapshot_path(source_file: Union[str, Path], index_dir: Union[str, Path] = DEFAULT_INDEX_DIR) -> Path:
+    return Path(index_dir) / f"{Path(source_file).name}{SNAPSHOT_SUFFIX}"
+class PackedPostings(MutableMapping):
+    def __init__(self, tokens: List[str], offsets: Sequence[int], data: memoryview, compressed: bool = False,
+                 ids: Optional[Dict[str, int]] = None):
+        self.tokens = tokens
+        self.ids = ids if ids is not None else dict(zip(tokens, range(len(tokens))))
+        self.offsets = offsets
+        self.data = data
+        self.compressed = compressed
+        self.overlay: Dict[str, Any] = {}
+        self.hidden = set()
+    def __getitem__(self, token: str) -> Any:
+        if token in self.overlay:
+            return self.overlay[token]
+        if token in self.hidden:
+            raise KeyError(token)
+        i = self.ids[token]
+        values = self.data[self.offsets[i]:self.offsets[i + 1]]
+        return bytes(values) if self.compressed else values
+    def get(self, token: str, default: Any = None) -> Any:
+        try:
+            return self[token]
+        except KeyError:
+            return default
+    def __contains__(self, token: object) -> bool:
+        return token in self.overlay or (token in self.ids and token not in self.hidden)
+    def __setitem__(self, token: str, value: Any):
+        self.overlay[token] = value
+        self.hidden.discard(token)
+    def __delitem__(self, token: str):
+        if token not in self:
+            raise KeyError(token)
+        self.overlay.pop(token, None)
+        if token in self.ids:
+            self.hidden.add(token)
+    def __iter__(self) -> Iterator[str]:
+        for token in self.tokens:
+            if token not in self.hidden:
+                yield token
+        for token in self.overlay:
+            if token not in self.ids:
+                yield token
+    def __len__(self) -> int:
+        return len(self.ids) - len(self.hidden) + sum(1 for token in self.overlay if token not in self.ids)
+class SnapshotWriter:
+    def __init__(self):
+        self.chunks: List[Any] = []
+        self.size = 0
+    def add(self, values: Any, typecode: str) -> List:
+        data = memoryview(values).cast('B')
+        ref = [self.size, data.nbytes, typecode]
+        self.chunks.append(data)
+        padding = -data.nbytes % ALIGNMENT
+        if padding:
+            self.chunks.append(bytes(padding))
+        self.size += data.nbytes + padding
+        return ref
+    def pack(self, values: Sequence[Any], typecode: str) -> Dict[str, List]:
+        offsets = array(OFFSET_TYPECODE, [0])
+        total = 0
+        for chunk in values:
+            total += len(chunk)
+            offsets.append(total)
+        return {
+            'data': self.add(b''.join(memoryview(chunk).cast('B') for chunk in values), typecode),
+            'offsets': self.add(offsets, OFFSET_TYPECODE)
+        }
+    def write(self, path: Union[str, Path], header: Dict[str, Any]):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header_bytes = dumps(header)
+        prefix = PREFIX.pack(SNAPSHOT_MAGIC, len(header_bytes)) + header_bytes
+        prefix += bytes(-len(prefix) % ALIGNMENT)
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(prefix)
+            for chunk in self.chunks:
+                f.write(chunk)
+        os.replace(temp_path, path)
+class SnapshotReader:
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_length = PREFIX.unpack_from(self.map)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Arquivo não é um snapshot de índice")
+        self.header = loads(self.map[PREFIX.size:PREFIX.size + header_length])
+        start = PREFIX.size + header_length
+        self.base = start + (-start % ALIGNMENT)
+        self.buffer = memoryview(self.map)
+    def view(self, ref: Sequence) -> memoryview:
+        offset, length, typecode = ref
+        data = self.buffer[self.base + offset:self.base + offset + length]
+        return data if typecode == 'B' else data.cast(typecode)
+    def copy(self, ref: Sequence) -> array:
+        return writable(self.view(ref), ref[2])
+    def packed(self, section: Dict[str, List], tokens: List[str], compressed: bool = False,
+               ids: Optional[Dict[str, int]] = None) -> PackedPostings:
+        return PackedPostings(tokens, self.view(section['offsets']), self.view(section['data']), compressed, ids)
+def _field_postings(search_index: InvertedIndex, field: str, tokens: List[str]) -> List[Any]:
+    field_index = search_index.fields[field]
+    if not search_index.compress:
+        return [field_index[token] for token in tokens]
+    return [postings if isinstance(postings, bytes) else encode_deltas(postings) for postings in map(field_index.__getitem__, tokens)]
+def dump_snapshot(path: Union[str, Path], meta: Dict[str, Any], search_index: InvertedIndex, facets: FacetIndex,
+                  ranges: Dict[str, RangeIndex]):
+    writer = SnapshotWriter()
+    fields = {}
+    for field in search_index.fields:
+        tokens = list(search_index.fields[field])
+        frequencies = search_index.frequencies[field]
+        fields[field] = {
+            'tokens': tokens,
+            'postings': writer.pack(_field_postings(search_index, field, tokens), 'B' if search_index.compress else POSTING_TYPECODE),
+            'frequencies': writer.pack([frequencies[token] for token in tokens], FREQUENCY_TYPECODE),
+            'lengths': writer.add(search_index.lengths[field], POSTING_TYPECODE),
+            'token_count': search_index.token_counts[field]
+        }
+    grams = list(search_index.ngrams.grams)
+    facet_sections = {}
+    for field in facets.fields:
+        values = facets.values(field)
+        facet_sections[field] = {
+            'values': values,
+            'postings': writer.pack([bitmap_to_postings(facets.bitmaps[field][value]) for value in values], POSTING_TYPECODE)
+        }
+    header = dict(meta)
+    header.update({
+        'fields': fields,
+        'surfaces': search_index.surfaces,
+        'ngrams': {
+            'tokens': search_index.ngrams.tokens,
+            'grams': grams,
+            'postings': writer.pack([search_index.ngrams.grams[gram] for gram in grams], POSTING_TYPECODE)
+        },
+        'facets': {'size': facets.size, 'fields': facet_sections},
+        'ranges': {
+            field: {
+                'values': writer.add(range_index.values, 'd'),
+                'positions': writer.add(range_index.positions, POSTING_TYPECODE),
+                'column': writer.add(range_index.column, 'd'),
+                'missing': writer.add(bitmap_to_postings(range_index.missing), POSTING_TYPECODE)
+            }
+            for field, range_index in ranges.items()
+        }
+    })
+    writer.write(path, header)
+def _restore_index(reader: SnapshotReader, header: Dict[str, Any], weights: Dict[str, float]) -> InvertedIndex:
+    search_index = InvertedIndex(list(header['fields']), header['compress'], weights)
+    for field, section in header['fields'].items():
+        tokens = section['tokens']
+        ids = dict(zip(tokens, range(len(tokens))))
+        search_index.fields[field] = reader.packed(section['postings'], tokens, header['compress'], ids)
+        search_index.frequencies[field] = reader.packed(section['frequencies'], tokens, ids=ids)
+        search_index.lengths[field] = reader.copy(section['lengths'])
+        search_index.token_counts[field] = section['token_count']
+    search_index.surfaces = header['surfaces']
+    ngram_index = NgramIndex()
+    ngram_index.tokens = header['ngrams']['tokens']
+    ngram_index.token_ids = dict(zip(ngram_index.tokens, range(len(ngram_index.tokens))))
+    ngram_index.grams = reader.packed(header['ngrams']['postings'], header['ngrams']['grams'])
+    search_index.ngrams = ngram_index
+    return search_index
+def _restore_facets(reader: SnapshotReader, header: Dict[str, Any]) -> FacetIndex:
+    facets = FacetIndex(list(header['facets']['fields']))
+    size = header['facets']['size']
+    for field, section in header['facets']['fields'].items():
+        offsets = reader.view(section['postings']['offsets'])
+        data = reader.view(section['postings']['data'])
+        facets.bitmaps[field] = {
+            value: postings_to_bitmap(data[offsets[i]:offsets[i + 1]], size) for i, value in enumerate(section['values'])
+        }
+    facets.size = size
+    facets.all_mask = (1 << size) - 1
+    return facets
+def _restore_ranges(reader: SnapshotReader, header: Dict[str, Any]) -> Dict[str, RangeIndex]:
+    ranges = {}
+    for field, section in header['ranges'].items():
+        range_index = RangeIndex()
+        range_index.values = reader.copy(section['values'])
+        range_index.positions = reader.copy(section['positions'])
+        range_index.column = reader.copy(section['column'])
+        range_index.missing = postings_to_bitmap(reader.view(section['missing']), len(range_index.column))
+        range_index.size = len(range_index.column)
+        ranges[field] = range_index
+    return ranges
+def snapshot_meta(source_hash: str, **extra: Any) -> Dict[str, Any]:
+    meta = {'format': SNAPSHOT_FORMAT, 'byteorder': sys.byteorder, 'source_hash': source_hash}
+    meta.update(extra)
+    return meta
+def load_snapshot(path: Union[str, Path], meta: Dict[str, Any],
+                  weights: Dict[str, float]) -> Optional[Tuple[Dict[str, Any], InvertedIndex, FacetIndex, Dict[str, RangeIndex]]]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        reader = SnapshotReader(path)
+        header = reader.header
+        if any(header.get(key) != value for key, value in meta.items()):
+            logger.info(f"Snapshot de índice desatualizado: {path}")
+            return None
+        return header, _restore_index(reader, header, weights), _restore_facets(reader, header), _restore_ranges(reader, header)
+    except (OSError, ValueError, KeyError, TypeError, struct.error) as e:
+        logger.warning(f"Snapshot de índice inválido em {path}: {e}")
+        return None
@@ -1,9 +1,8 @@
-import json
 import time
 import argparse
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from selenium import webdriver
@@ -14,6 +13,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
+from job_classifier import job_classifier
+from job_identity import stable_job_id
+from job_output import OUTPUT_MODES, AVAILABLE_COMPRESSIONS, write_jobs, output_file_name
+from description_parser import parse_sections, apply_sections, split_items
+from job_enrichment import enrich_job
 @dataclass
 class InfoJobsVaga:
     titulo: str
@@ -21,12 +25,16 @@ class InfoJobsVaga:
     link: str
     localizacao: str
     data_publicacao: str
-    responsabilidades: str = ""
+    responsabilidades: List[str] = field(default_factory=list)
+    requisitos: List[str] = field(default_factory=list)
+    beneficios: List[str] = field(default_factory=list)
     salario: str = ""
     remoto: bool = False
 class InfoJobsIndependentScraper:
-    def __init__(self):
+    def __init__(self, output_mode: str = 'pretty', compression: str = 'none'):
         self.base_url = "https://www.infojobs.com.br/empregos.aspx?provincia=175"
+        self.output_mode = output_mode
+        self.compression = compression
         self.driver = None
         self.wait = None
         self.ms_cities = [
@@ -176,8 +184,8 @@ class InfoJobsIndependentScraper:
                 pass 
             job_data = {
                 'titulo': '', 'empresa': '', 'link': job_url, 'localizacao': '',
-                'data_publicacao': '', 'responsabilidades': '', 'salario': '',
-                'remoto': False, 'requisitos': '', 'beneficios': ''
+                'data_publicacao': '', 'responsabilidades': [], 'salario': '',
+                'remoto': False, 'requisitos': [], 'beneficios': [], 'descricao': ''
             }
             try:
                 title_element = wait.until(EC.presence_of_element_located((By.XPATH, '//*[@id="VacancyHeader"]//h2')))
@@ -208,18 +216,27 @@ class InfoJobsIndependentScraper:
                 except:
                     job_data['salario'] = ""
             try:
-                requirements_element = driver.find_element(By.XPATH, '//*[@id="vacancylistDetail"]/div[2]/p[1]')
-                job_data['requisitos'] = requirements_element.text.strip()
+                desc_element = driver.find_element(By.CSS_SELECTOR, "p.mb-16.text-break.white-space-pre-line")
+                full_description = desc_element.text.strip()
+                if full_description:
+                    job_data['descricao'] = full_description
+                    apply_sections(job_data, parse_sections(full_description))
             except:
+                pass
+            if not job_data['requisitos']:
                 try:
-                    req_elements = driver.find_elements(By.CSS_SELECTOR, "p, div[class*='description'], [class*='requirement']")
-                    for elem in req_elements:
-                        text = elem.text.strip()
-                        if len(text) > 50 and any(word in text.lower() for word in ['requisito', 'experiência', 'formação', 'escolaridade']):
-                            job_data['requisitos'] = text
-                            break
+                    requirements_element = driver.find_element(By.XPATH, '//*[@id="vacancylistDetail"]/div[2]/p[1]')
+                    job_data['requisitos'] = split_items(requirements_element.text.strip())
                 except:
-                    job_data['requisitos'] = ""
+                    try:
+                        req_elements = driver.find_elements(By.CSS_SELECTOR, "p, div[class*='description'], [class*='requirement']")
+                        for elem in req_elements:
+                            text = elem.text.strip()
+                            if len(text) > 50 and any(word in text.lower() for word in ['requisito', 'experiência', 'formação', 'escolaridade']):
+                                job_data['requisitos'] = split_items(text)
+                                break
+                    except:
+                        job_data['requisitos'] = []
             try:
                 location_elements = driver.find_elements(By.CSS_SELECTOR, "[class*='location'], [class*='cidade']")
                 for elem in location_elements:
@@ -229,6 +246,7 @@ class InfoJobsIndependentScraper:
                         break
             except:
                 job_data['localizacao'] = "Mato Grosso do Sul"
+            job_data.update(job_classifier.classify_job(job_data))
             page_text = driver.page_source.lower()
             job_data['remoto'] = any(keyword in page_text for keyword in ['remoto', 'home office', 'híbrido'])
             if InfoJobsIndependentScraper._is_valid_ms_job(job_data['titulo'], job_data.get('localizacao', ''), job_url, ms_cities):
@@ -251,8 +269,8 @@ class InfoJobsIndependentScraper:
         return True
     @staticmethod
     def _format_job_data(job_data: Dict[str, Any], index: int, ms_cities: List[str]) -> Dict[str, Any]:
-        return {
-            'id': f"infojobs-corrected-{index:04d}-{int(time.time()) % 10000}",
+        return enrich_job({
+            'id': stable_job_id(job_data),
             'titulo': job_data.get('titulo', 'Título não encontrado'),
             'empresa': job_data.get('empresa', 'Empresa não informada'),
             'cidade': InfoJobsIndependentScraper._extract_city_from_location(job_data.get('localizacao', ''), ms_cities),
@@ -260,7 +278,15 @@ class InfoJobsIndependentScraper:
             'link': job_data.get('link', ''),
             'data_coleta': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'salario': job_data.get('salario', ''),
-        }
+            'setor': job_data.get('setor', 'Diversos'),
+            'tipo_contrato': job_data.get('tipo_contrato', 'Não informado'),
+            'descricao': job_data.get('descricao', ''),
+            'responsabilidades': job_data.get('responsabilidades', []),
+            'requisitos': job_data.get('requisitos', []),
+            'beneficios': job_data.get('beneficios', []),
+            'data_publicacao': job_data.get('data_publicacao', ''),
+            'localizacao_completa': job_data.get('localizacao', ''),
+        })
     @staticmethod
     def _extract_city_from_location(location: str, ms_cities: List[str]) -> str:
         if not location:
@@ -273,8 +299,8 @@ class InfoJobsIndependentScraper:
         return "Mato Grosso do Sul"
     def save_jobs_to_json(self, jobs: List[Dict[str, Any]]) -> str:
         try:
-            filename = f"infojobs_corrected_ms_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            output_data = {
+            filename = output_file_name(f"infojobs_corrected_ms_{datetime.now().strftime('%Y%m%d_%H%M%S')}", self.output_mode, self.compression)
+            metadata = {
                 'metadata': {
                     'fonte': 'InfoJobs MS via Scraper Corrigido',
                     'url_base': self.base_url,
@@ -285,11 +311,9 @@ class InfoJobsIndependentScraper:
                     'xpath_empresa': '//*[@id="VacancyHeader"]/div[1]/div/div[1]/div/a',
                     'xpath_salario': '//*[@id="VacancyHeader"]/div[1]/div/div[2]/div[2]',
                     'xpath_requisitos': '//*[@id="vacancylistDetail"]/div[2]/p[1]'
-                },
-                'vagas': jobs
+                }
             }
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=2)
+            write_jobs(jobs, filename, self.output_mode, metadata=metadata, jobs_key='vagas')
             return filename
         except Exception as e:
             print(f"❌ Erro ao salvar arquivo: {e}")
@@ -308,7 +332,7 @@ class InfoJobsIndependentScraper:
             if job.get('salario'):
                 print(f"   💰 {job['salario']}")
             if job.get('requisitos'):
-                print(f"   📋 {job['requisitos'][:100]}...")
+                print(f"   📋 {'; '.join(job['requisitos'])[:100]}...")
             print(f"   🔗 {job['link']}")
             print()
         if len(jobs) > 5:
@@ -328,6 +352,18 @@ def main():
         default=2,
         help='Número máximo de páginas para extrair (padrão: 5)'
     )
+    parser.add_argument(
+        '--output-format',
+        choices=OUTPUT_MODES,
+        default='pretty',
+        help='Formato do arquivo: JSON indentado, JSON compacto ou NDJSON'
+    )
+    parser.add_argument(
+        '--compression',
+        choices=AVAILABLE_COMPRESSIONS,
+        default='none',
+        help='Compressão do arquivo de saída (gzip, ou zstd com o pacote zstandard instalado)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -350,7 +386,7 @@ def main():
         print("      Salário: //*[@id='VacancyHeader']/div[1]/div/div[2]/div[2]")
         print("      Requisitos: //*[@id='vacancylistDetail']/div[2]/p[1]")
         print()
-    scraper = InfoJobsIndependentScraper()
+    scraper = InfoJobsIndependentScraper(output_mode=args.output_format, compression=args.compression)
     if args.unlimited:
         jobs = scraper.scrape_jobs(unlimited=True)
     else:
@@ -6,7 +6,7 @@ import threading
 import time
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Callable
 from collections import defaultdict
 from datetime import datetime
 import customtkinter as ctk
@@ -14,10 +14,11 @@ from tkinter import messagebox, filedialog
 from accurate_ms_map_data import AccurateMSMapData
 logger = logging.getLogger(__name__)
 class InteractiveMapWidget(ctk.CTkFrame):
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, text_loader: Optional[Callable[[Dict], Dict]] = None, **kwargs):
         super().__init__(parent, **kwargs)
         self.map_data = AccurateMSMapData()
         self.jobs_data = []
+        self.text_loader = text_loader
         self.current_map_file = None
         self.is_generating = False
         self.companies = {}
@@ -433,6 +434,7 @@ class InteractiveMapWidget(ctk.CTkFrame):
         try:
             location_text = str(job.get('localizacao') or job.get('cidade') or job.get('location') or 'Campo Grande')
             coords = self.get_precise_coordinates(location_text, company_id)
+            texts = self.text_loader(job) if self.text_loader else {}
             processed_job = {
                 'id': f"{company_id}_{len(self.processed_jobs.get(company_id, []))}",
                 'titulo': str(job.get('titulo', 'Título não informado')),
@@ -447,8 +449,8 @@ class InteractiveMapWidget(ctk.CTkFrame):
                 'icon': company_info['icon'],
                 'description': company_info['description'],
                 'address': coords.get('address', ''),
-                'atribuicoes': self.format_bullet_points(str(job.get('atribuicoes', ''))),
-                'requisitos': self.format_bullet_points(str(job.get('requisitos', ''))),
+                'atribuicoes': self.format_bullet_points(job.get('atribuicoes') or job.get('responsabilidades') or texts.get('responsabilidades', '')),
+                'requisitos': self.format_bullet_points(job.get('requisitos') or texts.get('requisitos', '')),
                 'link': str(job.get('link', '')) if job.get('link') and str(job.get('link')).startswith('http') else ''
             }
             return processed_job
@@ -476,7 +478,9 @@ class InteractiveMapWidget(ctk.CTkFrame):
             logger.warning(f"Error getting coordinates for {location_text}: {e}")
         logger.warning(f"Location not found: '{location_text}' - using Campo Grande")
         return {'lat': -20.4697, 'lng': -54.6201, 'address': 'Campo Grande'}
-    def format_bullet_points(self, text: str) -> str:
+    def format_bullet_points(self, text) -> str:
+        if isinstance(text, (list, tuple)):
+            return '<br>'.join(f"• {item}" for item in text if item)
         if not text or str(text).lower() in ['sem informações', 'nan', 'none', '', 'não informado']:
             return ''
         text = str(text).strip()
@@ -556,7 +560,7 @@ class InteractiveMapWidget(ctk.CTkFrame):
             messagebox.showerror("Erro", f"Erro ao gerar mapa BI: {e}")
             self.status_label.configure(text="❌ Erro ao gerar mapa")
     def create_enhanced_interactive_map_html(self) -> str:
-        clustered_data_json = json.dumps(self.clustered_locations, ensure_ascii=False, indent=2)
+        clustered_data_json = json.dumps(self.clustered_locations, ensure_ascii=False, separators=(',', ':'))
         html_template = f'''<!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -0,0 +1,87 @@
+import re
+import logging
+from typing import Dict, List, Tuple, Iterable, Optional
+from text_normalization import fold_text, fold_term
+logger = logging.getLogger(__name__)
+Rules = Dict[str, List[Tuple[str, float]]]
+CONTRACT_RULES: Rules = {
+    'CLT': [('clt', 3.0), ('carteira assinada', 3.0), ('efetiv*', 1.0), ('carteira', 1.0)],
+    'PJ': [('pj', 3.0), ('pessoa jurídica', 3.0), ('freelancer', 2.0), ('freela', 1.0)],
+    'Estágio': [('estágio', 3.0), ('estagiári*', 3.0)],
+    'Temporário': [('temporári*', 2.0), ('terceiriz*', 1.0)]
+}
+SECTOR_RULES: Rules = {
+    'Tecnologia': [('tecnologia', 2.0), ('ti', 2.0), ('software', 2.0), ('desenvolviment*', 1.0), ('desenvolvedor*', 2.0), ('programador*', 2.0)],
+    'Saúde': [('saúde', 2.0), ('médic*', 2.0), ('hospital*', 2.0), ('clínic*', 1.0), ('enfermag*', 2.0), ('enfermeir*', 2.0)],
+    'Educação': [('educação', 2.0), ('ensino', 1.0), ('escola*', 1.0), ('professor*', 2.0)],
+    'Comercial': [('vendas', 2.0), ('vendedor*', 2.0), ('comercial', 1.0), ('marketing', 1.0)],
+    'Construção': [('construção', 2.0), ('engenharia', 1.0), ('obras', 2.0), ('pedreiro', 2.0)],
+    'Financeiro': [('financeir*', 2.0), ('banco', 1.0), ('contábil', 2.0), ('contabilidade', 2.0)]
+}
+JOB_RULES: Dict[str, Rules] = {
+    'tipo_contrato': CONTRACT_RULES,
+    'setor': SECTOR_RULES
+}
+JOB_DEFAULTS: Dict[str, str] = {
+    'tipo_contrato': 'Não informado',
+    'setor': 'Diversos'
+}
+class JobClassifier:
+    def __init__(self, rules: Dict[str, Rules], defaults: Optional[Dict[str, Optional[str]]] = None):
+        self.dimensions = list(rules.keys())
+        self.defaults = dict(defaults or {})
+        self._label_order = {dimension: list(labels.keys()) for dimension, labels in rules.items()}
+        self._targets: List[List[Tuple[str, str, float]]] = []
+        self._pattern = self._compile(rules)
+    def _compile(self, rules: Dict[str, Rules]) -> Optional[re.Pattern]:
+        keyword_targets: Dict[str, List[Tuple[str, str, float]]] = {}
+        for dimension, labels in rules.items():
+            for label, keywords in labels.items():
+                for keyword, weight in keywords:
+                    keyword_targets.setdefault(fold_term(keyword), []).append((dimension, label, weight))
+        if not keyword_targets:
+            return None
+        alternatives = []
+        for keyword in sorted(keyword_targets, key=len, reverse=True):
+            is_stem = keyword.endswith('*')
+            words = keyword.rstrip('*').split()
+            body = r'\s+'.join(re.escape(word) for word in words)
+            alternatives.append(f"(?P<k{len(self._targets)}>{body}{r'[a-z0-9]*' if is_stem else ''})")
+            self._targets.append(keyword_targets[keyword])
+        return re.compile(r'(?<![a-z0-9])(?:' + '|'.join(alternatives) + r')(?![a-z0-9])')
+    def score(self, text: str) -> Dict[str, Dict[str, float]]:
+        scores: Dict[str, Dict[str, float]] = {dimension: {} for dimension in self.dimensions}
+        if not text or self._pattern is None:
+            return scores
+        for match in self._pattern.finditer(fold_text(text)):
+            for dimension, label, weight in self._targets[int(match.lastgroup[1:])]:
+                dimension_scores = scores[dimension]
+                dimension_scores[label] = dimension_scores.get(label, 0.0) + weight
+        return scores
+    def classify(self, text: str) -> Dict[str, Optional[str]]:
+        scores = self.score(text)
+        result = {}
+        for dimension in self.dimensions:
+            dimension_scores = scores[dimension]
+            if dimension_scores:
+                order = self._label_order[dimension]
+                result[dimension] = max(dimension_scores, key=lambda label: (dimension_scores[label], -order.index(label)))
+            else:
+                result[dimension] = self.defaults.get(dimension)
+        return result
+    def classify_batch(self, texts: Iterable[str]) -> List[Dict[str, Optional[str]]]:
+        return [self.classify(text) for text in texts]
+    def classify_job(self, job: Dict, fields: Tuple[str, ...] = ('titulo', 'descricao', 'requisitos', 'responsabilidades')) -> Dict[str, Optional[str]]:
+        return self.classify(job_text(job, fields))
+def job_text(job: Dict, fields: Tuple[str, ...]) -> str:
+    parts = []
+    for field in fields:
+        value = job.get(field)
+        if not value:
+            continue
+        if isinstance(value, (list, tuple)):
+            parts.extend(str(item) for item in value)
+        else:
+            parts.append(str(value))
+    return '\n'.join(parts)
+job_classifier = JobClassifier(JOB_RULES, JOB_DEFAULTS)
@@ -0,0 +1,145 @@
+import json
+import logging
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+from compact_jobs import CompactJob, JobCategories, compact_jobs
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+logger = logging.getLogger(__name__)
+JOB_SCHEMA: Tuple[Tuple[str, type, Any], ...] = (
+    ('id', str, ''),
+    ('titulo', str, ''),
+    ('empresa', str, ''),
+    ('empresa_id', int, 0),
+    ('cidade', str, ''),
+    ('link', str, ''),
+    ('setor', str, 'Diversos'),
+    ('estado', str, 'MS'),
+    ('localizacao_completa', str, ''),
+    ('tipo_contrato', str, 'Não informado'),
+    ('trabalho_remoto', bool, False),
+    ('data_coleta', str, ''),
+    ('data_publicacao', str, ''),
+    ('ms_verified', bool, True),
+    ('extraction_method', str, ''),
+    ('responsabilidades', list, None),
+    ('requisitos', list, None),
+    ('beneficios', list, None),
+    ('salario', str, ''),
+    ('descricao', str, ''),
+    ('portal_origem', str, ''),
+    ('latitude', float, None),
+    ('longitude', float, None),
+    ('modalidade', str, 'Não informado'),
+    ('salario_min', float, None),
+    ('salario_max', float, None),
+    ('salario_periodo', str, ''),
+    ('data_publicacao_iso', str, '')
+)
+TRUE_STRINGS = {'true', '1', 'sim', 'yes', 's'}
+NULL_STRINGS = {'', 'nan', 'none', 'null', 'n/a'}
+if MSGSPEC_AVAILABLE:
+    BACKEND = 'msgspec'
+    _encoder = msgspec.json.Encoder(enc_hook=lambda value: _default(value))
+    _decoder = msgspec.json.Decoder()
+    def dumps(value: Any, pretty: bool = False) -> bytes:
+        encoded = _encoder.encode(value)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+    def loads(data: bytes) -> Any:
+        return _decoder.decode(data)
+elif ORJSON_AVAILABLE:
+    BACKEND = 'orjson'
+    def dumps(value: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_DATACLASS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(value, default=_default, option=option)
+    def loads(data: bytes) -> Any:
+        return orjson.loads(data)
+else:
+    BACKEND = 'json'
+    def dumps(value: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(value, ensure_ascii=False, indent=2, default=_default).encode('utf-8')
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+    def loads(data: bytes) -> Any:
+        return json.loads(data)
+def _default(value: Any) -> Any:
+    if isinstance(value, CompactJob) or hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if hasattr(value, '__dataclass_fields__'):
+        return dict(value.__dict__)
+    raise TypeError(f"Objeto não serializável: {type(value).__name__}")
+def _plain(job: Any) -> Any:
+    if isinstance(job, dict):
+        return job
+    if isinstance(job, CompactJob):
+        return job.to_dict()
+    return job
+def _coerce_str(value: Any, default: str) -> str:
+    if value is None:
+        return default
+    text = value.strip() if type(value) is str else str(value).strip()
+    return default if text.lower() in NULL_STRINGS and default != '' else text
+def _coerce_bool(value: Any, default: bool) -> bool:
+    if value is None:
+        return default
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    return bool(value)
+def _coerce_float(value: Any, default: Optional[float]) -> Optional[float]:
+    if value is None or value == '':
+        return default
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if number != number else number
+def _coerce_int(value: Any, default: int) -> int:
+    if value is None or value == '':
+        return default
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+def _coerce_list(value: Any, default: Any) -> List[str]:
+    if value is None or value == '':
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if item not in (None, '')]
+    return [str(value).strip()]
+_COERCERS = {str: _coerce_str, bool: _coerce_bool, float: _coerce_float, int: _coerce_int, list: _coerce_list}
+_FIELD_COERCERS = tuple((name, field_type, _COERCERS[field_type], default) for name, field_type, default in JOB_SCHEMA)
+def validate_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(job, dict):
+        raise TypeError(f"Vaga deve ser um objeto JSON, recebido {type(job).__name__}")
+    validated = dict(job)
+    for name, field_type, coerce, default in _FIELD_COERCERS:
+        value = job.get(name)
+        value_type = type(value)
+        if value_type is str and field_type is str and default == '':
+            validated[name] = value.strip()
+        elif value_type is not field_type or field_type is not bool and field_type is not float and field_type is not int:
+            validated[name] = coerce(value, default)
+    return validated
+def encode_job(job: Any) -> bytes:
+    return dumps(_plain(job))
+def encode_jobs(jobs: Iterable[Any]) -> bytes:
+    return dumps([_plain(job) for job in jobs])
+def decode_job(data: bytes, validate: bool = True) -> Dict[str, Any]:
+    job = loads(data)
+    return validate_job(job) if validate else job
+def decode_jobs(data: bytes, validate: bool = True, jobs_keys: Tuple[str, ...] = ('jobs', 'vagas')) -> List[Dict[str, Any]]:
+    decoded = loads(data)
+    if isinstance(decoded, dict):
+        decoded = next((decoded[key] for key in jobs_keys if key in decoded), [])
+    return [validate_job(job) for job in decoded] if validate else decoded
+def decode_records(data: bytes, categories: Optional[JobCategories] = None) -> List[CompactJob]:
+    return compact_jobs(decode_jobs(data), categories)
@@ -0,0 +1,244 @@
+import re
+import zlib
+import random
+import logging
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
+from collections import defaultdict
+from text_normalization import fold_text, fold_term
+from job_identity import canonical_url, stable_job_id
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+logger = logging.getLogger(__name__)
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_DESCRIPTION_THRESHOLD = 0.5
+GENERIC_CITIES = {'', 'mato grosso do sul', 'ms', 'remoto', 'nao informado'}
+SOURCE_ID_PREFIXES = ('infojobs-', 'gupy-')
+MAX_REPRESENTATIVES = 64
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD_RE = re.compile(r'[a-z0-9]+')
+class JobDeduplicator:
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, description_threshold: float = DEFAULT_DESCRIPTION_THRESHOLD,
+                 num_perm: int = 64, bands: int = 16, shingle_size: int = 3, max_description_words: int = 300, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.description_threshold = description_threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_description_words = max_description_words
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _MERSENNE_PRIME) | 1 for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a_array = np.array(self._a, dtype=np.uint64).reshape(-1, 1) & np.uint64(_MAX_HASH)
+            self._b_array = np.array(self._b, dtype=np.uint64).reshape(-1, 1) & np.uint64(_MAX_HASH)
+    def deduplicate(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not jobs:
+            return []
+        parents = list(range(len(jobs)))
+        source_ids: List[Dict[str, str]] = [self._source_ids(job) for job in jobs]
+        def find(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+        def conflicting(first: int, second: int) -> bool:
+            ids_first, ids_second = source_ids[find(first)], source_ids[find(second)]
+            return any(ids_first[prefix] != ids_second[prefix] for prefix in ids_first.keys() & ids_second.keys())
+        def union(first: int, second: int) -> bool:
+            root_first, root_second = find(first), find(second)
+            if root_first == root_second:
+                return True
+            if conflicting(root_first, root_second):
+                return False
+            parents[root_second] = root_first
+            source_ids[root_first].update(source_ids[root_second])
+            return True
+        source_codes: Dict[str, int] = {}
+        def codes(index: int) -> List[int]:
+            ids = source_ids[find(index)]
+            return [source_codes.setdefault(ids[prefix], len(source_codes)) if prefix in ids else -1 for prefix in SOURCE_ID_PREFIXES]
+        by_url: Dict[str, int] = {}
+        for index, job in enumerate(jobs):
+            url = canonical_url(job.get('link', ''))
+            if not url:
+                continue
+            if url in by_url:
+                union(by_url[url], index)
+            else:
+                by_url[url] = index
+        signatures = [self._signature(self._header_shingles(job)) for job in jobs]
+        header_signatures = self._signature_matrix(signatures)
+        description_signatures: Dict[int, Optional[Any]] = {}
+        def description_signature(index: int) -> Optional[Any]:
+            if index not in description_signatures:
+                description_signatures[index] = self._signature(self._description_shingles(jobs[index]))
+            return description_signatures[index]
+        cities = [fold_term(str(job.get('cidade', ''))) for job in jobs]
+        known_cities: Dict[str, int] = {}
+        city_codes = [-1 if city in GENERIC_CITIES else known_cities.setdefault(city, len(known_cities)) for city in cities]
+        def similar(first: int, second: int) -> bool:
+            if not self._compatible_cities(cities[first], cities[second]):
+                return False
+            first_description, second_description = description_signature(first), description_signature(second)
+            if first_description is None or second_description is None:
+                return True
+            return self._similarity(first_description, second_description) >= self.description_threshold
+        representatives = _Representatives(self, header_signatures, city_codes, description_signature)
+        buckets: Dict[Tuple[int, Any], List[int]] = defaultdict(list)
+        merged_pairs = 0
+        capped_buckets: Set[Tuple[int, Any]] = set()
+        for index, signature in enumerate(signatures):
+            if signature is None:
+                continue
+            band_keys = list(enumerate(self._band_keys(signature)))
+            members = sorted(set().union(*(buckets[band_key] for band_key in band_keys if band_key in buckets)))
+            for representative in representatives.candidates(index, members, codes(index)):
+                if find(index) == find(representative):
+                    break
+                if conflicting(representative, index) or not similar(representative, index):
+                    continue
+                if union(representative, index):
+                    merged_pairs += 1
+                    representatives.update_codes(representative, codes(representative))
+                break
+            else:
+                representatives.update_codes(index, codes(index))
+                for band_key in band_keys:
+                    bucket = buckets[band_key]
+                    if len(bucket) < MAX_REPRESENTATIVES:
+                        bucket.append(index)
+                    else:
+                        capped_buckets.add(band_key)
+        if capped_buckets:
+            logger.warning(f"Deduplicação: {len(capped_buckets)} buckets atingiram o limite de {MAX_REPRESENTATIVES} representantes; possíveis duplicatas não comparadas")
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for index in range(len(jobs)):
+            groups[find(index)].append(index)
+        unique_jobs = [self.merge_records([jobs[index] for index in members]) for members in sorted(groups.values())]
+        logger.info(f"Deduplicação: {len(jobs)} vagas -> {len(unique_jobs)} únicas ({merged_pairs} pares quase duplicados)")
+        return unique_jobs
+    def _source_ids(self, job: Dict[str, Any]) -> Dict[str, str]:
+        job_id = stable_job_id(job)
+        for prefix in SOURCE_ID_PREFIXES:
+            if job_id.startswith(prefix):
+                return {prefix: job_id}
+        return {}
+    def _header_shingles(self, job: Dict[str, Any]) -> Set[str]:
+        shingles = set()
+        for field in ('titulo', 'empresa'):
+            text = ' '.join(_WORD_RE.findall(fold_text(str(job.get(field, '')))))
+            if not text:
+                continue
+            padded = f" {text} "
+            shingles.update(f"{field[0]}:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return shingles
+    def _description_shingles(self, job: Dict[str, Any]) -> Set[str]:
+        words = _WORD_RE.findall(fold_text(str(job.get('descricao', ''))))[:self.max_description_words]
+        size = self.shingle_size
+        return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    def _signature(self, shingles: Set[str]) -> Optional[Any]:
+        if not shingles:
+            return None
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+        if NUMPY_AVAILABLE:
+            values = np.array(hashes, dtype=np.uint64).reshape(1, -1)
+            permuted = (self._a_array * values + self._b_array) & np.uint64(_MAX_HASH)
+            return permuted.min(axis=1)
+        return [min(((a & _MAX_HASH) * value + (b & _MAX_HASH)) & _MAX_HASH for value in hashes) for a, b in zip(self._a, self._b)]
+    def _signature_matrix(self, signatures: List[Optional[Any]]) -> Any:
+        if not NUMPY_AVAILABLE:
+            return signatures
+        matrix = np.zeros((len(signatures), self.num_perm), dtype=np.uint64)
+        for index, signature in enumerate(signatures):
+            if signature is not None:
+                matrix[index] = signature
+        return matrix
+    def _band_keys(self, signature: Any) -> List[Any]:
+        if NUMPY_AVAILABLE:
+            return [row.tobytes() for row in signature.reshape(self.bands, self.rows)]
+        return [tuple(signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+    def _similarity(self, first: Any, second: Any) -> float:
+        if NUMPY_AVAILABLE:
+            return np.count_nonzero(first == second) / self.num_perm
+        return sum(1 for left, right in zip(first, second) if left == right) / self.num_perm
+    @staticmethod
+    def _compatible_cities(first: str, second: str) -> bool:
+        return first == second or first in GENERIC_CITIES or second in GENERIC_CITIES
+    @staticmethod
+    def merge_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if len(records) == 1:
+            return records[0]
+        primary = max(records, key=lambda job: (bool(job.get('descricao')), sum(1 for value in job.values() if value not in (None, '', [], 'Não informado', 'A combinar'))))
+        merged = dict(primary)
+        for record in records:
+            if record is primary:
+                continue
+            for key, value in record.items():
+                if value in (None, '', []):
+                    continue
+                current = merged.get(key)
+                if current in (None, '', [], 'Não informado', 'A combinar', 'Diversos', 'Mato Grosso do Sul'):
+                    merged[key] = value
+        links = []
+        portals = []
+        for record in records:
+            if record.get('link') and record['link'] != merged.get('link') and record['link'] not in links:
+                links.append(record['link'])
+            if record.get('portal_origem') and record['portal_origem'] not in portals:
+                portals.append(record['portal_origem'])
+        if links:
+            merged['links_alternativos'] = links
+        if len(portals) > 1:
+            merged['portais'] = portals
+        return merged
+class _Representatives:
+    def __init__(self, deduplicator: JobDeduplicator, headers: Any, cities: List[int], description: Callable[[int], Optional[Any]]):
+        self.deduplicator = deduplicator
+        self.headers = headers
+        self.description = description
+        if NUMPY_AVAILABLE:
+            self.cities = np.array(cities, dtype=np.int64)
+            self.source_codes = np.full((len(cities), len(SOURCE_ID_PREFIXES)), -1, dtype=np.int64)
+            self.descriptions = np.zeros((len(cities), deduplicator.num_perm), dtype=np.uint64)
+            self.described = np.zeros(len(cities), dtype=bool)
+            self.has_description = np.zeros(len(cities), dtype=bool)
+    def update_codes(self, index: int, source_codes: List[int]):
+        if NUMPY_AVAILABLE:
+            self.source_codes[index] = source_codes
+    def candidates(self, index: int, members: List[int], source_codes: List[int]) -> List[int]:
+        if not members:
+            return []
+        deduplicator = self.deduplicator
+        if not NUMPY_AVAILABLE:
+            return [member for member in members if deduplicator._similarity(self.headers[member], self.headers[index]) >= deduplicator.threshold]
+        positions = np.array(members, dtype=np.int64)
+        mask = np.count_nonzero(self.headers[positions] == self.headers[index], axis=1) / deduplicator.num_perm >= deduplicator.threshold
+        city = self.cities[index]
+        if city >= 0:
+            cities = self.cities[positions]
+            mask &= (cities < 0) | (cities == city)
+        codes = np.array(source_codes, dtype=np.int64)
+        stored = self.source_codes[positions]
+        mask &= ~((stored >= 0) & (codes >= 0) & (stored != codes)).any(axis=1)
+        if not mask.any():
+            return []
+        signature = self.description(index)
+        if signature is not None:
+            for member in positions[mask & ~self.described[positions]].tolist():
+                description = self.description(member)
+                if description is not None:
+                    self.descriptions[member] = description
+                    self.has_description[member] = True
+                self.described[member] = True
+            matches = np.count_nonzero(self.descriptions[positions] == signature, axis=1) / deduplicator.num_perm
+            mask &= ~self.has_description[positions] | (matches >= deduplicator.description_threshold)
+        return positions[mask].tolist()
+def deduplicate_jobs(jobs: List[Dict[str, Any]], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    return JobDeduplicator(threshold=threshold).deduplicate(jobs)
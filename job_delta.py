@@ -0,0 +1,132 @@
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable
+from job_identity import stable_job_id
+from job_output import read_jobs, job_file_stem
+from output_catalog import OutputCatalog
+logger = logging.getLogger(__name__)
+DELTA_FORMAT = "ms_jobs_delta"
+DELTA_VERSION = 1
+DELTA_DIR_NAME = "deltas"
+IGNORED_FIELDS = {'data_coleta'}
+def _jobs_by_id(jobs: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    indexed = {}
+    for job in jobs:
+        indexed[stable_job_id(job)] = job
+    return indexed
+def diff_job(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {}
+    for key, value in current.items():
+        if key in IGNORED_FIELDS or key == 'id':
+            continue
+        if key not in previous or previous[key] != value:
+            fields[key] = value
+    unset = [key for key in previous if key not in current and key not in IGNORED_FIELDS and key != 'id']
+    change = {}
+    if fields:
+        change['fields'] = fields
+    if unset:
+        change['unset'] = unset
+    return change
+def compute_delta(previous_jobs: List[Dict[str, Any]], current_jobs: List[Dict[str, Any]],
+                  base: str = "", target: str = "") -> Dict[str, Any]:
+    previous_by_id = _jobs_by_id(previous_jobs)
+    current_by_id = _jobs_by_id(current_jobs)
+    added = []
+    changed = []
+    for job_id, job in current_by_id.items():
+        previous = previous_by_id.get(job_id)
+        if previous is None:
+            added.append(dict(job, id=job_id))
+            continue
+        change = diff_job(previous, job)
+        if change:
+            changed.append(dict(change, id=job_id))
+    removed = [job_id for job_id in previous_by_id if job_id not in current_by_id]
+    return {
+        'format': DELTA_FORMAT,
+        'version': DELTA_VERSION,
+        'base': base,
+        'target': target,
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'summary': {
+            'previous_total': len(previous_by_id),
+            'current_total': len(current_by_id),
+            'added': len(added),
+            'removed': len(removed),
+            'changed': len(changed)
+        },
+        'added': added,
+        'removed': removed,
+        'changed': changed
+    }
+def apply_delta(jobs: List[Dict[str, Any]], delta: Dict[str, Any], in_place: bool = False) -> List[Dict[str, Any]]:
+    if delta.get('format') != DELTA_FORMAT:
+        raise ValueError("Arquivo não é um delta de vagas válido")
+    removed = set(delta.get('removed', []))
+    changes = {change['id']: change for change in delta.get('changed', [])}
+    result = []
+    for job in jobs:
+        job_id = stable_job_id(job)
+        if job_id in removed:
+            continue
+        change = changes.get(job_id)
+        if change:
+            if not in_place:
+                job = dict(job)
+            job.update(change.get('fields', {}))
+            for key in change.get('unset', []):
+                job.pop(key, None)
+        result.append(job)
+    present = {stable_job_id(job) for job in result}
+    for job in delta.get('added', []):
+        if job['id'] not in present:
+            result.append(job if in_place else dict(job))
+    if in_place:
+        jobs[:] = result
+        return jobs
+    return result
+def delta_dir(output_dir: Path) -> Path:
+    return Path(output_dir) / DELTA_DIR_NAME
+def find_previous_output(output_file: Path) -> Optional[Path]:
+    output_file = Path(output_file)
+    catalog = OutputCatalog(output_file.parent)
+    return catalog.run_file(catalog.previous_run(job_file_stem(output_file)))
+def load_jobs_file(file_path: Path) -> List[Dict[str, Any]]:
+    return read_jobs(file_path)
+def load_delta(delta_file: Path) -> Dict[str, Any]:
+    with open(delta_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+def write_delta(current_jobs: List[Dict[str, Any]], output_file: str, previous_file: Optional[Path] = None) -> Optional[Path]:
+    output_file = Path(output_file)
+    previous_file = previous_file or find_previous_output(output_file)
+    if previous_file is None:
+        logger.info("Nenhuma execução anterior encontrada; delta não gerado.")
+        return None
+    try:
+        previous_jobs = load_jobs_file(previous_file)
+        delta = compute_delta(previous_jobs, current_jobs, base=previous_file.name, target=output_file.name)
+        target_dir = delta_dir(output_file.parent)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        delta_file = target_dir / f"{job_file_stem(output_file)}.delta.json"
+        with open(delta_file, 'w', encoding='utf-8') as f:
+            json.dump(delta, f, ensure_ascii=False, separators=(',', ':'))
+        summary = delta['summary']
+        logger.info(f"Delta salvo em {delta_file}: +{summary['added']} -{summary['removed']} ~{summary['changed']}")
+        return delta_file
+    except Exception as e:
+        logger.error(f"Erro ao gerar delta: {e}")
+        return None
+def find_delta(output_dir: Path, base: str, target: str) -> Optional[Path]:
+    delta_file = delta_dir(output_dir) / f"{job_file_stem(target)}.delta.json"
+    if not delta_file.exists():
+        return None
+    try:
+        delta = load_delta(delta_file)
+    except (OSError, ValueError):
+        return None
+    return delta_file if job_file_stem(delta.get('base', '')) == job_file_stem(base) else None
+def latest_delta(output_dir: Path) -> Optional[Path]:
+    return OutputCatalog(output_dir).latest_file(('delta',))
@@ -0,0 +1,165 @@
+import re
+from enum import Enum
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from text_normalization import fold_text
+class WorkMode(str, Enum):
+    PRESENCIAL = "Presencial"
+    REMOTO = "Remoto"
+    HIBRIDO = "Híbrido"
+    NAO_INFORMADO = "Não informado"
+class SalaryPeriod(str, Enum):
+    HORA = "hora"
+    DIA = "dia"
+    SEMANA = "semana"
+    MES = "mes"
+    ANO = "ano"
+COLLECTION_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+ABSOLUTE_DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+    '%Y/%m/%d',
+    '%d/%m/%y',
+    '%Y-%m-%d %H:%M:%S'
+]
+_MONEY_RE = re.compile(r'(r\$\s*)?(?<![\d.,])(\d{1,3}(?:\.\d{3})+|\d+)(?:,(\d{1,2}))?(?:\s*(mil|k)\b)?(?![\d%a-z])')
+_CURRENCY_RE = re.compile(r'r\$|reais|salario|remuneracao|bolsa|\d\s*(?:mil|k)\b')
+_SALARY_PERIOD_RULES = [
+    (SalaryPeriod.HORA, re.compile(r'(?:por|/)\s*hora|\bhora\b|/\s*h\b')),
+    (SalaryPeriod.DIA, re.compile(r'(?:por|/)\s*dia\b|\bdiaria\b')),
+    (SalaryPeriod.SEMANA, re.compile(r'\bsemana[l]?\b')),
+    (SalaryPeriod.ANO, re.compile(r'(?:por|/)\s*ano\b|\banual\b')),
+    (SalaryPeriod.MES, re.compile(r'\bmes\b|\bmensal\b'))
+]
+_SALARY_UPPER_ONLY_RE = re.compile(r'^\s*(?:ate|no maximo)\b')
+_SALARY_LOWER_ONLY_RE = re.compile(r'^\s*(?:a partir de|acima de|minimo de|mais de)\b')
+_SALARY_WORDING_RE = re.compile(r'^\s*(?:a partir de|acima de|minimo de|mais de|no maximo|ate|entre|de)\b')
+_RELATIVE_DATE_RE = re.compile(r'\bha\s+(\d+|um|uma)\s+(minuto|hora|dia|semana|mes|meses|ano)s?\b')
+_SHORT_DATE_RE = re.compile(r'\b(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?\b')
+_RELATIVE_UNITS = {
+    'minuto': timedelta(minutes=1),
+    'hora': timedelta(hours=1),
+    'dia': timedelta(days=1),
+    'semana': timedelta(weeks=1),
+    'mes': timedelta(days=30),
+    'meses': timedelta(days=30),
+    'ano': timedelta(days=365)
+}
+_WORK_MODE_RULES = [
+    (WorkMode.HIBRIDO, re.compile(r'\bhibrid[oa]\b|\bhybrid\b')),
+    (WorkMode.REMOTO, re.compile(r'\bremot[oa]\b|\bremote\b|\bhome\s*office\b|\bteletrabalho\b')),
+    (WorkMode.PRESENCIAL, re.compile(r'\bpresencial\b|\bon[\s-]?site\b'))
+]
+def parse_salary(salary_text: str) -> Tuple[Optional[float], Optional[float], str]:
+    if not salary_text:
+        return None, None, ""
+    normalized = fold_text(salary_text)
+    if not _CURRENCY_RE.search(normalized) and not re.fullmatch(r'[\d\s.,\-ae]+', _SALARY_WORDING_RE.sub('', normalized).strip()):
+        return None, None, ""
+    amounts = []
+    currency_amounts = []
+    for currency, integer_part, decimal_part, multiplier in _MONEY_RE.findall(normalized):
+        value = float(integer_part.replace('.', '') + ('.' + decimal_part if decimal_part else ''))
+        if multiplier:
+            value *= 1000
+        if value > 0:
+            amounts.append(value)
+            if currency:
+                currency_amounts.append(value)
+    amounts = currency_amounts or amounts
+    if not amounts:
+        return None, None, ""
+    period = SalaryPeriod.MES
+    for candidate, pattern in _SALARY_PERIOD_RULES:
+        if pattern.search(normalized):
+            period = candidate
+            break
+    low, high = min(amounts), max(amounts)
+    if len(amounts) == 1:
+        if _SALARY_UPPER_ONLY_RE.search(normalized):
+            low = None
+        elif _SALARY_LOWER_ONLY_RE.search(normalized):
+            high = None
+    return low, high, period.value
+def parse_collection_date(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value).strip(), COLLECTION_DATE_FORMAT)
+    except ValueError:
+        try:
+            return datetime.fromisoformat(str(value).strip())
+        except ValueError:
+            return None
+def parse_publish_date(date_text: str, anchor: Optional[datetime] = None) -> Optional[datetime]:
+    if not date_text:
+        return None
+    anchor = anchor or datetime.now()
+    stripped = str(date_text).strip()
+    for fmt in ABSOLUTE_DATE_FORMATS:
+        try:
+            return datetime.strptime(stripped, fmt)
+        except ValueError:
+            continue
+    normalized = fold_text(stripped)
+    if re.search(r'\bhoje\b|\bagora\b|\brecente', normalized):
+        return anchor
+    if re.search(r'\banteontem\b', normalized):
+        return anchor - timedelta(days=2)
+    if re.search(r'\bontem\b', normalized):
+        return anchor - timedelta(days=1)
+    relative = _RELATIVE_DATE_RE.search(normalized)
+    if relative:
+        amount = 1 if relative.group(1) in ('um', 'uma') else int(relative.group(1))
+        return anchor - amount * _RELATIVE_UNITS[relative.group(2)]
+    short_date = _SHORT_DATE_RE.search(normalized)
+    if short_date:
+        day, month, year = int(short_date.group(1)), int(short_date.group(2)), short_date.group(3)
+        try:
+            if year:
+                return datetime(int(year) + (2000 if len(year) == 2 else 0), month, day)
+            candidate = datetime(anchor.year, month, day)
+            return candidate if candidate <= anchor else datetime(anchor.year - 1, month, day)
+        except ValueError:
+            return None
+    return None
+def parse_work_mode(*texts: str) -> WorkMode:
+    normalized = fold_text(' '.join(str(text) for text in texts if text))
+    for mode, pattern in _WORK_MODE_RULES:
+        if pattern.search(normalized):
+            return mode
+    return WorkMode.NAO_INFORMADO
+def enrich_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    salary_min, salary_max, salary_period = parse_salary(job.get('salario', ''))
+    job['salario_min'] = salary_min
+    job['salario_max'] = salary_max
+    job['salario_periodo'] = salary_period
+    anchor = parse_collection_date(job.get('data_coleta'))
+    publish_date = parse_publish_date(job.get('data_publicacao', ''), anchor)
+    job['data_publicacao_iso'] = publish_date.date().isoformat() if publish_date else ""
+    work_mode = job.get('modalidade')
+    if work_mode not in {mode.value for mode in WorkMode} or work_mode == WorkMode.NAO_INFORMADO.value:
+        work_mode = parse_work_mode(job.get('localizacao_completa', ''), job.get('cidade', ''), job.get('titulo', '')).value
+    if work_mode == WorkMode.NAO_INFORMADO.value and job.get('trabalho_remoto'):
+        work_mode = WorkMode.REMOTO.value
+    job['modalidade'] = work_mode
+    job['trabalho_remoto'] = work_mode in (WorkMode.REMOTO.value, WorkMode.HIBRIDO.value) or bool(job.get('trabalho_remoto'))
+    return job
+def enrich_jobs(jobs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [enrich_job(job) for job in jobs]
+def job_salary_range(job: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    if 'salario_min' in job or 'salario_max' in job:
+        return job.get('salario_min'), job.get('salario_max')
+    salary_min, salary_max, _ = parse_salary(job.get('salario', ''))
+    return salary_min, salary_max
+def job_publish_date(job: Dict[str, Any]) -> Optional[datetime]:
+    iso_date = job.get('data_publicacao_iso')
+    if iso_date:
+        try:
+            return datetime.fromisoformat(iso_date)
+        except ValueError:
+            pass
+    return parse_publish_date(job.get('data_publicacao', ''), parse_collection_date(job.get('data_coleta')))
@@ -0,0 +1,61 @@
+import re
+import hashlib
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from text_normalization import fold_term
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'ref', 'referrer', 'source', 'origem', 'origin', 'jobboardsource', 'campaign', 'src'
+}
+_INFOJOBS_ID_RE = re.compile(r'/vaga-de-[^/?#]*?(?:__|-)(\d{5,})(?:\.aspx)?/?$', re.IGNORECASE)
+_GUPY_ID_RE = re.compile(r'/jobs?/(\d+)(?:[/?#]|$)', re.IGNORECASE)
+_STABLE_ID_RE = re.compile(r'^(?:infojobs|gupy|url|job)-[0-9a-f]+$')
+def canonical_url(url: str) -> str:
+    if not url:
+        return ""
+    url = str(url).strip()
+    if '://' not in url:
+        url = 'https://' + url.lstrip('/')
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if host.endswith(':443') or host.endswith(':80'):
+        host = host.rsplit(':', 1)[0]
+    path = re.sub(r'/{2,}', '/', parts.path).rstrip('/') or '/'
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=False)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+def _short_hash(value: str) -> str:
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()[:16]
+def infojobs_vacancy_id(url: str) -> Optional[str]:
+    if not url or 'infojobs' not in url.lower():
+        return None
+    match = _INFOJOBS_ID_RE.search(urlsplit(url).path)
+    return match.group(1) if match else None
+def gupy_job_id(url: str) -> Optional[str]:
+    if not url or 'gupy.io' not in url.lower():
+        return None
+    match = _GUPY_ID_RE.search(urlsplit(url).path)
+    return match.group(1) if match else None
+def job_id_from_link(link: str) -> Optional[str]:
+    vacancy_id = infojobs_vacancy_id(link)
+    if vacancy_id:
+        return f"infojobs-{vacancy_id}"
+    gupy_id = gupy_job_id(link)
+    if gupy_id:
+        return f"gupy-{gupy_id}"
+    canonical = canonical_url(link)
+    if canonical:
+        return f"url-{_short_hash(canonical)}"
+    return None
+def stable_job_id(job: Dict[str, Any]) -> str:
+    job_id = str(job.get('id') or '')
+    if _STABLE_ID_RE.match(job_id):
+        return job_id
+    link_id = job_id_from_link(job.get('link', ''))
+    if link_id:
+        return link_id
+    content_key = '|'.join(fold_term(str(job.get(field, ''))) for field in ('titulo', 'empresa', 'cidade'))
+    return f"job-{_short_hash(content_key)}"
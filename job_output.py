@@ -0,0 +1,286 @@
+import io
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Iterator, IO, Tuple, Union
+from job_codec import dumps, loads, encode_job, decode_job, decode_jobs, validate_job
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+logger = logging.getLogger(__name__)
+OUTPUT_MODES = ('pretty', 'compact', 'ndjson')
+COMPRESSIONS = ('none', 'gzip', 'zstd')
+AVAILABLE_COMPRESSIONS = tuple(compression for compression in COMPRESSIONS if compression != 'zstd' or ZSTD_AVAILABLE)
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+JOB_FILE_SUFFIXES = ('.json', '.ndjson', '.json.gz', '.ndjson.gz', '.json.zst', '.ndjson.zst')
+DICTIONARY_COLUMNS = ['cidade', 'empresa', 'setor', 'tipo_contrato', 'estado', 'modalidade', 'portal_origem', 'salario_periodo']
+STRING_COLUMNS = [
+    'id', 'titulo', 'empresa', 'cidade', 'link', 'setor', 'estado', 'localizacao_completa', 'tipo_contrato',
+    'data_coleta', 'data_publicacao', 'extraction_method', 'salario', 'descricao', 'portal_origem', 'modalidade',
+    'salario_periodo', 'data_publicacao_iso'
+]
+LIST_COLUMNS = ['responsabilidades', 'requisitos', 'beneficios', 'links_alternativos', 'portais']
+BOOL_COLUMNS = ['trabalho_remoto', 'ms_verified']
+FLOAT_COLUMNS = ['latitude', 'longitude', 'salario_min', 'salario_max']
+INT_COLUMNS = ['empresa_id']
+VIEW_COLUMNS: Dict[str, List[str]] = {
+    'map': ['id', 'titulo', 'empresa', 'cidade', 'setor', 'tipo_contrato', 'trabalho_remoto', 'modalidade', 'latitude', 'longitude', 'link'],
+    'analytics': ['id', 'empresa', 'cidade', 'setor', 'tipo_contrato', 'trabalho_remoto', 'modalidade', 'salario_min', 'salario_max', 'data_publicacao_iso', 'portal_origem'],
+    'list': ['id', 'titulo', 'empresa', 'cidade', 'setor', 'tipo_contrato', 'trabalho_remoto', 'modalidade', 'salario', 'data_publicacao', 'data_publicacao_iso', 'link', 'portal_origem']
+}
+def _job_schema() -> 'pa.Schema':
+    fields = []
+    for column in STRING_COLUMNS:
+        value_type = pa.dictionary(pa.int32(), pa.string()) if column in DICTIONARY_COLUMNS else pa.string()
+        fields.append(pa.field(column, value_type))
+    fields.extend(pa.field(column, pa.list_(pa.string())) for column in LIST_COLUMNS)
+    fields.extend(pa.field(column, pa.bool_()) for column in BOOL_COLUMNS)
+    fields.extend(pa.field(column, pa.float64()) for column in FLOAT_COLUMNS)
+    fields.extend(pa.field(column, pa.int64()) for column in INT_COLUMNS)
+    return pa.schema(fields)
+def _column_values(jobs: List[Dict[str, Any]], column: str) -> List[Any]:
+    if column in LIST_COLUMNS:
+        return [[str(item) for item in value] if isinstance(value, (list, tuple)) else ([str(value)] if value else []) for value in (job.get(column) for job in jobs)]
+    if column in BOOL_COLUMNS:
+        return [bool(job.get(column)) for job in jobs]
+    if column in FLOAT_COLUMNS:
+        return [_to_number(job.get(column), float) for job in jobs]
+    if column in INT_COLUMNS:
+        return [_to_number(job.get(column), int) for job in jobs]
+    return [None if job.get(column) is None else str(job.get(column)) for job in jobs]
+def _to_number(value: Any, number_type: type) -> Optional[Any]:
+    if value in (None, ''):
+        return None
+    try:
+        return number_type(value)
+    except (TypeError, ValueError):
+        return None
+def jobs_to_table(jobs: List[Dict[str, Any]]) -> 'pa.Table':
+    schema = _job_schema()
+    arrays = []
+    for schema_field in schema:
+        values = _column_values(jobs, schema_field.name)
+        if pa.types.is_dictionary(schema_field.type):
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=schema_field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+def save_jobs_to_parquet(jobs: List[Dict[str, Any]], output_file: str, compression: str = 'zstd') -> bool:
+    if not PYARROW_AVAILABLE:
+        logger.warning("pyarrow não instalado; exportação Parquet ignorada.")
+        return False
+    try:
+        pq.write_table(jobs_to_table(jobs), output_file, compression=compression, use_dictionary=DICTIONARY_COLUMNS)
+        logger.info(f"Resultados salvos em Parquet: {output_file}")
+        return True
+    except Exception as e:
+        logger.error(f"Erro ao salvar vagas em Parquet: {e}")
+        return False
+def load_jobs_from_parquet(input_file: str, columns: Optional[Sequence[str]] = None, view: Optional[str] = None) -> List[Dict[str, Any]]:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow é necessário para ler arquivos Parquet")
+    if view is not None:
+        columns = VIEW_COLUMNS[view]
+    if columns is not None:
+        available = set(pq.read_schema(input_file).names)
+        columns = [column for column in columns if column in available]
+    table = pq.read_table(input_file, columns=list(columns) if columns is not None else None)
+    return table.to_pylist()
+def view_columns(*views: str) -> List[str]:
+    columns: List[str] = []
+    for view in views:
+        columns.extend(column for column in VIEW_COLUMNS[view] if column not in columns)
+    return columns
+def load_job_from_parquet(input_file: str, job_id: str) -> Optional[Dict[str, Any]]:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow é necessário para ler arquivos Parquet")
+    rows = pq.read_table(input_file, filters=[('id', '=', job_id)]).to_pylist()
+    return rows[0] if rows else None
+def iter_parquet_rows(input_file: str, columns: Sequence[str], batch_size: int = 5000) -> Iterator[Dict[str, Any]]:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow é necessário para ler arquivos Parquet")
+    parquet_file = pq.ParquetFile(input_file)
+    available = set(parquet_file.schema_arrow.names)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=[column for column in columns if column in available]):
+        yield from batch.to_pylist()
+def parquet_path_for(json_file: str) -> Path:
+    return Path(json_file).with_name(job_file_stem(json_file) + '.parquet')
+def output_file_name(stem: str, mode: str = 'pretty', compression: str = 'none') -> str:
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Modo de saída inválido: {mode}")
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Compressão inválida: {compression}")
+    if compression not in AVAILABLE_COMPRESSIONS:
+        raise ValueError(f"Compressão {compression} indisponível: instale o pacote zstandard")
+    return stem + ('.ndjson' if mode == 'ndjson' else '.json') + COMPRESSION_SUFFIXES.get(compression, '')
+def job_file_stem(file_path: Union[str, Path]) -> str:
+    name = Path(file_path).name
+    for suffix in sorted(JOB_FILE_SUFFIXES + ('.delta.json', '.parquet', '.csv'), key=len, reverse=True):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return Path(file_path).stem
+def file_compression(file_path: Union[str, Path]) -> str:
+    name = str(file_path)
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if name.endswith(suffix):
+            return compression
+    return 'none'
+def is_ndjson(file_path: Union[str, Path]) -> bool:
+    return '.ndjson' in Path(file_path).name
+def open_binary(file_path: Union[str, Path], mode: str = 'r') -> IO[bytes]:
+    compression = file_compression(file_path)
+    if compression == 'gzip':
+        return gzip.open(file_path, mode + 'b')
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard é necessário para arquivos .zst")
+        raw = open(file_path, mode + 'b')
+        return zstandard.ZstdCompressor().stream_writer(raw) if mode == 'w' else io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw))
+    return open(file_path, mode + 'b')
+def open_text(file_path: Union[str, Path], mode: str = 'r') -> IO[str]:
+    compression = file_compression(file_path)
+    if compression == 'gzip':
+        return gzip.open(file_path, mode + 't', encoding='utf-8')
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstandard é necessário para arquivos .zst")
+        raw = open(file_path, mode + 'b')
+        context = zstandard.ZstdCompressor() if mode == 'w' else zstandard.ZstdDecompressor()
+        stream = context.stream_writer(raw) if mode == 'w' else context.stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    return open(file_path, mode, encoding='utf-8')
+def write_jobs(jobs: List[Dict[str, Any]], output_file: Union[str, Path], mode: str = 'pretty',
+               metadata: Optional[Dict[str, Any]] = None, jobs_key: str = 'jobs') -> None:
+    with open_binary(output_file, 'w') as f:
+        if mode == 'ndjson' or is_ndjson(output_file):
+            for job in jobs:
+                f.write(encode_job(job))
+                f.write(b'\n')
+            return
+        data: Any = dict(metadata, **{jobs_key: jobs}) if metadata is not None else jobs
+        f.write(dumps(data, pretty=mode == 'pretty'))
+def load_job_data(input_file: Union[str, Path]) -> Any:
+    if is_ndjson(input_file):
+        return list(iter_ndjson(input_file, validate=False))
+    with open_binary(input_file) as f:
+        return loads(f.read())
+def iter_ndjson(input_file: Union[str, Path], validate: bool = True) -> Iterator[Dict[str, Any]]:
+    with open_binary(input_file) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield decode_job(line, validate)
+class _JsonStream:
+    def __init__(self, f: IO[str], chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"JSON inválido: esperado '{char}' na posição {self.pos}")
+        self.pos += 1
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+    def iter_array(self) -> Iterator[Any]:
+        self.expect('[')
+        while True:
+            char = self.peek()
+            if char == ']':
+                self.pos += 1
+                return
+            if char == ',':
+                self.pos += 1
+                continue
+            if not char:
+                raise ValueError("JSON inválido: array não terminado")
+            yield self.decode()
+def iter_json_records(input_file: Union[str, Path], jobs_keys: Tuple[str, ...] = ('jobs', 'vagas'),
+                      metadata: Optional[Dict[str, Any]] = None, chunk_size: int = 1 << 16,
+                      validate: bool = True) -> Iterator[Dict[str, Any]]:
+    with open_text(input_file) as f:
+        stream = _JsonStream(f, chunk_size)
+        first = stream.peek()
+        if first == '[':
+            yield from _validated(stream.iter_array(), validate)
+            return
+        stream.expect('{')
+        while True:
+            char = stream.peek()
+            if char == '}' or not char:
+                return
+            if char == ',':
+                stream.pos += 1
+                continue
+            key = stream.decode()
+            stream.expect(':')
+            if key in jobs_keys and stream.peek() == '[':
+                yield from _validated(stream.iter_array(), validate)
+            else:
+                value = stream.decode()
+                if metadata is not None:
+                    metadata[key] = value
+def _validated(records: Iterator[Any], validate: bool) -> Iterator[Dict[str, Any]]:
+    return map(validate_job, records) if validate else records
+def iter_jobs_file(input_file: Union[str, Path], metadata: Optional[Dict[str, Any]] = None,
+                   validate: bool = True) -> Iterator[Dict[str, Any]]:
+    if is_ndjson(input_file):
+        return iter_ndjson(input_file, validate)
+    return iter_json_records(input_file, metadata=metadata, validate=validate)
+def read_jobs(input_file: Union[str, Path], jobs_keys: Tuple[str, ...] = ('jobs', 'vagas'),
+              validate: bool = True) -> List[Dict[str, Any]]:
+    if is_ndjson(input_file):
+        return list(iter_ndjson(input_file, validate))
+    with open_binary(input_file) as f:
+        return decode_jobs(f.read(), validate, jobs_keys)
+def find_job_files(directory: Union[str, Path], prefixes: Sequence[str] = ('unified_ms_jobs_',)) -> List[Path]:
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+    return [
+        path for path in directory.iterdir()
+        if path.is_file() and path.name.startswith(tuple(prefixes)) and path.name.endswith(JOB_FILE_SUFFIXES)
+    ]
+def latest_job_file(directory: Union[str, Path], prefixes: Sequence[str] = ('unified_ms_jobs_',)) -> Optional[Path]:
+    files = find_job_files(directory, prefixes)
+    return max(files, key=lambda path: path.stat().st_mtime) if files else None
@@ -0,0 +1,246 @@
+import csv
+import json
+import sqlite3
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+from job_identity import stable_job_id
+logger = logging.getLogger(__name__)
+DEFAULT_DB_PATH = Path("output") / "ms_jobs.db"
+BATCH_SIZE = 500
+COLUMNS = (
+    'id', 'titulo', 'empresa', 'cidade', 'estado', 'setor', 'tipo_contrato', 'modalidade', 'trabalho_remoto',
+    'salario_min', 'salario_max', 'data_publicacao_iso', 'portal_origem', 'link'
+)
+FILTER_COLUMNS = ('cidade', 'setor', 'tipo_contrato', 'trabalho_remoto', 'modalidade', 'portal_origem')
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    source_file TEXT,
+    total INTEGER NOT NULL DEFAULT 0,
+    added INTEGER NOT NULL DEFAULT 0,
+    removed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    titulo TEXT,
+    empresa TEXT,
+    cidade TEXT,
+    estado TEXT,
+    setor TEXT,
+    tipo_contrato TEXT,
+    modalidade TEXT,
+    trabalho_remoto INTEGER NOT NULL DEFAULT 0,
+    salario_min REAL,
+    salario_max REAL,
+    data_publicacao_iso TEXT,
+    portal_origem TEXT,
+    link TEXT,
+    descricao TEXT,
+    data TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1,
+    first_seen_run INTEGER REFERENCES runs(id),
+    last_seen_run INTEGER REFERENCES runs(id)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_cidade ON jobs(cidade);
+CREATE INDEX IF NOT EXISTS idx_jobs_setor ON jobs(setor);
+CREATE INDEX IF NOT EXISTS idx_jobs_tipo_contrato ON jobs(tipo_contrato);
+CREATE INDEX IF NOT EXISTS idx_jobs_trabalho_remoto ON jobs(trabalho_remoto);
+CREATE INDEX IF NOT EXISTS idx_jobs_active ON jobs(active, last_seen_run);
+"""
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    titulo, empresa, descricao,
+    content='jobs', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, titulo, empresa, descricao) VALUES (new.rowid, new.titulo, new.empresa, new.descricao);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, titulo, empresa, descricao) VALUES ('delete', old.rowid, old.titulo, old.empresa, old.descricao);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF titulo, empresa, descricao ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, titulo, empresa, descricao) VALUES ('delete', old.rowid, old.titulo, old.empresa, old.descricao);
+    INSERT INTO jobs_fts(rowid, titulo, empresa, descricao) VALUES (new.rowid, new.titulo, new.empresa, new.descricao);
+END;
+"""
+UPSERT_SQL = f"""
+INSERT INTO jobs ({', '.join(COLUMNS)}, descricao, data, active, first_seen_run, last_seen_run)
+VALUES ({', '.join('?' for _ in COLUMNS)}, ?, ?, 1, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    {', '.join(f'{column} = excluded.{column}' for column in COLUMNS[1:])},
+    descricao = excluded.descricao,
+    data = excluded.data,
+    active = 1,
+    last_seen_run = excluded.last_seen_run
+"""
+class JobStore:
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fts_enabled = False
+        self._initialize()
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(str(self.db_path), timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+    def _initialize(self):
+        with self.connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            try:
+                connection.executescript(FTS_SCHEMA)
+                self.fts_enabled = True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 indisponível, busca textual usará LIKE: {e}")
+    @staticmethod
+    def _row_values(job: Dict[str, Any], run_id: int) -> Tuple:
+        values = []
+        for column in COLUMNS:
+            value = job.get(column)
+            if column == 'trabalho_remoto':
+                value = 1 if value else 0
+            elif isinstance(value, (list, dict)):
+                value = json.dumps(value, ensure_ascii=False)
+            values.append(value)
+        values.extend([job.get('descricao', ''), json.dumps(job, ensure_ascii=False), run_id, run_id])
+        return tuple(values)
+    def save_run(self, jobs: List[Dict[str, Any]], source_file: str = "") -> int:
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started_at, source_file, total) VALUES (?, ?, ?)",
+                (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), str(source_file), len(jobs))
+            )
+            run_id = cursor.lastrowid
+            before = connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            for start in range(0, len(jobs), BATCH_SIZE):
+                batch = []
+                for job in jobs[start:start + BATCH_SIZE]:
+                    job = dict(job, id=stable_job_id(job))
+                    batch.append(self._row_values(job, run_id))
+                connection.executemany(UPSERT_SQL, batch)
+            added = connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] - before
+            removed = connection.execute(
+                "UPDATE jobs SET active = 0 WHERE active = 1 AND last_seen_run <> ?", (run_id,)
+            ).rowcount
+            connection.execute("UPDATE runs SET added = ?, removed = ? WHERE id = ?", (added, removed, run_id))
+        logger.info(f"Banco {self.db_path}: execução {run_id} com {len(jobs)} vagas (+{added} novas, -{removed} encerradas)")
+        return run_id
+    def _where(self, search: Optional[str], filters: Dict[str, Any], active_only: bool) -> Tuple[str, List[Any]]:
+        clauses = []
+        params: List[Any] = []
+        if active_only:
+            clauses.append("jobs.active = 1")
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS or value in (None, ''):
+                continue
+            if isinstance(value, (list, tuple, set)):
+                clauses.append(f"jobs.{column} IN ({', '.join('?' for _ in value)})")
+                params.extend(value)
+            else:
+                clauses.append(f"jobs.{column} = ?")
+                params.append(int(bool(value)) if column == 'trabalho_remoto' else value)
+        if search:
+            if self.fts_enabled:
+                clauses.append("jobs.rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+                params.append(self._fts_query(search))
+            else:
+                clauses.append("(jobs.titulo LIKE ? OR jobs.empresa LIKE ? OR jobs.descricao LIKE ?)")
+                params.extend([f"%{search}%"] * 3)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+    @staticmethod
+    def _fts_query(search: str) -> str:
+        terms = [term.replace('"', '') for term in search.split()]
+        return ' '.join(f'"{term}"*' for term in terms if term)
+    def query(self, search: Optional[str] = None, limit: int = 50, offset: int = 0, active_only: bool = True,
+              order_by: str = 'data_publicacao_iso DESC', **filters) -> Tuple[List[Dict[str, Any]], int]:
+        if order_by.split()[0] not in COLUMNS:
+            raise ValueError(f"Ordenação inválida: {order_by}")
+        where, params = self._where(search, filters, active_only)
+        with self.connect() as connection:
+            total = connection.execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+            rows = connection.execute(
+                f"SELECT data FROM jobs{where} ORDER BY {order_by}, jobs.rowid LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+        return [json.loads(row['data']) for row in rows], total
+    def iter_jobs(self, active_only: bool = True, batch_size: int = BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        where = " WHERE active = 1" if active_only else ""
+        with self.connect() as connection:
+            cursor = connection.execute(f"SELECT data FROM jobs{where} ORDER BY rowid")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield json.loads(row['data'])
+    def load_all(self, active_only: bool = True) -> List[Dict[str, Any]]:
+        return list(self.iter_jobs(active_only))
+    def count(self, active_only: bool = True) -> int:
+        where = " WHERE active = 1" if active_only else ""
+        with self.connect() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM jobs{where}").fetchone()[0]
+    def latest_run(self) -> Optional[Dict[str, Any]]:
+        with self.connect() as connection:
+            row = connection.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        return dict(row) if row else None
+    def runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self.connect() as connection:
+            rows = connection.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(row) for row in rows]
+    def export_json(self, output_file: Path, active_only: bool = True) -> int:
+        count = 0
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for job in self.iter_jobs(active_only):
+                if count:
+                    f.write(',\n')
+                json.dump(job, f, ensure_ascii=False)
+                count += 1
+            f.write(']')
+        return count
+    def export_csv(self, output_file: Path, active_only: bool = True) -> int:
+        jobs = self.iter_jobs(active_only)
+        first_job = next(jobs, None)
+        if first_job is None:
+            Path(output_file).write_text('', encoding='utf-8')
+            return 0
+        count = 0
+        with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(first_job.keys()), extrasaction='ignore')
+            writer.writeheader()
+            for job in _chain_first(first_job, jobs):
+                writer.writerow({
+                    key: json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else value
+                    for key, value in job.items()
+                })
+                count += 1
+        return count
+def _chain_first(first: Dict[str, Any], rest: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    yield first
+    yield from rest
+def save_jobs_to_store(jobs: List[Dict[str, Any]], source_file: str = "", db_path: Path = DEFAULT_DB_PATH) -> Optional[int]:
+    try:
+        return JobStore(db_path).save_run(jobs, source_file)
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao salvar vagas no banco {db_path}: {e}")
+        return None
+def open_store(db_path: Path = DEFAULT_DB_PATH) -> Optional[JobStore]:
+    if not Path(db_path).exists():
+        return None
+    try:
+        return JobStore(db_path)
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao abrir banco de vagas {db_path}: {e}")
+        return None
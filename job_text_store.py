@@ -0,0 +1,130 @@
+import os
+import mmap
+import zlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sequence, Tuple, Union
+from job_codec import dumps, loads
+from job_output import job_file_stem
+logger = logging.getLogger(__name__)
+LONG_TEXT_FIELDS = ('descricao', 'requisitos', 'responsabilidades', 'beneficios')
+DEFAULT_TEXT_DIR = Path(".cache") / "text"
+BLOB_SUFFIX = ".blob"
+INDEX_SUFFIX = ".idx"
+COMPRESSION_LEVEL = 6
+def split_long_text(job: Dict[str, Any], fields: Sequence[str] = LONG_TEXT_FIELDS) -> Dict[str, Any]:
+    texts = {}
+    for field in fields:
+        if field in job:
+            value = job[field]
+            del job[field]
+            if value:
+                texts[field] = value
+    return texts
+def text_store_path(source_file: Union[str, Path], text_dir: Union[str, Path] = DEFAULT_TEXT_DIR) -> Path:
+    return Path(text_dir) / f"{job_file_stem(source_file)}{BLOB_SUFFIX}"
+class TextBlobStore:
+    def __init__(self, path: Union[str, Path], use_mmap: bool = True):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.use_mmap = use_mmap
+        self.offsets: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._writer = None
+        self._reader = None
+        self._map: Optional[mmap.mmap] = None
+        self._dirty = False
+        self._load_index()
+    @classmethod
+    def create(cls, path: Union[str, Path], use_mmap: bool = True) -> 'TextBlobStore':
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'')
+        path.with_name(path.name + INDEX_SUFFIX).unlink(missing_ok=True)
+        return cls(path, use_mmap)
+    def _load_index(self):
+        if not (self.path.exists() and self.index_path.exists()):
+            return
+        try:
+            with open(self.index_path, 'rb') as f:
+                self.offsets = {job_id: (offset, length) for job_id, (offset, length) in loads(f.read()).items()}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Índice de textos inválido em {self.index_path}: {e}")
+            self.offsets = {}
+    def put(self, job_id: str, texts: Dict[str, Any]):
+        if not texts:
+            with self._lock:
+                if self.offsets.pop(job_id, None) is not None:
+                    self._dirty = True
+            return
+        data = zlib.compress(dumps(texts), COMPRESSION_LEVEL)
+        with self._lock:
+            if self._writer is None:
+                self._writer = open(self.path, 'ab')
+            offset = self._writer.seek(0, os.SEEK_END)
+            self._writer.write(data)
+            self.offsets[job_id] = (offset, len(data))
+            self._dirty = True
+    def add_jobs(self, jobs: Iterable[Dict[str, Any]], fields: Sequence[str] = LONG_TEXT_FIELDS) -> int:
+        stored = 0
+        for job in jobs:
+            texts = split_long_text(job, fields)
+            if texts:
+                self.put(job['id'], texts)
+                stored += 1
+        return stored
+    def flush(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+            if self._dirty:
+                temp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+                with open(temp_path, 'wb') as f:
+                    f.write(dumps(self.offsets))
+                os.replace(temp_path, self.index_path)
+                self._dirty = False
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._writer is not None:
+            self._writer.flush()
+        if self.use_mmap:
+            if self._map is None or offset + length > len(self._map):
+                if self._map is not None:
+                    self._map.close()
+                with open(self.path, 'rb') as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._map[offset:offset + length]
+        if self._reader is None:
+            self._reader = open(self.path, 'rb')
+        self._reader.seek(offset)
+        return self._reader.read(length)
+    def get(self, job_id: str) -> Dict[str, Any]:
+        location = self.offsets.get(job_id)
+        if location is None:
+            return {}
+        with self._lock:
+            data = self._read(*location)
+        return loads(zlib.decompress(data))
+    def get_field(self, job_id: str, field: str, default: Any = None) -> Any:
+        return self.get(job_id).get(field, default)
+    def iter_texts(self, job_ids: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for job_id in list(self.offsets) if job_ids is None else job_ids:
+            yield job_id, self.get(job_id)
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self.offsets
+    def __len__(self) -> int:
+        return len(self.offsets)
+    def close(self):
+        self.flush()
+        with self._lock:
+            for handle in (self._writer, self._reader, self._map):
+                if handle is not None:
+                    handle.close()
+            self._writer = self._reader = self._map = None
+def merge_text(job: Dict[str, Any], store: Optional[TextBlobStore]) -> Dict[str, Any]:
+    merged = job.to_dict() if hasattr(job, 'to_dict') else dict(job)
+    if store is not None and merged.get('id') in store:
+        merged.update(store.get(merged['id']))
+    return merged
+def merge_texts(jobs: Iterable[Dict[str, Any]], store: Optional[TextBlobStore]) -> List[Dict[str, Any]]:
+    return [merge_text(job, store) for job in jobs]
@@ -1,7 +1,18 @@
 from typing import Dict, List, Any, Tuple, Optional
 from collections import defaultdict, Counter
 import logging
+from job_classifier import JobClassifier
 logger = logging.getLogger(__name__)
+SECTOR_KEYWORDS = {
+    'Tecnologia': ['desenvolvedor', 'programador', 'ti', 'software', 'tech', 'developer', 'python', 'java', 'javascript'],
+    'Saúde': ['médico', 'enfermeiro', 'saúde', 'hospital', 'clínica', 'health'],
+    'Educação': ['professor', 'educador', 'ensino', 'escola', 'universidade', 'teacher'],
+    'Comércio': ['vendedor', 'comercial', 'varejo', 'loja', 'sales'],
+    'Indústria': ['operador', 'técnico', 'industrial', 'fábrica', 'produção'],
+    'Serviços': ['atendimento', 'serviços', 'customer', 'support', 'service'],
+    'Financeiro': ['banco', 'financeiro', 'contabilidade', 'finance', 'accounting']
+}
+_sector_classifier = JobClassifier({'setor': {sector: [(keyword if len(keyword) <= 3 else keyword + '*', 1.0) for keyword in keywords] for sector, keywords in SECTOR_KEYWORDS.items()}})
 class DataProcessor:
     def __init__(self):
         self._location_cache = {}
@@ -162,23 +173,7 @@ class DataProcessor:
         return self._infer_sector_from_content(job)
     def _infer_sector_from_content(self, job: Dict) -> Optional[str]:
         try:
-            content = ""
-            if 'title' in job:
-                content += str(job['title']).lower() + " "
-            if 'description' in job:
-                content += str(job['description']).lower() + " "
-            sector_keywords = {
-                'Tecnologia': ['desenvolvedor', 'programador', 'ti', 'software', 'tech', 'developer', 'python', 'java', 'javascript'],
-                'Saúde': ['médico', 'enfermeiro', 'saúde', 'hospital', 'clínica', 'health'],
-                'Educação': ['professor', 'educador', 'ensino', 'escola', 'universidade', 'teacher'],
-                'Comércio': ['vendedor', 'comercial', 'varejo', 'loja', 'sales'],
-                'Indústria': ['operador', 'técnico', 'industrial', 'fábrica', 'produção'],
-                'Serviços': ['atendimento', 'serviços', 'customer', 'support', 'service'],
-                'Financeiro': ['banco', 'financeiro', 'contabilidade', 'finance', 'accounting']
-            }
-            for sector, keywords in sector_keywords.items():
-                if any(keyword in content for keyword in keywords):
-                    return sector
+            return _sector_classifier.classify_job(job, ('title', 'titulo', 'description', 'descricao'))['setor']
         except Exception as e:
             logger.warning(f"Error inferring sector from content: {e}")
         return None
@@ -6,7 +6,7 @@ import threading
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Optional, Tuple, Union
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 import tkinter as tk
@@ -24,7 +24,16 @@ try:
 except ImportError:
     GEOPANDAS_AVAILABLE = False
     logging.warning("GeoPandas não encontrado. Usando fallback para matplotlib básico.")
-from enhanced_filters import EnhancedJobFilter
+from enhanced_filters import EnhancedJobFilter, SORT_OPTIONS, DEFAULT_SORT
+from job_enrichment import enrich_job
+from job_identity import stable_job_id
+from job_delta import find_delta, load_delta, apply_delta
+from job_store import open_store
+from job_output import PYARROW_AVAILABLE, load_jobs_from_parquet, load_job_from_parquet, iter_parquet_rows, view_columns, iter_jobs_file
+from output_catalog import OutputCatalog, file_sha256
+from index_snapshot import snapshot_path
+from compact_jobs import JobCategories, compact_job
+from job_text_store import LONG_TEXT_FIELDS, TextBlobStore, split_long_text, text_store_path, merge_text, merge_texts
 from accurate_ms_map_data import AccurateMSMapData
 from interactive_map_widget import InteractiveMapWidget
 if sys.platform.startswith('win'):
@@ -38,6 +47,8 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+JOBS_PAGE_SIZE = 50
+DESKTOP_VIEWS = ('list', 'map', 'analytics')
 class DataManager:
     def __init__(self):
         self.jobs_data: List[Dict] = []
@@ -45,11 +56,17 @@ class DataManager:
         self.last_update: Optional[datetime] = None
         self.data_callbacks: List = []
         self.current_source_file: Optional[str] = None
-        self.enhanced_filter = EnhancedJobFilter()
+        self.text_store: Optional[TextBlobStore] = None
+        self.parquet_file: Optional[Path] = None
+        self.categories = JobCategories()
+        self.pending_snapshot: Optional[Tuple[Path, str]] = None
+        self.enhanced_filter = EnhancedJobFilter(text_loader=self.job_text)
         self.map_data = AccurateMSMapData()
     def add_callback(self, callback):
         self.data_callbacks.append(callback)
     def notify_callbacks(self):
+        if self.text_store is not None:
+            self.text_store.flush()
         for callback in self.data_callbacks:
             try:
                 import inspect
@@ -60,66 +77,221 @@ class DataManager:
                     callback()
             except Exception as e:
                 logger.error(f"Error in callback: {e}")
+    def _start_dataset(self, source_file: Union[str, Path]):
+        self.parquet_file = None
+        self.categories = JobCategories()
+        self._open_text_store(source_file)
+    def _open_text_store(self, source_file: Union[str, Path]):
+        if self.text_store is not None:
+            self.text_store.close()
+        try:
+            self.text_store = TextBlobStore.create(text_store_path(source_file))
+        except OSError as e:
+            logger.warning(f"Text store unavailable, keeping long text in memory: {e}")
+            self.text_store = None
+    def _index_jobs(self, source: Optional[Union[str, Path]] = None, digest: Optional[str] = None, indexed: bool = False):
+        self.pending_snapshot = None
+        if source is not None and digest is None:
+            try:
+                digest = file_sha256(source)
+            except OSError as e:
+                logger.warning(f"Cannot hash {source} for the search index snapshot: {e}")
+        if digest is None:
+            if not indexed:
+                self.enhanced_filter.set_jobs_data(self.jobs_data)
+            return
+        path = snapshot_path(source)
+        if not indexed and self.enhanced_filter.load_snapshot(path, digest, self.jobs_data):
+            logger.info(f"Loaded search index snapshot {path.name}")
+            if self.enhanced_filter.text_indexed:
+                return
+        elif not indexed:
+            self.enhanced_filter.set_jobs_data(self.jobs_data)
+        self.pending_snapshot = (path, digest)
+    def finish_indexing(self):
+        start = time.perf_counter()
+        if self.enhanced_filter.build_text_index():
+            logger.info(f"Built description index in {time.perf_counter() - start:.2f}s")
+        if self.pending_snapshot is not None:
+            path, digest = self.pending_snapshot
+            self.pending_snapshot = None
+            if self.enhanced_filter.save_snapshot(path, digest):
+                logger.info(f"Saved search index snapshot {path.name}")
+    def job_text(self, job: Dict) -> Dict[str, Any]:
+        if self.text_store is None or job.get('id') not in self.text_store:
+            return {}
+        return self.text_store.get(job['id'])
+    def job_with_text(self, job: Dict) -> Dict[str, Any]:
+        return merge_text(job, self.text_store)
+    def jobs_with_text(self, jobs: List[Dict]) -> List[Dict[str, Any]]:
+        return merge_texts(jobs, self.text_store)
+    def job_details(self, job: Dict) -> Dict[str, Any]:
+        details = self.job_with_text(job)
+        if self.parquet_file is None or not details.get('id'):
+            return details
+        try:
+            row = load_job_from_parquet(str(self.parquet_file), details['id'])
+        except Exception as e:
+            logger.warning(f"Cannot read full row for job {details['id']} from Parquet: {e}")
+            return details
+        if row:
+            details.update({key: value for key, value in row.items() if value is not None})
+        return details
+    def export_jobs(self) -> List[Dict[str, Any]]:
+        if self.parquet_file is not None:
+            return load_jobs_from_parquet(str(self.parquet_file))
+        return self.jobs_with_text(self.jobs_data)
     def load_data(self) -> bool:
+        self.pending_snapshot = None
+        loaded = self._load_latest()
+        if loaded:
+            self.finish_indexing()
+        return loaded
+    def _load_latest(self) -> bool:
         try:
             output_dir = Path("output")
             logger.info(f"Looking for data files in: {output_dir.absolute()}")
             if not output_dir.exists():
                 logger.warning("Output directory not found, creating it...")
                 output_dir.mkdir(exist_ok=True)
-            json_files = list(output_dir.glob("unified_ms_jobs_*.json")) + list(output_dir.glob("ms_jobs_*.json"))
-            csv_files = list(output_dir.glob("unified_ms_jobs_*.csv")) + list(output_dir.glob("ms_jobs_*.csv"))
-            logger.info(f"Found {len(json_files)} JSON files and {len(csv_files)} CSV files")
-            if json_files:
-                latest_json = max(json_files, key=lambda x: x.stat().st_mtime)
+            catalog = OutputCatalog(output_dir)
+            latest_entry = catalog.latest_run()
+            latest_json = catalog.run_file(latest_entry)
+            latest_csv = catalog.run_file(latest_entry, ('csv',))
+            logger.info(f"Catalog lists {len(catalog.data['runs'])} runs; latest: {latest_entry['run_id'] if latest_entry else 'none'}")
+            if latest_json and latest_json.exists():
                 logger.info(f"Using latest JSON file: {latest_json.name}")
+                latest_parquet = catalog.run_file(latest_entry, ('parquet',))
+                if PYARROW_AVAILABLE and latest_parquet and latest_parquet.exists():
+                    return self._load_from_parquet(latest_parquet, latest_json)
+                if self.jobs_data and self.current_source_file:
+                    delta_file = find_delta(output_dir, self.current_source_file, latest_json.name)
+                    if delta_file and self._apply_delta_file(delta_file, latest_json):
+                        return True
                 return self._load_from_json(latest_json)
-            elif csv_files:
-                latest_csv = max(csv_files, key=lambda x: x.stat().st_mtime)
+            if latest_csv and latest_csv.exists():
                 logger.info(f"Using latest CSV file: {latest_csv.name}")
                 return self._load_from_csv(latest_csv)
-            else:
-                logger.warning("No output files found, trying frontend data...")
-                return self._load_from_frontend_data()
+            store = open_store()
+            if store and store.count():
+                logger.info("No run files in the catalog, falling back to the database")
+                return self._load_from_store(store, store.latest_run())
+            logger.warning("No output files found, trying frontend data...")
+            return self._load_from_frontend_data()
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             import traceback
             logger.error(traceback.format_exc())
             self.jobs_data = []
+            self.enhanced_filter.set_jobs_data(self.jobs_data)
             self.summary_data = {}
             return False
-    def _load_from_json(self, json_file: Path) -> bool:
+    def _load_from_json(self, json_file: Path, chunk_size: int = 500) -> bool:
         try:
             logger.info(f"Loading from JSON: {json_file.name}")
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            if isinstance(data, dict) and 'jobs' in data:
-                self.jobs_data = data['jobs']
-                if 'extraction_info' in data:
-                    timestamp_str = data['extraction_info'].get('timestamp', datetime.now().strftime('%Y%m%d_%H%M%S'))
-                    try:
-                        timestamp = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                        self.last_update = timestamp
-                    except:
-                        self.last_update = datetime.now()
-                else:
-                    self.last_update = datetime.fromtimestamp(json_file.stat().st_mtime)
-            elif isinstance(data, list):
-                self.jobs_data = data
-                self.last_update = datetime.fromtimestamp(json_file.stat().st_mtime)
+            metadata: Dict[str, Any] = {}
+            self.current_source_file = str(json_file)
+            self._start_dataset(json_file)
+            loaded_jobs, published = self._stream_jobs(iter_jobs_file(json_file, metadata), json_file, chunk_size)
+            if 'extraction_info' in metadata:
+                timestamp_str = metadata['extraction_info'].get('timestamp', datetime.now().strftime('%Y%m%d_%H%M%S'))
+                try:
+                    self.last_update = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
+                except:
+                    self.last_update = datetime.now()
             else:
-                logger.warning(f"Unexpected data format in {json_file.name}")
-                self.jobs_data = []
-                self.last_update = datetime.now()
-            self.jobs_data = self._process_jobs_for_map_compatibility(self.jobs_data)
+                self.last_update = datetime.fromtimestamp(json_file.stat().st_mtime)
+            self._publish_jobs(loaded_jobs, published, json_file)
+            logger.info(f"Loaded {len(self.jobs_data)} jobs from JSON")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading JSON file: {e}")
+            return False
+    def _stream_jobs(self, jobs: Iterable[Dict], source: Path, chunk_size: int = 500) -> Tuple[List[Dict], int]:
+        loaded_jobs: List[Dict] = []
+        chunk: List[Dict] = []
+        next_publish = chunk_size
+        published = 0
+        progressive = not snapshot_path(source).exists()
+        for job in jobs:
+            chunk.append(job)
+            if len(chunk) < chunk_size:
+                continue
+            loaded_jobs.extend(self._process_jobs_for_map_compatibility(chunk, in_place=True))
+            chunk = []
+            if progressive and len(loaded_jobs) >= next_publish:
+                self._publish_jobs(list(loaded_jobs), published)
+                published = len(loaded_jobs)
+                next_publish = len(loaded_jobs) * 2
+        loaded_jobs.extend(self._process_jobs_for_map_compatibility(chunk, in_place=True))
+        return loaded_jobs, published
+    def _publish_jobs(self, jobs_data: List[Dict], published: int = 0, source: Optional[Path] = None,
+                      digest: Optional[str] = None):
+        self.jobs_data = jobs_data
+        if published:
+            self.enhanced_filter.add_jobs(jobs_data[published:])
+        if source is not None:
+            self._index_jobs(source, digest, indexed=published > 0)
+        elif not published:
             self.enhanced_filter.set_jobs_data(self.jobs_data)
+        self.summary_data = self._generate_summary()
+        logger.debug(f"Published {len(jobs_data)} jobs")
+        self.notify_callbacks()
+    def _load_from_store(self, store, latest_run: Dict[str, Any], chunk_size: int = 500) -> bool:
+        try:
+            logger.info(f"Loading from database: {store.db_path}")
+            self.current_source_file = latest_run.get('source_file') or str(store.db_path)
+            self._start_dataset(store.db_path)
+            try:
+                self.last_update = datetime.strptime(latest_run['started_at'], '%Y-%m-%d %H:%M:%S')
+            except (KeyError, TypeError, ValueError):
+                self.last_update = datetime.now()
+            loaded_jobs, published = self._stream_jobs(store.iter_jobs(), store.db_path, chunk_size)
+            self._publish_jobs(loaded_jobs, published, store.db_path, f"run:{latest_run['id']}")
+            logger.info(f"Loaded {len(self.jobs_data)} jobs from database (run {latest_run['id']})")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading database: {e}")
+            return False
+    def _apply_delta_file(self, delta_file: Path, target_file: Path) -> bool:
+        try:
+            delta = load_delta(delta_file)
+            touched_ids = {job['id'] for job in delta.get('added', [])} | {change['id'] for change in delta.get('changed', [])}
+            self.jobs_data = apply_delta(self.jobs_data, delta)
+            self.jobs_data = [
+                self._process_jobs_for_map_compatibility([job])[0] if job.get('id') in touched_ids else job
+                for job in self.jobs_data
+            ]
+            self.parquet_file = None
+            self.enhanced_filter.remove_jobs(delta.get('removed', []))
+            self.enhanced_filter.add_jobs(job for job in self.jobs_data if job.get('id') in touched_ids)
             self.summary_data = self._generate_summary()
-            self.current_source_file = str(json_file)
-            logger.info(f"Loaded {len(self.jobs_data)} jobs from JSON")
+            self.current_source_file = str(target_file)
+            self.last_update = datetime.fromtimestamp(target_file.stat().st_mtime)
+            summary = delta.get('summary', {})
+            logger.info(f"Applied delta {delta_file.name}: +{summary.get('added', 0)} -{summary.get('removed', 0)} ~{summary.get('changed', 0)}")
             self.notify_callbacks()
             return True
         except Exception as e:
-            logger.error(f"Error loading JSON file: {e}")
+            logger.error(f"Error applying delta file: {e}")
+            return False
+    def _load_from_parquet(self, parquet_file: Path, source_file: Path, chunk_size: int = 500) -> bool:
+        try:
+            logger.info(f"Loading from Parquet: {parquet_file.name}")
+            self.current_source_file = str(source_file)
+            self._start_dataset(source_file)
+            self.parquet_file = parquet_file
+            self.last_update = datetime.fromtimestamp(parquet_file.stat().st_mtime)
+            rows = iter_parquet_rows(str(parquet_file), view_columns(*DESKTOP_VIEWS), chunk_size)
+            loaded_jobs, published = self._stream_jobs(rows, parquet_file, chunk_size)
+            if self.text_store is not None:
+                for job, texts in zip(loaded_jobs, iter_parquet_rows(str(parquet_file), LONG_TEXT_FIELDS)):
+                    self.text_store.put(job['id'], split_long_text(texts))
+            self._publish_jobs(loaded_jobs, published, parquet_file)
+            logger.info(f"Loaded {len(self.jobs_data)} jobs from Parquet")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading Parquet file: {e}")
             return False
     def _load_from_csv(self, csv_file: Path) -> bool:
         try:
@@ -130,9 +302,11 @@ class DataManager:
                 logger.warning("pandas not available, trying manual CSV parsing")
                 return self._load_csv_manual(csv_file)
             df = pd.read_csv(csv_file, encoding='utf-8')
+            self._start_dataset(csv_file)
             raw_jobs_data = df.to_dict('records')
             self.jobs_data = self._process_jobs_for_map_compatibility(raw_jobs_data)
             self.last_update = datetime.fromtimestamp(csv_file.stat().st_mtime)
+            self._index_jobs(csv_file)
             self.summary_data = self._generate_summary()
             self.current_source_file = str(csv_file)
             logger.info(f"Loaded {len(self.jobs_data)} jobs from CSV")
@@ -147,8 +321,10 @@ class DataManager:
             with open(csv_file, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 raw_jobs_data = list(reader)
+            self._start_dataset(csv_file)
             self.jobs_data = self._process_jobs_for_map_compatibility(raw_jobs_data)
             self.last_update = datetime.fromtimestamp(csv_file.stat().st_mtime)
+            self._index_jobs(csv_file)
             self.summary_data = self._generate_summary()
             self.current_source_file = str(csv_file)
             logger.info(f"Loaded {len(self.jobs_data)} jobs from CSV (manual parsing)")
@@ -167,8 +343,10 @@ class DataManager:
             with open(jobs_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 raw_jobs_data = data.get('jobs', [])
+                self._start_dataset(jobs_file)
                 self.jobs_data = self._process_jobs_for_map_compatibility(raw_jobs_data)
                 self.last_update = datetime.fromisoformat(data.get('lastUpdate', datetime.now().isoformat()))
+            self._index_jobs(jobs_file)
             self.summary_data = self._generate_summary()
             self.current_source_file = str(jobs_file)
             print(f"✅ Loaded {len(self.jobs_data)} jobs from frontend data")
@@ -177,10 +355,10 @@ class DataManager:
         except Exception as e:
             print(f"❌ Error loading frontend data: {e}")
             return False
-    def _process_jobs_for_map_compatibility(self, jobs_data: List[Dict]) -> List[Dict]:
+    def _process_jobs_for_map_compatibility(self, jobs_data: List[Dict], in_place: bool = False) -> List[Dict]:
         if not jobs_data:
             return jobs_data
-        logger.info("Processing jobs for map compatibility...")
+        logger.debug("Processing jobs for map compatibility...")
         city_mappings = {
             'campo grande': 'Campo Grande',
             'dourados': 'Dourados',
@@ -208,7 +386,7 @@ class DataManager:
         processed_jobs = []
         fixed_count = 0
         for job in jobs_data:
-            processed_job = job.copy()
+            processed_job = job if in_place else job.copy()
             cidade = str(job.get('cidade', '')).strip()
             if not cidade or cidade.lower() in ['', 'n/a', 'nan', 'none', 'null']:
                 localizacao = str(job.get('localizacao_completa', '')).strip()
@@ -236,7 +414,14 @@ class DataManager:
                 else:
                     processed_job['latitude'] = city_coordinates['Campo Grande']['latitude']
                     processed_job['longitude'] = city_coordinates['Campo Grande']['longitude']
-            processed_jobs.append(processed_job)
+            processed_job['id'] = stable_job_id(processed_job)
+            if not processed_job.get('data_publicacao_iso') and not processed_job.get('salario_periodo'):
+                enrich_job(processed_job)
+            if self.text_store is not None:
+                texts = split_long_text(processed_job)
+                if texts:
+                    self.text_store.put(processed_job['id'], texts)
+            processed_jobs.append(compact_job(processed_job, self.categories))
         if fixed_count > 0:
             logger.info(f"Fixed {fixed_count} jobs with missing/invalid city data")
         return processed_jobs
@@ -260,9 +445,8 @@ class DataManager:
             'sectors': sectors,
             'lastUpdate': self.last_update.isoformat() if self.last_update else datetime.now().isoformat()
         }
-    def get_filtered_jobs(self, filters: Dict) -> List[Dict]:
-        self.enhanced_filter.set_jobs_data(self.jobs_data)
-        return self.enhanced_filter.apply_filters(filters)
+    def get_filtered_jobs(self, filters: Dict, limit: Optional[int] = None) -> List[Dict]:
+        return self.enhanced_filter.apply_filters(filters, limit)
 class MSJobsDesktop(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -378,7 +562,7 @@ class MSJobsDesktop(ctk.CTk):
         ctk.CTkLabel(filters_frame, text="🔍 Buscar:").grid(row=0, column=0, padx=10, pady=10, sticky="w")
         self.search_entry = ctk.CTkEntry(filters_frame, placeholder_text="Digite título, empresa ou cidade...")
         self.search_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-        self.search_entry.bind("<KeyRelease>", self.on_filter_change)
+        self.search_entry.bind("<KeyRelease>", self.on_search_key)
         ctk.CTkLabel(filters_frame, text="🏙️ Cidade:").grid(row=0, column=2, padx=10, pady=10, sticky="w")
         self.city_combo = ctk.CTkComboBox(filters_frame, values=["Todas"], command=self.on_filter_change)
         self.city_combo.grid(row=0, column=3, padx=10, pady=10, sticky="ew")
@@ -389,6 +573,12 @@ class MSJobsDesktop(ctk.CTk):
         self.remote_check = ctk.CTkCheckBox(filters_frame, text="💻 Apenas remoto", 
                                           variable=self.remote_var, command=self.on_filter_change)
         self.remote_check.grid(row=1, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+        self.suggestions_frame = ctk.CTkFrame(filters_frame, fg_color="transparent")
+        self.suggestions_frame.grid(row=1, column=2, columnspan=2, padx=10, pady=5, sticky="w")
+        ctk.CTkLabel(filters_frame, text="↕️ Ordenar:").grid(row=1, column=4, padx=10, pady=5, sticky="w")
+        self.sort_combo = ctk.CTkComboBox(filters_frame, values=list(SORT_OPTIONS.values()), command=self.on_filter_change)
+        self.sort_combo.set(SORT_OPTIONS[DEFAULT_SORT])
+        self.sort_combo.grid(row=1, column=5, padx=10, pady=5, sticky="ew")
         self.jobs_scrollable = ctk.CTkScrollableFrame(self.jobs_tab)
         self.jobs_scrollable.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
         self.jobs_scrollable.grid_columnconfigure(0, weight=1)
@@ -557,7 +747,6 @@ class MSJobsDesktop(ctk.CTk):
             count_label.pack(side="right", padx=10, pady=5)
     def update_filters(self):
         try:
-            self.data_manager.enhanced_filter.set_jobs_data(self.data_manager.jobs_data)
             filter_options = self.data_manager.enhanced_filter.get_filter_options()
             self.city_combo.configure(values=filter_options.get('cities', ['Todas']))
             self.sector_combo.configure(values=filter_options.get('sectors', ['Todos']))
@@ -573,7 +762,7 @@ class MSJobsDesktop(ctk.CTk):
             for widget in self.jobs_scrollable.winfo_children():
                 widget.destroy()
             filters = self.get_current_filters()
-            jobs = self.data_manager.get_filtered_jobs(filters)
+            jobs = self.data_manager.get_filtered_jobs(filters, JOBS_PAGE_SIZE)
             if not jobs:
                 no_jobs_label = ctk.CTkLabel(self.jobs_scrollable, 
                                            text="📭 Nenhuma vaga encontrada", 
@@ -583,7 +772,7 @@ class MSJobsDesktop(ctk.CTk):
         except Exception as e:
             print(f"Error updating jobs list: {e}")
             return
-        for i, job in enumerate(jobs[:50]):
+        for i, job in enumerate(jobs):
             job_frame = ctk.CTkFrame(self.jobs_scrollable)
             job_frame.grid(row=i, column=0, sticky="ew", padx=5, pady=2)
             job_frame.grid_columnconfigure(1, weight=1)
@@ -643,10 +832,30 @@ class MSJobsDesktop(ctk.CTk):
             'search': self.search_entry.get(),
             'city': self.city_combo.get(),
             'sector': self.sector_combo.get(),
-            'remote_only': self.remote_var.get()
+            'remote_only': self.remote_var.get(),
+            'sort_by': next((key for key, label in SORT_OPTIONS.items() if label == self.sort_combo.get()), DEFAULT_SORT)
         }
     def on_filter_change(self, event=None):
         self.update_jobs_list()
+    def on_search_key(self, event=None):
+        self.update_search_suggestions()
+        self.on_filter_change(event)
+    def update_search_suggestions(self):
+        for widget in self.suggestions_frame.winfo_children():
+            widget.destroy()
+        text = self.search_entry.get()
+        if not text.strip() or text.endswith(' '):
+            return
+        for suggestion in self.data_manager.enhanced_filter.suggest_searches(text.split()[-1]):
+            ctk.CTkButton(self.suggestions_frame, text=suggestion, width=60, height=24,
+                          command=lambda s=suggestion: self.apply_search_suggestion(s)).pack(side="left", padx=2)
+    def apply_search_suggestion(self, suggestion: str):
+        words = self.search_entry.get().split()
+        words[-1:] = [suggestion]
+        self.search_entry.delete(0, "end")
+        self.search_entry.insert(0, ' '.join(words) + ' ')
+        self.update_search_suggestions()
+        self.on_filter_change()
     def open_job_link(self, url: str):
         import webbrowser
         try:
@@ -662,7 +871,7 @@ class MSJobsDesktop(ctk.CTk):
             )
             if filename:
                 import pandas as pd
-                df = pd.DataFrame(self.data_manager.jobs_data)
+                df = pd.DataFrame(self.data_manager.export_jobs())
                 df.to_csv(filename, index=False, encoding='utf-8-sig')
                 messagebox.showinfo("Sucesso", f"Dados exportados para: {filename}")
         except Exception as e:
@@ -676,7 +885,7 @@ class MSJobsDesktop(ctk.CTk):
             )
             if filename:
                 import pandas as pd
-                df = pd.DataFrame(self.data_manager.jobs_data)
+                df = pd.DataFrame(self.data_manager.export_jobs())
                 df.to_excel(filename, index=False, engine='openpyxl')
                 messagebox.showinfo("Sucesso", f"Dados exportados para: {filename}")
         except Exception as e:
@@ -717,20 +926,20 @@ class MSJobsDesktop(ctk.CTk):
                 info_lines.append("")
                 info_lines.append("📂 FONTE DOS DADOS:")
                 output_dir = Path("output")
-                if output_dir.exists():
-                    json_files = list(output_dir.glob("unified_ms_jobs_*.json")) + list(output_dir.glob("ms_jobs_*.json"))
-                    csv_files = list(output_dir.glob("unified_ms_jobs_*.csv")) + list(output_dir.glob("ms_jobs_*.csv"))
-                    if json_files:
-                        latest_json = max(json_files, key=lambda x: x.stat().st_mtime)
-                        info_lines.append(f"✅ JSON: {latest_json.name}")
-                        mod_time = datetime.fromtimestamp(latest_json.stat().st_mtime)
-                        info_lines.append(f"   📅 Criado: {mod_time.strftime('%d/%m/%Y às %H:%M:%S')}")
-                    if csv_files:
-                        latest_csv = max(csv_files, key=lambda x: x.stat().st_mtime)
-                        info_lines.append(f"📊 CSV: {latest_csv.name}")
-                        mod_time = datetime.fromtimestamp(latest_csv.stat().st_mtime)
-                        info_lines.append(f"   📅 Criado: {mod_time.strftime('%d/%m/%Y às %H:%M:%S')}")
-                    if not json_files and not csv_files:
+                store = open_store()
+                latest_run = store.latest_run() if store else None
+                if latest_run:
+                    info_lines.append(f"🗄️ Banco: {store.db_path.name} ({store.count()} vagas ativas)")
+                    info_lines.append(f"   📅 Última execução: {latest_run['started_at']} (+{latest_run['added']} novas, -{latest_run['removed']} encerradas)")
+                elif output_dir.exists():
+                    catalog = OutputCatalog(output_dir)
+                    latest_entry = catalog.latest_run()
+                    if latest_entry:
+                        info_lines.append(f"📚 Execução: {latest_entry['run_id']} ({latest_entry.get('job_count', '?')} vagas)")
+                        info_lines.append(f"   📅 Criado: {latest_entry['created_at']}")
+                        for file_entry in latest_entry['files']:
+                            info_lines.append(f"   📄 {file_entry['format'].upper()}: {Path(file_entry['path']).name}")
+                    else:
                         info_lines.append("⚠️ Nenhum arquivo encontrado em output/")
                         info_lines.append("💡 Execute scraper_gui.py ou run_scraper_windows.bat primeiro")
                 else:
@@ -762,7 +971,7 @@ class MSJobsDesktop(ctk.CTk):
             print(f"Error updating status label: {e}")
     def create_ms_map(self):
         try:
-            self.interactive_map = InteractiveMapWidget(self.map_frame)
+            self.interactive_map = InteractiveMapWidget(self.map_frame, text_loader=self.data_manager.job_text)
             self.interactive_map.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
             self.map_frame.grid_columnconfigure(0, weight=1)
             self.map_frame.grid_rowconfigure(0, weight=1)
@@ -981,6 +1190,7 @@ class MSJobsDesktop(ctk.CTk):
         ax.set_title('Trabalho Remoto vs Presencial', fontsize=10, fontweight='bold')
         self.analytics_charts['remote']['canvas'].draw()
     def show_job_details(self, job):
+        job = self.data_manager.job_details(job)
         details_window = ctk.CTkToplevel(self)
         details_window.title(f"Detalhes da Vaga - {job.get('titulo', 'N/A')}")
         details_window.geometry("600x500")
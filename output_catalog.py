@@ -0,0 +1,221 @@
+import os
+import json
+import gzip
+import shutil
+import hashlib
+import argparse
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Sequence, Union
+from job_output import JOB_FILE_SUFFIXES, job_file_stem, is_ndjson, read_jobs, write_jobs, file_compression
+logger = logging.getLogger(__name__)
+CATALOG_FILE_NAME = "catalog.json"
+CATALOG_VERSION = 1
+RUN_PREFIXES = ('unified_ms_jobs_', 'ms_jobs_')
+JOB_FORMATS = ('json', 'ndjson')
+def file_format(file_path: Union[str, Path]) -> str:
+    name = Path(file_path).name
+    if name.endswith('.delta.json'):
+        return 'delta'
+    if name.endswith('.parquet'):
+        return 'parquet'
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(JOB_FILE_SUFFIXES):
+        return 'ndjson' if is_ndjson(name) else 'json'
+    return Path(name).suffix.lstrip('.')
+def file_sha256(file_path: Union[str, Path]) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+def _run_timestamp(run_id: str) -> Optional[str]:
+    try:
+        return datetime.strptime(run_id[-15:], '%Y%m%d_%H%M%S').strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return None
+def _run_key(entry: Dict[str, Any]) -> tuple:
+    return entry.get('created_at', ''), entry['run_id']
+class OutputCatalog:
+    def __init__(self, output_dir: Union[str, Path] = "output"):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / CATALOG_FILE_NAME
+        self.data = self._load()
+    def _load(self) -> Dict[str, Any]:
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CATALOG_VERSION:
+                    return data
+            except (OSError, ValueError) as e:
+                logger.warning(f"Catálogo inválido em {self.path}, reconstruindo: {e}")
+        return self.rebuild(save=self.output_dir.exists())
+    def save(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+    @staticmethod
+    def _empty() -> Dict[str, Any]:
+        return {'version': CATALOG_VERSION, 'latest': None, 'runs': {}}
+    def _file_entry(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        file_path = Path(file_path)
+        return {
+            'path': file_path.relative_to(self.output_dir).as_posix() if file_path.is_relative_to(self.output_dir) else str(file_path),
+            'format': file_format(file_path),
+            'compression': file_compression(file_path),
+            'size': file_path.stat().st_size,
+            'sha256': file_sha256(file_path)
+        }
+    def register_run(self, files: Sequence[Union[str, Path]], jobs: Optional[List[Dict[str, Any]]] = None,
+                     created_at: Optional[str] = None, save: bool = True) -> Dict[str, Any]:
+        existing = [Path(file_path) for file_path in files if file_path and Path(file_path).exists()]
+        if not existing:
+            raise ValueError("Nenhum arquivo de saída para registrar")
+        run_id = job_file_stem(existing[0])
+        entry = self.data['runs'].get(run_id, {'run_id': run_id, 'files': []})
+        known_paths = {file_entry['path'] for file_entry in entry['files']}
+        for file_path in existing:
+            file_entry = self._file_entry(file_path)
+            if file_entry['path'] in known_paths:
+                entry['files'] = [item for item in entry['files'] if item['path'] != file_entry['path']]
+            entry['files'].append(file_entry)
+        if jobs is not None:
+            entry['job_count'] = len(jobs)
+            entry['sources'] = dict(Counter(job.get('portal_origem') or 'Desconhecido' for job in jobs))
+        entry['created_at'] = created_at or entry.get('created_at') or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        job_file = self._job_file_entry(entry)
+        entry['content_hash'] = job_file['sha256'] if job_file else None
+        self.data['runs'][run_id] = entry
+        latest = self.latest_run()
+        if latest is None or _run_key(entry) >= _run_key(latest):
+            self.data['latest'] = run_id
+        if save:
+            self.save()
+        return entry
+    @staticmethod
+    def _job_file_entry(entry: Dict[str, Any], formats: Sequence[str] = JOB_FORMATS) -> Optional[Dict[str, Any]]:
+        for file_entry in entry.get('files', []):
+            if file_entry['format'] in formats:
+                return file_entry
+        return None
+    def latest_run(self) -> Optional[Dict[str, Any]]:
+        latest = self.data.get('latest')
+        return self.data['runs'].get(latest) if latest else None
+    def run_ids(self) -> List[str]:
+        return [entry['run_id'] for entry in sorted(self.data['runs'].values(), key=_run_key)]
+    def resolve(self, file_entry: Dict[str, Any]) -> Path:
+        path = Path(file_entry['path'])
+        return path if path.is_absolute() else self.output_dir / path
+    def run_file(self, entry: Optional[Dict[str, Any]], formats: Sequence[str] = JOB_FORMATS) -> Optional[Path]:
+        if not entry:
+            return None
+        file_entry = self._job_file_entry(entry, formats)
+        return self.resolve(file_entry) if file_entry else None
+    def latest_file(self, formats: Sequence[str] = JOB_FORMATS) -> Optional[Path]:
+        return self.run_file(self.latest_run(), formats)
+    def previous_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        current = self.data['runs'].get(run_id)
+        earlier = [
+            entry for entry in self.data['runs'].values()
+            if entry['run_id'] != run_id and (current is None or _run_key(entry) < _run_key(current))
+        ]
+        return max(earlier, key=_run_key) if earlier else None
+    def rebuild(self, save: bool = True) -> Dict[str, Any]:
+        self.data = self._empty()
+        if self.output_dir.exists():
+            run_files: Dict[str, List[Path]] = {}
+            delta_dir = self.output_dir / 'deltas'
+            candidates = list(self.output_dir.iterdir()) + (list(delta_dir.iterdir()) if delta_dir.exists() else [])
+            for file_path in candidates:
+                if file_path.is_file() and file_path.name.startswith(RUN_PREFIXES) and file_format(file_path) in JOB_FORMATS + ('parquet', 'csv', 'delta'):
+                    run_files.setdefault(job_file_stem(file_path), []).append(file_path)
+            for run_id, files in run_files.items():
+                files.sort(key=lambda path: (file_format(path) not in JOB_FORMATS, path.name))
+                created_at = _run_timestamp(run_id) or datetime.fromtimestamp(files[0].stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+                self.register_run(files, created_at=created_at, save=False)
+        if save:
+            self.save()
+        return self.data
+    def remove_run(self, run_id: str, delete_files: bool = True):
+        entry = self.data['runs'].pop(run_id, None)
+        if entry and delete_files:
+            for file_entry in entry['files']:
+                self.resolve(file_entry).unlink(missing_ok=True)
+        if self.data.get('latest') == run_id:
+            self.data['latest'] = max(self.data['runs'].values(), key=_run_key)['run_id'] if self.data['runs'] else None
+    def apply_retention(self, keep_runs: int = 20, max_age_days: Optional[int] = None, delete_files: bool = True) -> List[str]:
+        run_ids = self.run_ids()
+        expired = set(run_ids[:-keep_runs]) if keep_runs and len(run_ids) > keep_runs else set()
+        if max_age_days is not None:
+            cutoff = (datetime.now() - timedelta(days=max_age_days)).strftime('%Y-%m-%d %H:%M:%S')
+            expired.update(run_id for run_id in run_ids if self.data['runs'][run_id].get('created_at', '') < cutoff)
+        expired.discard(self.data.get('latest'))
+        for run_id in sorted(expired):
+            self.remove_run(run_id, delete_files)
+        if expired:
+            self.save()
+            logger.info(f"Retenção: {len(expired)} execuções antigas removidas do catálogo")
+        return sorted(expired)
+    def compact(self, keep_recent: int = 3) -> List[str]:
+        compacted = []
+        for run_id in self.run_ids()[:-keep_recent] if keep_recent else self.run_ids():
+            entry = self.data['runs'][run_id]
+            new_files = []
+            for file_entry in entry['files']:
+                file_path = self.resolve(file_entry)
+                if file_entry['format'] in JOB_FORMATS and file_entry['compression'] == 'none' and file_path.exists():
+                    target = file_path.with_name(job_file_stem(file_path) + '.ndjson.gz')
+                    if file_entry['format'] == 'ndjson':
+                        with open(file_path, 'rb') as source, gzip.open(target, 'wb') as destination:
+                            shutil.copyfileobj(source, destination)
+                    else:
+                        write_jobs(read_jobs(file_path), target, 'ndjson')
+                    file_path.unlink()
+                    new_files.append(self._file_entry(target))
+                    compacted.append(run_id)
+                elif file_entry['format'] == 'csv' and file_path.exists():
+                    file_path.unlink()
+                    compacted.append(run_id)
+                else:
+                    new_files.append(file_entry)
+            entry['files'] = new_files
+            job_file = self._job_file_entry(entry)
+            entry['content_hash'] = job_file['sha256'] if job_file else entry.get('content_hash')
+        if compacted:
+            self.save()
+            logger.info(f"Compactação: {len(set(compacted))} execuções convertidas para NDJSON gzip")
+        return sorted(set(compacted))
+def record_output_run(files: Sequence[Union[str, Path]], jobs: Optional[List[Dict[str, Any]]] = None,
+                      output_dir: Union[str, Path] = "output") -> Optional[Dict[str, Any]]:
+    try:
+        return OutputCatalog(output_dir).register_run(files, jobs)
+    except Exception as e:
+        logger.error(f"Erro ao atualizar catálogo de saída: {e}")
+        return None
+def main():
+    parser = argparse.ArgumentParser(description='Gerencia o catálogo de execuções em output/.')
+    parser.add_argument('--output-dir', default='output', help='Diretório de saída (padrão: output).')
+    parser.add_argument('--rebuild', action='store_true', help='Reconstrói o catálogo a partir dos arquivos existentes.')
+    parser.add_argument('--keep', type=int, help='Mantém apenas as N execuções mais recentes.')
+    parser.add_argument('--max-age-days', type=int, help='Remove execuções mais antigas que N dias.')
+    parser.add_argument('--compact', type=int, metavar='N', help='Converte para NDJSON gzip todas as execuções exceto as N mais recentes.')
+    args = parser.parse_args()
+    catalog = OutputCatalog(args.output_dir)
+    if args.rebuild:
+        catalog.rebuild()
+    if args.keep is not None or args.max_age_days is not None:
+        removed = catalog.apply_retention(keep_runs=args.keep or 0, max_age_days=args.max_age_days)
+        print(f"🗑️ {len(removed)} execuções removidas")
+    if args.compact is not None:
+        compacted = catalog.compact(keep_recent=args.compact)
+        print(f"🗜️ {len(compacted)} execuções compactadas")
+    latest = catalog.latest_run()
+    print(f"📚 {len(catalog.data['runs'])} execuções no catálogo; mais recente: {latest['run_id'] if latest else 'nenhuma'}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 512
+def cache_weight(value: Any) -> int:
+    if isinstance(value, array):
+        return sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(key) + sys.getsizeof(item) for key, item in value.items())
+    return sys.getsizeof(value)
+class ResultCache:
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 weigh: Callable[[Any], int] = cache_weight):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.weigh = weigh
+        self.entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self.weights: Dict[Hashable, int] = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+    def put(self, key: Hashable, value: Any):
+        weight = self.weigh(value)
+        with self._lock:
+            if key in self.entries:
+                self.total_bytes -= self.weights.pop(key)
+                del self.entries[key]
+            if weight > self.max_bytes:
+                return
+            self.entries[key] = value
+            self.weights[key] = weight
+            self.total_bytes += weight
+            while self.total_bytes > self.max_bytes or len(self.entries) > self.max_entries:
+                old_key, _ = self.entries.popitem(last=False)
+                self.total_bytes -= self.weights.pop(old_key)
+                self.evictions += 1
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+    def retain_version(self, version: Hashable):
+        with self._lock:
+            for key in [key for key in self.entries if isinstance(key, tuple) and key and key[0] != version]:
+                del self.entries[key]
+                self.total_bytes -= self.weights.pop(key)
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.weights.clear()
+            self.total_bytes = 0
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+    def __len__(self) -> int:
+        return len(self.entries)
+_MISSING = object()
@@ -9,6 +9,8 @@ from flask import Flask, render_template_string, request, jsonify, send_file, re
 from werkzeug.serving import make_server
 import webbrowser
 import subprocess
+from html import escape
+from urllib.parse import quote
 from unified_ms_job_scraper import (
     InfoJobsIndependentScraper,
     SimpleGupyScraper,
@@ -16,6 +18,12 @@ from unified_ms_job_scraper import (
     save_jobs_to_json,
     logger
 )
+from job_dedupe import DEFAULT_THRESHOLD, deduplicate_jobs
+from job_store import save_jobs_to_store, open_store
+from job_output import AVAILABLE_COMPRESSIONS, ZSTD_AVAILABLE, save_jobs_to_parquet, parquet_path_for, output_file_name, load_job_data, read_jobs
+from job_delta import write_delta, latest_delta, load_delta
+from output_catalog import OutputCatalog, record_output_run
+from enhanced_filters import EnhancedJobFilter
 app = Flask(__name__)
 scraper_status = {
     'is_running': False,
@@ -28,6 +36,7 @@ scraper_status = {
     'last_update': '',
     'output_file': ''
 }
+suggestion_index = {'key': None, 'filter': None}
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="pt-BR">
@@ -300,8 +309,29 @@ HTML_TEMPLATE = """
                     <select id="output_format" class="form-control">
                         <option value="json">📋 JSON (Padrão)</option>
                         <option value="both">📊 JSON + CSV</option>
+                        <option value="parquet">🗜️ JSON + Parquet</option>
                     </select>
                 </div>
+                <div class="form-group">
+                    <label for="output_mode">🧾 Estilo do Arquivo</label>
+                    <select id="output_mode" class="form-control">
+                        <option value="pretty">JSON indentado (Padrão)</option>
+                        <option value="compact">JSON compacto</option>
+                        <option value="ndjson">NDJSON (uma vaga por linha)</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label for="compression">📦 Compressão</label>
+                    <select id="compression" class="form-control">
+                        <option value="none">Nenhuma (Padrão)</option>
+                        <option value="gzip">gzip</option>
+                        {% if zstd_available %}<option value="zstd">zstd</option>{% endif %}
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label for="dedupe_threshold">🧬 Similaridade para Duplicatas (0-1)</label>
+                    <input type="number" id="dedupe_threshold" class="form-control" value="{{ dedupe_threshold }}" min="0.1" max="1" step="0.05">
+                </div>
             </div>
             <!-- Control Buttons -->
             <div style="text-align: center; margin: 30px 0;">
@@ -392,7 +422,10 @@ HTML_TEMPLATE = """
                 infojobs_pages: parseInt(document.getElementById('infojobs_pages').value),
                 enable_infojobs: document.getElementById('enable_infojobs').checked,
                 enable_gupy: document.getElementById('enable_gupy').checked,
-                output_format: document.getElementById('output_format').value
+                output_format: document.getElementById('output_format').value,
+                output_mode: document.getElementById('output_mode').value,
+                compression: document.getElementById('compression').value,
+                dedupe_threshold: parseFloat(document.getElementById('dedupe_threshold').value)
             };
             fetch('/start_scraper', {
                 method: 'POST',
@@ -531,7 +564,7 @@ HTML_TEMPLATE = """
 """
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    return render_template_string(HTML_TEMPLATE, dedupe_threshold=DEFAULT_THRESHOLD, zstd_available=ZSTD_AVAILABLE)
 @app.route('/start_scraper', methods=['POST'])
 def start_scraper():
     global scraper_status
@@ -539,6 +572,8 @@ def start_scraper():
         return jsonify({'success': False, 'message': 'Scraper já está em execução'})
     try:
         config = request.get_json()
+        if config.get('compression', 'none') not in AVAILABLE_COMPRESSIONS:
+            return jsonify({'success': False, 'message': f"Compressão indisponível: {config.get('compression')}"})
         scraper_status.update({
             'is_running': True,
             'progress': 0,
@@ -583,53 +618,135 @@ def open_desktop():
 def download_file(file_type):
     try:
         output_dir = Path('output')
-        if file_type == 'json':
-            files = list(output_dir.glob('unified_ms_jobs_*.json'))
-        elif file_type == 'csv':
-            files = list(output_dir.glob('unified_ms_jobs_*.csv'))
-        else:
+        store = open_store()
+        if store and store.count() and file_type in ('json', 'csv'):
+            export_dir = output_dir / 'exports'
+            export_dir.mkdir(parents=True, exist_ok=True)
+            export_file = export_dir / f"ms_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{file_type}"
+            if file_type == 'json':
+                store.export_json(export_file)
+            else:
+                store.export_csv(export_file)
+            return send_file(export_file.resolve(), as_attachment=True)
+        formats = {'json': ('json', 'ndjson'), 'csv': ('csv',), 'parquet': ('parquet',)}
+        if file_type not in formats:
             return "Tipo de arquivo inválido", 400
-        if not files:
+        latest_file = OutputCatalog(output_dir).latest_file(formats[file_type])
+        if latest_file is None or not latest_file.exists():
             return "Arquivo não encontrado", 404
-        latest_file = max(files, key=lambda x: x.stat().st_mtime)
-        return send_file(latest_file, as_attachment=True)
+        return send_file(latest_file.resolve(), as_attachment=True)
     except Exception as e:
         return f"Erro ao baixar arquivo: {e}", 500
+@app.route('/delta/latest')
+def latest_delta_data():
+    try:
+        delta_file = latest_delta(Path('output'))
+        if delta_file is None:
+            return jsonify({'success': False, 'message': 'Nenhum delta encontrado'}), 404
+        return jsonify(load_delta(delta_file))
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+def get_suggestion_filter():
+    store = open_store()
+    if store and store.count():
+        latest_run = store.latest_run() or {}
+        key = ('store', str(store.db_path), latest_run.get('id'))
+        load_jobs = store.load_all
+    else:
+        latest_file = OutputCatalog(Path('output')).latest_file()
+        if latest_file is None or not latest_file.exists():
+            return None
+        key = ('file', str(latest_file), latest_file.stat().st_mtime)
+        load_jobs = lambda: read_jobs(latest_file)
+    if suggestion_index['key'] != key:
+        job_filter = EnhancedJobFilter()
+        job_filter.set_jobs_data(load_jobs())
+        suggestion_index.update(key=key, filter=job_filter)
+    return suggestion_index['filter']
+@app.route('/suggest')
+def suggest():
+    try:
+        query = request.args.get('q', '').strip()
+        limit = min(max(request.args.get('limit', 5, type=int), 1), 20)
+        job_filter = get_suggestion_filter()
+        if job_filter is None:
+            return jsonify({'query': query, 'suggestions': []})
+        return jsonify({'query': query, 'suggestions': job_filter.suggest_searches(query, limit)})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
 @app.route('/view_data')
 def view_data():
     try:
-        output_dir = Path('output')
-        json_files = list(output_dir.glob('unified_ms_jobs_*.json'))
-        if not json_files:
-            return "Nenhum arquivo de dados encontrado", 404
-        latest_file = max(json_files, key=lambda x: x.stat().st_mtime)
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        page_size = 50
+        page = max(request.args.get('page', 1, type=int), 1)
+        search = request.args.get('q', '').strip()
+        store = open_store()
+        if store and store.count(active_only=False):
+            jobs, total = store.query(search=search or None, limit=page_size, offset=(page - 1) * page_size)
+            latest_run = store.latest_run() or {}
+            source_name = Path(latest_run.get('source_file') or store.db_path).name
+            extraction_date = latest_run.get('started_at', 'N/A')
+        else:
+            output_dir = Path('output')
+            latest_file = OutputCatalog(output_dir).latest_file()
+            if latest_file is None or not latest_file.exists():
+                return "Nenhum arquivo de dados encontrado", 404
+            data = load_job_data(latest_file)
+            all_jobs = data.get('jobs', []) if isinstance(data, dict) else data
+            total = len(all_jobs)
+            jobs = all_jobs[(page - 1) * page_size:page * page_size]
+            source_name = latest_file.name
+            extraction_date = data.get('extraction_info', {}).get('extraction_date', 'N/A') if isinstance(data, dict) else 'N/A'
+        total_pages = max((total + page_size - 1) // page_size, 1)
         html = f"""
         <!DOCTYPE html>
         <html>
         <head>
             <title>Dados Extraídos - MS Jobs</title>
             <style>
-                body {  font-family: Arial, sans-serif; margin: 20px; } 
-                .job {  border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; } 
-                .job-title {  font-weight: bold; color: #333; margin-bottom: 5px; } 
-                .job-company {  color: #666; margin-bottom: 5px; } 
-                .job-location {  color: #999; font-size: 0.9em; } 
-                .summary {  background: #f5f5f5; padding: 20px; border-radius: 5px; margin-bottom: 20px; } 
+                body {{  font-family: Arial, sans-serif; margin: 20px; }} 
+                .job {{  border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; }} 
+                .job-title {{  font-weight: bold; color: #333; margin-bottom: 5px; }} 
+                .job-company {{  color: #666; margin-bottom: 5px; }} 
+                .job-location {{  color: #999; font-size: 0.9em; }} 
+                .summary {{  background: #f5f5f5; padding: 20px; border-radius: 5px; margin-bottom: 20px; }} 
+                .pagination a {{  margin: 0 10px; }} 
             </style>
         </head>
         <body>
             <h1>📊 Dados Extraídos - MS Jobs</h1>
             <div class="summary">
                 <h3>Resumo da Extração</h3>
-                <p><strong>Total de vagas:</strong> {len(data.get('jobs', []))}</p>
-                <p><strong>Arquivo:</strong> {latest_file.name}</p>
-                <p><strong>Data de extração:</strong> {data.get('extraction_info', {}).get('extraction_date', 'N/A')}</p>
+                <p><strong>Total de vagas:</strong> {total}</p>
+                <p><strong>Arquivo:</strong> {source_name}</p>
+                <p><strong>Data de extração:</strong> {extraction_date}</p>
             </div>
-            <h3>📋 Vagas Encontradas</h3>
+            <form method="get" action="/view_data">
+                <input type="text" name="q" value="{escape(search)}" list="search-suggestions" autocomplete="off" placeholder="Buscar por título, empresa ou descrição">
+                <datalist id="search-suggestions"></datalist>
+                <button type="submit">Buscar</button>
+            </form>
+            <script>
+                document.querySelector('input[name="q"]').addEventListener('input', function(event) {{
+                    const value = event.target.value;
+                    const term = value.split(/\s+/).pop();
+                    if (term.length < 2) return;
+                    fetch('/suggest?q=' + encodeURIComponent(term))
+                        .then(response => response.json())
+                        .then(data => {{
+                            const list = document.getElementById('search-suggestions');
+                            list.innerHTML = '';
+                            (data.suggestions || []).forEach(suggestion => {{
+                                const option = document.createElement('option');
+                                option.value = value.slice(0, value.length - term.length) + suggestion;
+                                list.appendChild(option);
+                            }});
+                        }});
+                }});
+            </script>
+            <h3>📋 Vagas Encontradas (página {page} de {total_pages})</h3>
         """
-        for job in data.get('jobs', [])[:50]:  
+        for job in jobs:
             html += f"""
             <div class="job">
                 <div class="job-title">💼 {job.get('titulo', 'N/A')}</div>
@@ -638,9 +755,12 @@ def view_data():
                 <div class="job-location">🔗 <a href="{job.get('link', '#')}" target="_blank">Ver vaga original</a></div>
             </div>
             """
-        if len(data.get('jobs', [])) > 50:
-            html += f"<p><em>... e mais {len(data.get('jobs', [])) - 50} vagas</em></p>"
-        html += "</body></html>"
+        html += '<div class="pagination">'
+        if page > 1:
+            html += f'<a href="/view_data?page={page - 1}&q={quote(search)}">← Anterior</a>'
+        if page < total_pages:
+            html += f'<a href="/view_data?page={page + 1}&q={quote(search)}">Próxima →</a>'
+        html += "</div></body></html>"
         return html
     except Exception as e:
         return f"Erro ao visualizar dados: {e}", 500
@@ -699,18 +819,15 @@ def run_scraper_with_config(config):
             scraper_status['current_step'] = 'Salvando resultados...'
             scraper_status['progress'] = 95
             scraper_status['last_update'] = datetime.now().strftime('%H:%M:%S')
-            seen = set()
-            unique_jobs = []
-            for job in all_jobs:
-                job_key = (job.get('titulo'), job.get('empresa'), job.get('cidade'))
-                if job_key not in seen:
-                    seen.add(job_key)
-                    unique_jobs.append(job)
+            unique_jobs = deduplicate_jobs(all_jobs, threshold=float(config.get('dedupe_threshold') or DEFAULT_THRESHOLD))
             output_dir = Path("output")
             output_dir.mkdir(exist_ok=True)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            json_file = f"output/unified_ms_jobs_{timestamp}.json"
-            save_jobs_to_json(unique_jobs, json_file)
+            output_mode = config.get('output_mode', 'pretty')
+            json_file = "output/" + output_file_name(f"unified_ms_jobs_{timestamp}", output_mode, config.get('compression', 'none'))
+            save_jobs_to_json(unique_jobs, json_file, output_mode)
+            run_files = [json_file, write_delta(unique_jobs, json_file)]
+            save_jobs_to_store(unique_jobs, json_file)
             scraper_status['output_file'] = json_file
             if config.get('output_format') == 'both':
                 try:
@@ -718,8 +835,15 @@ def run_scraper_with_config(config):
                     csv_file = f"output/unified_ms_jobs_{timestamp}.csv"
                     df = pd.DataFrame(unique_jobs)
                     df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+                    run_files.append(csv_file)
                 except ImportError:
                     scraper_status['errors'].append("Pandas não disponível para exportar CSV")
+            elif config.get('output_format') == 'parquet':
+                if save_jobs_to_parquet(unique_jobs, str(parquet_path_for(json_file))):
+                    run_files.append(parquet_path_for(json_file))
+                else:
+                    scraper_status['errors'].append("Não foi possível exportar Parquet (pyarrow instalado?)")
+            record_output_run(run_files, unique_jobs, output_dir)
             scraper_status['total_jobs'] = len(unique_jobs)
             scraper_status['progress'] = 100
             scraper_status['current_step'] = f'✅ Concluído! {len(unique_jobs)} vagas extraídas'
@@ -0,0 +1,57 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Iterable, FrozenSet, Tuple
+from text_normalization import fold_text
+WORD_RE = re.compile(r'\w+')
+PORTUGUESE_STOPWORDS: FrozenSet[str] = frozenset(fold_text(' '.join([
+    'a', 'o', 'as', 'os', 'um', 'uma', 'uns', 'umas', 'de', 'do', 'da', 'dos', 'das', 'em', 'no', 'na', 'nos',
+    'nas', 'num', 'numa', 'por', 'pelo', 'pela', 'pelos', 'pelas', 'para', 'pra', 'com', 'sem', 'e', 'ou', 'que',
+    'se', 'ao', 'aos', 'à', 'às', 'como', 'mais', 'mas', 'seu', 'sua', 'seus', 'suas', 'ser', 'são', 'é', 'ter',
+    'tem', 'este', 'esta', 'isto', 'esse', 'essa', 'isso', 'entre', 'sobre', 'até', 'também', 'já', 'não'
+])).split())
+PLURAL_SUFFIXES: Tuple[Tuple[str, str], ...] = (
+    ('oes', 'ao'), ('aes', 'ao'), ('ais', 'al'), ('eis', 'el'), ('ois', 'ol'), ('res', 'r'), ('zes', 'z'), ('ns', 'm')
+)
+GENDER_VOWELS = 'aoe'
+def light_stem(word: str) -> str:
+    if len(word) <= 3:
+        return word
+    for suffix, replacement in PLURAL_SUFFIXES:
+        if word.endswith(suffix) and len(word) > len(suffix) + 2:
+            word = word[:-len(suffix)] + replacement
+            break
+    else:
+        if word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+    if len(word) > 4 and word[-1] in GENDER_VOWELS:
+        word = word[:-1]
+    return word
+class Analyzer:
+    def __init__(self, fold: bool = True, stopwords: Iterable[str] = PORTUGUESE_STOPWORDS, stem: bool = True,
+                 min_length: int = 2, cache_size: int = 1 << 16):
+        self.fold = fold
+        self.stopwords = frozenset(stopwords)
+        self.stem = stem
+        self.min_length = min_length
+        self.analyze_word = lru_cache(maxsize=cache_size)(self._analyze_word)
+    def _analyze_word(self, word: str) -> Optional[str]:
+        word = fold_text(word) if self.fold else word.lower()
+        if len(word) < self.min_length or word in self.stopwords:
+            return None
+        return light_stem(word) if self.stem else word
+    def signature(self) -> List:
+        return [self.fold, self.stem, self.min_length, sorted(self.stopwords)]
+    def analyze(self, text: str) -> List[str]:
+        if not text:
+            return []
+        analyze_word = self.analyze_word
+        return [term for term in map(analyze_word, WORD_RE.findall(str(text))) if term]
+    def analyze_pairs(self, text: str) -> Iterable[Tuple[str, str]]:
+        if not text:
+            return
+        analyze_word = self.analyze_word
+        for word in WORD_RE.findall(str(text)):
+            term = analyze_word(word)
+            if term:
+                yield term, word
+DEFAULT_ANALYZER = Analyzer()
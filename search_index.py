@@ -0,0 +1,486 @@
+import sys
+import math
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from typing import Dict, List, Set, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple, Union
+from text_normalization import fold_text
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+POSTING_TYPECODE = 'I'
+GALLOP_RATIO = 8
+NGRAM_SIZES = (2, 3)
+PREFIX_CACHE_LENGTH = 2
+PREFIX_CACHE_SIZE = 20
+Postings = Union[array, bytes]
+NUMPY_MIN_SIZE = 256
+FREQUENCY_TYPECODE = 'H'
+MAX_FREQUENCY = 0xFFFF
+BM25_K1 = 1.2
+BM25_B = 0.75
+MISSING_RANK = float('-inf')
+def new_postings(values: Iterable[int] = ()) -> array:
+    return array(POSTING_TYPECODE, values)
+def _as_numpy(postings: Sequence[int]) -> 'np.ndarray':
+    if isinstance(postings, array):
+        return np.frombuffer(postings, dtype=np.uint32) if postings else np.empty(0, dtype=np.uint32)
+    return np.asarray(postings, dtype=np.uint32)
+def _from_numpy(values: 'np.ndarray') -> array:
+    postings = new_postings()
+    postings.frombytes(values.astype(np.uint32, copy=False).tobytes())
+    return postings
+def writable(values: Any, typecode: str = POSTING_TYPECODE) -> array:
+    if isinstance(values, array):
+        return values
+    if isinstance(values, bytes):
+        return decode_deltas(values)
+    copied = array(typecode)
+    copied.frombytes(memoryview(values).cast('B'))
+    return copied
+def encode_deltas(postings: Sequence[int]) -> bytes:
+    encoded = bytearray()
+    previous = 0
+    for value in postings:
+        gap = value - previous
+        previous = value
+        while gap >= 0x80:
+            encoded.append((gap & 0x7F) | 0x80)
+            gap >>= 7
+        encoded.append(gap)
+    return bytes(encoded)
+def decode_deltas(data: bytes) -> array:
+    postings = new_postings()
+    value = 0
+    gap = 0
+    shift = 0
+    for byte in data:
+        gap |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        value += gap
+        postings.append(value)
+        gap = 0
+        shift = 0
+    return postings
+def _gallop(postings: Sequence[int], target: int, low: int) -> int:
+    step = 1
+    high = low + 1
+    size = len(postings)
+    while high < size and postings[high] < target:
+        low = high
+        step <<= 1
+        high = low + step
+    return bisect_left(postings, target, low, min(high + 1, size))
+def intersect_postings(left: Sequence[int], right: Sequence[int]) -> array:
+    if len(left) > len(right):
+        left, right = right, left
+    result = new_postings()
+    if not left:
+        return result
+    if len(right) >= GALLOP_RATIO * len(left):
+        position = 0
+        size = len(right)
+        for value in left:
+            position = _gallop(right, value, position)
+            if position >= size:
+                break
+            if right[position] == value:
+                result.append(value)
+        return result
+    if NUMPY_AVAILABLE and len(left) >= NUMPY_MIN_SIZE:
+        return _from_numpy(np.intersect1d(_as_numpy(left), _as_numpy(right), assume_unique=True))
+    return new_postings(sorted(set(left).intersection(right)))
+def intersect_many(posting_lists: Iterable[Sequence[int]]) -> array:
+    ordered = sorted(posting_lists, key=len)
+    if not ordered:
+        return new_postings()
+    result = new_postings(ordered[0])
+    for postings in ordered[1:]:
+        if not result:
+            break
+        result = intersect_postings(result, postings)
+    return result
+def union_postings(posting_lists: Iterable[Sequence[int]]) -> array:
+    posting_lists = [postings for postings in posting_lists if postings]
+    if not posting_lists:
+        return new_postings()
+    if len(posting_lists) == 1:
+        return posting_lists[0]
+    if NUMPY_AVAILABLE and sum(len(postings) for postings in posting_lists) >= NUMPY_MIN_SIZE:
+        mask = np.zeros(max(postings[-1] for postings in posting_lists) + 1, dtype=bool)
+        for postings in posting_lists:
+            mask[_as_numpy(postings)] = True
+        return _from_numpy(np.flatnonzero(mask))
+    return new_postings(sorted(set(chain.from_iterable(posting_lists))))
+def postings_to_bitmap(postings: Sequence[int], size: Optional[int] = None) -> int:
+    if not postings:
+        return 0
+    if size is None:
+        size = postings[-1] + 1
+    if NUMPY_AVAILABLE and len(postings) >= NUMPY_MIN_SIZE:
+        bits = np.zeros(size, dtype=bool)
+        bits[_as_numpy(postings)] = True
+        return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+    marks = bytearray(((size - 1) >> 3) + 1)
+    for position in postings:
+        marks[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(marks, 'little')
+def bitmap_to_postings(bitmap: int) -> array:
+    if bitmap <= 0:
+        return new_postings()
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) >> 3, 'little')
+    if NUMPY_AVAILABLE:
+        return _from_numpy(np.flatnonzero(np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder='little')))
+    postings = new_postings()
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index << 3
+            for bit in range(8):
+                if byte >> bit & 1:
+                    postings.append(base + bit)
+    return postings
+_HAS_BIT_COUNT = hasattr(int, 'bit_count')
+def bit_count(bitmap: int) -> int:
+    return bitmap.bit_count() if _HAS_BIT_COUNT else bin(bitmap).count('1')
+def facet_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return value
+    return str(value).strip()
+class FacetIndex:
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self.bitmaps: Dict[str, Dict[Any, int]] = {field: {} for field in self.fields}
+        self.size = 0
+        self.all_mask = 0
+    def build(self, jobs: Sequence[Dict[str, Any]]):
+        positions: Dict[str, Dict[Any, List[int]]] = {field: {} for field in self.fields}
+        for i, job in enumerate(jobs):
+            for field in self.fields:
+                positions[field].setdefault(facet_value(job.get(field)), []).append(i)
+        self.bitmaps = {
+            field: {value: postings_to_bitmap(value_positions) for value, value_positions in field_positions.items()}
+            for field, field_positions in positions.items()
+        }
+        self.size = len(jobs)
+        self.all_mask = (1 << self.size) - 1
+    def add(self, job: Dict[str, Any], doc_id: int):
+        bit = 1 << doc_id
+        for field in self.fields:
+            bitmaps = self.bitmaps[field]
+            value = facet_value(job.get(field))
+            bitmaps[value] = bitmaps.get(value, 0) | bit
+        if doc_id >= self.size:
+            self.size = doc_id + 1
+            self.all_mask = (1 << self.size) - 1
+    def remove(self, job: Dict[str, Any], doc_id: int):
+        bit = 1 << doc_id
+        for field in self.fields:
+            bitmaps = self.bitmaps[field]
+            value = facet_value(job.get(field))
+            bitmap = bitmaps.get(value, 0) & ~bit
+            if bitmap:
+                bitmaps[value] = bitmap
+            else:
+                bitmaps.pop(value, None)
+    def mask(self, field: str, value: Any) -> int:
+        return self.bitmaps[field].get(facet_value(value), 0)
+    def values(self, field: str) -> List[Any]:
+        return list(self.bitmaps[field])
+    def counts(self, field: str, mask: Optional[int] = None) -> Dict[Any, int]:
+        if mask is None:
+            return {value: bit_count(bitmap) for value, bitmap in self.bitmaps[field].items()}
+        counts = {}
+        for value, bitmap in self.bitmaps[field].items():
+            count = bit_count(bitmap & mask)
+            if count:
+                counts[value] = count
+        return counts
+class RangeIndex:
+    def __init__(self):
+        self.values = array('d')
+        self.positions = new_postings()
+        self.column = array('d')
+        self.size = 0
+        self.missing = 0
+    def build(self, values: Iterable[Optional[float]]):
+        present = []
+        missing = []
+        column = array('d')
+        for i, value in enumerate(values):
+            if value is None or value != value:
+                missing.append(i)
+                column.append(MISSING_RANK)
+            else:
+                present.append((value, i))
+                column.append(value)
+        present.sort()
+        self.values = array('d', [value for value, _ in present])
+        self.positions = new_postings(i for _, i in present)
+        self.column = column
+        self.size = len(column)
+        self.missing = postings_to_bitmap(missing)
+    def add(self, doc_id: int, value: Optional[float]):
+        if doc_id != len(self.column):
+            raise ValueError(f"Posição fora de ordem no índice de intervalo: {doc_id}")
+        if value is None or value != value:
+            self.missing |= 1 << doc_id
+            self.column.append(MISSING_RANK)
+        else:
+            index = bisect_right(self.values, value)
+            self.values.insert(index, value)
+            self.positions.insert(index, doc_id)
+            self.column.append(value)
+        self.size = len(self.column)
+    def select(self, low: Optional[float] = None, high: Optional[float] = None) -> array:
+        start = 0 if low is None else bisect_left(self.values, low)
+        stop = len(self.values) if high is None else bisect_right(self.values, high)
+        return self.positions[start:stop]
+    def mask(self, low: Optional[float] = None, high: Optional[float] = None, include_missing: bool = False) -> int:
+        if low is None and high is None:
+            selected = (1 << self.size) - 1 & ~self.missing
+        else:
+            selected = postings_to_bitmap(self.select(low, high), self.size)
+        return selected | self.missing if include_missing else selected
+    def __len__(self) -> int:
+        return len(self.values)
+def top_k(positions: Iterable[int], key: Callable[[int], Any], limit: Optional[int] = None) -> List[int]:
+    if limit is None:
+        return sorted(positions, key=key, reverse=True)
+    return heapq.nlargest(limit, positions, key=key)
+def ngrams(token: str, size: int) -> List[str]:
+    return list(dict.fromkeys(token[i:i + size] for i in range(len(token) - size + 1)))
+class NgramIndex:
+    def __init__(self):
+        self.tokens: List[str] = []
+        self.token_ids: Dict[str, int] = {}
+        self.grams: Dict[str, array] = {}
+    def add(self, token: str):
+        if token in self.token_ids:
+            return
+        token_id = len(self.tokens)
+        self.tokens.append(token)
+        self.token_ids[token] = token_id
+        for size in NGRAM_SIZES:
+            for gram in ngrams(token, size):
+                postings = self.grams.get(gram)
+                if postings is None:
+                    self.grams[gram] = new_postings((token_id,))
+                else:
+                    if not isinstance(postings, array):
+                        postings = self.grams[gram] = writable(postings)
+                    postings.append(token_id)
+    def containing(self, fragment: str) -> List[str]:
+        size = min(len(fragment), NGRAM_SIZES[-1])
+        if size < NGRAM_SIZES[0]:
+            return [token for token in self.tokens if fragment in token]
+        gram_postings = []
+        for gram in ngrams(fragment, size):
+            postings = self.grams.get(gram)
+            if postings is None:
+                return []
+            gram_postings.append(postings)
+        tokens = self.tokens
+        return [tokens[token_id] for token_id in intersect_many(gram_postings) if fragment in tokens[token_id]]
+    def contained_in(self, word: str) -> List[str]:
+        token_ids = self.token_ids
+        size = len(word)
+        return [
+            fragment for fragment in dict.fromkeys(
+                word[start:end] for start in range(size) for end in range(start + NGRAM_SIZES[0], size + 1)
+            )
+            if fragment in token_ids
+        ]
+    def __len__(self) -> int:
+        return len(self.tokens)
+class PrefixIndex:
+    def __init__(self, token_frequencies: Iterable[Tuple[str, float]]):
+        merged: Dict[str, List] = {}
+        for token, frequency in token_frequencies:
+            key = fold_text(token)
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = [frequency, token, frequency]
+            else:
+                entry[0] += frequency
+                if frequency > entry[2]:
+                    entry[1] = token
+                    entry[2] = frequency
+        self.keys = sorted(merged)
+        self.tokens = [merged[key][1] for key in self.keys]
+        self.frequencies = array('d', (merged[key][0] for key in self.keys))
+        self._top_cache: Dict[str, List[int]] = {}
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        low = bisect_left(self.keys, prefix)
+        return low, bisect_left(self.keys, prefix + '\uffff', low)
+    def _top_positions(self, prefix: str, limit: int) -> List[int]:
+        if len(prefix) <= PREFIX_CACHE_LENGTH and limit <= PREFIX_CACHE_SIZE:
+            cached = self._top_cache.get(prefix)
+            if cached is None:
+                cached = heapq.nlargest(PREFIX_CACHE_SIZE, range(*self._range(prefix)), key=self.frequencies.__getitem__)
+                self._top_cache[prefix] = cached
+            return cached[:limit]
+        return heapq.nlargest(limit, range(*self._range(prefix)), key=self.frequencies.__getitem__)
+    def complete(self, prefix: str, limit: int = 5) -> List[Tuple[str, float]]:
+        key = fold_text(prefix).strip()
+        if not key or limit <= 0:
+            return []
+        return [(self.tokens[position], self.frequencies[position]) for position in self._top_positions(key, limit)]
+    def __len__(self) -> int:
+        return len(self.keys)
+class InvertedIndex:
+    def __init__(self, fields: Sequence[str], compress: bool = False, weights: Optional[Dict[str, float]] = None):
+        self.compress = compress
+        self.fields: Dict[str, Dict[str, Postings]] = {field: {} for field in fields}
+        self.weights = {field: (weights or {}).get(field, 1.0) for field in fields}
+        self.ngrams = NgramIndex()
+        self.surfaces: Dict[str, str] = {}
+        self.frequencies: Dict[str, Dict[str, array]] = {field: {} for field in fields}
+        self.lengths: Dict[str, array] = {field: new_postings() for field in fields}
+        self.token_counts: Dict[str, int] = {field: 0 for field in fields}
+        self.pending: Dict[str, Set[str]] = {field: set() for field in fields}
+        self._prefix_index: Optional[PrefixIndex] = None
+    def add(self, field: str, token: str, doc_id: int) -> bool:
+        lengths = self.lengths[field]
+        if len(lengths) <= doc_id:
+            lengths.frombytes(bytes(lengths.itemsize * (doc_id + 1 - len(lengths))))
+        lengths[doc_id] += 1
+        self.token_counts[field] += 1
+        field_index = self.fields[field]
+        postings = field_index.get(token)
+        if self.compress:
+            self.pending[field].add(token)
+        if postings is None:
+            field_index[token] = new_postings((doc_id,))
+            self.frequencies[field][token] = array(FREQUENCY_TYPECODE, (1,))
+            self.ngrams.add(token)
+            self._prefix_index = None
+            return True
+        if not isinstance(postings, array):
+            postings = field_index[token] = writable(postings)
+        frequencies = self.frequencies[field][token]
+        if not isinstance(frequencies, array):
+            frequencies = self.frequencies[field][token] = writable(frequencies, FREQUENCY_TYPECODE)
+        if postings[-1] != doc_id:
+            postings.append(doc_id)
+            frequencies.append(1)
+        elif frequencies[-1] < MAX_FREQUENCY:
+            frequencies[-1] += 1
+        return False
+    def add_tokens(self, field: str, tokens: Iterable[str], doc_id: int):
+        for token in tokens:
+            self.add(field, token, doc_id)
+    def add_pairs(self, field: str, pairs: Iterable[Tuple[str, str]], doc_id: int):
+        add = self.add
+        surfaces = self.surfaces
+        for token, surface in pairs:
+            if add(field, token, doc_id) and token not in surfaces:
+                surfaces[token] = surface.lower()
+    def surface(self, token: str) -> str:
+        return self.surfaces.get(token, token)
+    def clear_field(self, field: str):
+        self.fields[field] = {}
+        self.frequencies[field] = {}
+        self.lengths[field] = new_postings()
+        self.token_counts[field] = 0
+        self.pending[field] = set()
+        self._prefix_index = None
+    def replace_field(self, field: str, other: 'InvertedIndex'):
+        for token in other.fields[field]:
+            self.ngrams.add(token)
+            if token not in self.surfaces:
+                self.surfaces[token] = other.surface(token)
+        self.frequencies[field] = other.frequencies[field]
+        self.lengths[field] = other.lengths[field]
+        self.token_counts[field] = other.token_counts[field]
+        self.pending[field] = other.pending[field]
+        self.fields[field] = other.fields[field]
+        self._prefix_index = None
+    def freeze(self, fields: Optional[Sequence[str]] = None):
+        if not self.compress:
+            return
+        for field in fields or self.fields:
+            field_index = self.fields[field]
+            for token in self.pending[field]:
+                postings = field_index[token]
+                if isinstance(postings, array):
+                    field_index[token] = encode_deltas(postings)
+            self.pending[field] = set()
+    def postings(self, field: str, token: str) -> array:
+        postings = self.fields[field].get(token)
+        if postings is None:
+            return new_postings()
+        return decode_deltas(postings) if isinstance(postings, bytes) else postings
+    def token_postings(self, token: str, fields: Optional[Sequence[str]] = None) -> array:
+        return union_postings(
+            self.postings(field, token) for field in fields or self.fields if token in self.fields[field]
+        )
+    def union_tokens(self, tokens: Iterable[str], fields: Optional[Sequence[str]] = None) -> array:
+        fields = fields or list(self.fields)
+        return union_postings(
+            self.postings(field, token) for token in tokens for field in fields if token in self.fields[field]
+        )
+    def document_frequency(self, token: str) -> int:
+        return len(self.token_postings(token))
+    def weighted_frequency(self, token: str) -> float:
+        return sum(
+            self.weights[field] * len(self.postings(field, token))
+            for field, field_index in self.fields.items() if token in field_index
+        )
+    def idf(self, token: str, size: int) -> float:
+        document_frequency = self.document_frequency(token)
+        return math.log(1.0 + (size - document_frequency + 0.5) / (document_frequency + 0.5))
+    def average_length(self, field: str) -> float:
+        return self.token_counts[field] / len(self.lengths[field]) if self.lengths[field] else 0.0
+    def bm25_scores(self, token_groups: Sequence[Sequence[str]], size: int) -> List[float]:
+        scores = np.zeros(size) if NUMPY_AVAILABLE else [0.0] * size
+        for token in dict.fromkeys(chain.from_iterable(token_groups)):
+            idf = self.idf(token, size)
+            for field, field_index in self.fields.items():
+                if token not in field_index:
+                    continue
+                boost = self.weights[field] * idf
+                postings = self.postings(field, token)
+                frequencies = self.frequencies[field][token]
+                lengths = self.lengths[field]
+                norm = BM25_K1 / (self.average_length(field) or 1.0)
+                if NUMPY_AVAILABLE:
+                    positions = _as_numpy(postings)
+                    tf = np.frombuffer(frequencies, dtype=np.uint16).astype(float)
+                    dl = np.frombuffer(lengths, dtype=np.uint32)[positions]
+                    scores[positions] += boost * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B) + BM25_B * norm * dl)
+                else:
+                    for doc_id, tf in zip(postings, frequencies):
+                        scores[doc_id] += boost * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B) + BM25_B * norm * lengths[doc_id])
+        return scores.tolist() if NUMPY_AVAILABLE else scores
+    def prefix_index(self) -> PrefixIndex:
+        if self._prefix_index is None:
+            self._prefix_index = PrefixIndex((self.surface(token), self.weighted_frequency(token)) for token in self.vocabulary())
+        return self._prefix_index
+    def partial_matches(self, word: str) -> List[str]:
+        return list(dict.fromkeys(self.ngrams.containing(word) + self.ngrams.contained_in(word)))
+    def vocabulary(self, fields: Optional[Sequence[str]] = None) -> Iterator[str]:
+        seen = set()
+        for field in fields or self.fields:
+            for token in self.fields[field]:
+                if token not in seen:
+                    seen.add(token)
+                    yield token
+    def __contains__(self, token: object) -> bool:
+        return any(token in field_index for field_index in self.fields.values())
+    def memory_bytes(self) -> int:
+        total = 0
+        for field_index in self.fields.values():
+            total += sys.getsizeof(field_index)
+            for token, postings in field_index.items():
+                total += sys.getsizeof(token) + sys.getsizeof(postings)
+        for field, frequencies in self.frequencies.items():
+            total += sys.getsizeof(self.lengths[field]) + sum(sys.getsizeof(values) for values in frequencies.values())
+        total += sys.getsizeof(self.ngrams.grams) + sum(sys.getsizeof(postings) for postings in self.ngrams.grams.values())
+        return total
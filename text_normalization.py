@@ -0,0 +1,11 @@
+import re
+from functools import lru_cache
+import unidecode
+_WHITESPACE_RE = re.compile(r'\s+')
+def fold_text(text: str) -> str:
+    if not text:
+        return ""
+    return unidecode.unidecode(str(text)).lower()
+@lru_cache(maxsize=8192)
+def fold_term(term: str) -> str:
+    return _WHITESPACE_RE.sub(' ', fold_text(term)).strip()
@@ -4,9 +4,11 @@ import argparse
 import sys
 import os
 import logging
+import re
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from selenium import webdriver
@@ -18,7 +20,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import unidecode
+from job_classifier import job_classifier
+from text_normalization import fold_term
+from description_parser import parse_sections, apply_sections, split_items
+from job_enrichment import WorkMode, enrich_job, parse_work_mode
+from job_identity import stable_job_id
+from job_dedupe import DEFAULT_THRESHOLD, deduplicate_jobs
+from job_store import save_jobs_to_store
+from job_output import OUTPUT_MODES, AVAILABLE_COMPRESSIONS, write_jobs, output_file_name, save_jobs_to_parquet, parquet_path_for
+from job_delta import write_delta
+from output_catalog import record_output_run
 if sys.platform.startswith('win'):
     if hasattr(sys.stdout, 'reconfigure'):
         sys.stdout.reconfigure(encoding='utf-8')
@@ -58,16 +69,23 @@ class MSJob:
     data_publicacao: str = ""
     ms_verified: bool = True
     extraction_method: str = ""
-    responsabilidades: str = ""
-    requisitos: str = ""
-    beneficios: str = ""
+    responsabilidades: List[str] = field(default_factory=list)
+    requisitos: List[str] = field(default_factory=list)
+    beneficios: List[str] = field(default_factory=list)
     salario: str = ""
     descricao: str = ""
     portal_origem: str = ""
     latitude: Optional[float] = None
     longitude: Optional[float] = None
+    modalidade: str = WorkMode.NAO_INFORMADO.value
+    salario_min: Optional[float] = None
+    salario_max: Optional[float] = None
+    salario_periodo: str = ""
+    data_publicacao_iso: str = ""
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items()}
+        return dict(self.__dict__)
+    def enriched_dict(self) -> Dict[str, Any]:
+        return enrich_job(self.to_dict())
 MS_CITIES = [
     'Campo Grande', 'Dourados', 'Três Lagoas', 'Corumbá', 'Ponta Porã',
     'Naviraí', 'Nova Andradina', 'Maracaju', 'Sidrolândia', 'Caarapó',
@@ -76,22 +94,43 @@ MS_CITIES = [
     'Ribas do Rio Pardo', 'São Gabriel do Oeste', 'Costa Rica',
     'Anastácio', 'Terenos', 'Inocência', 'Cassilândia', 'Aparecida do Taboado'
 ]
+BRAZIL_UFS = {
+    'ac', 'al', 'ap', 'am', 'ba', 'ce', 'df', 'es', 'go', 'ma', 'mt', 'ms', 'mg', 'pa',
+    'pb', 'pr', 'pe', 'pi', 'rj', 'rn', 'rs', 'ro', 'rr', 'sc', 'sp', 'se', 'to'
+}
+_MS_CITY_BY_KEY = {fold_term(city): city for city in MS_CITIES}
+_REMOTE_RE = re.compile(r'(?<![a-z0-9])(?:remoto|remote|home\s*office|hibrido)(?![a-z0-9])')
+_MS_CITY_RE = re.compile(
+    r'(?<![a-z0-9])(' + '|'.join(re.escape(key).replace(r'\ ', r'\s+') for key in sorted(_MS_CITY_BY_KEY, key=len, reverse=True)) + r')(?![a-z0-9])'
+)
+_MS_STATE_RE = re.compile(r'(?<![a-z0-9])(?:mato\s+grosso\s+do\s+sul|ms(?!\s*(?:office|excel|word|project|teams|sql|dynamics)))(?![a-z0-9])')
+_UF_TOKEN_RE = re.compile(r'(?:\s-\s*|/\s*|,\s*|\(\s*)([a-z]{2})(?=\s*(?:$|[)/,|]|-\s))')
 class MSLocationValidator:
     @staticmethod
     def is_ms_location(text: str) -> tuple[bool, str, str]:
         if not text:
             return False, "", ""
-        normalized_text = unidecode.unidecode(text).lower().strip()
-        remote_indicators = ['remoto', 'remote', 'home office', 'hibrido']
-        if any(indicator in normalized_text for indicator in remote_indicators):
-            return True, "Remoto", text.strip()
-        for city in MS_CITIES:
-            if unidecode.unidecode(city).lower() in normalized_text:
-                return True, city, text.strip()
-        ms_indicators = ['ms', 'mato grosso do sul']
-        if any(indicator in normalized_text for indicator in ms_indicators):
-            return True, "Mato Grosso do Sul", text.strip()
-        return False, "", ""
+        is_ms, city = MSLocationValidator._match_normalized(fold_term(text))
+        if not is_ms:
+            return False, "", ""
+        return True, city, text.strip()
+    @staticmethod
+    def validate_batch(texts: List[str]) -> List[tuple[bool, str, str]]:
+        return [MSLocationValidator.is_ms_location(text) for text in texts]
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _match_normalized(normalized_text: str) -> tuple[bool, str]:
+        if _REMOTE_RE.search(normalized_text):
+            return True, "Remoto"
+        explicit_ufs = {uf for uf in _UF_TOKEN_RE.findall(normalized_text) if uf in BRAZIL_UFS}
+        if explicit_ufs and 'ms' not in explicit_ufs:
+            return False, ""
+        city_match = _MS_CITY_RE.search(normalized_text)
+        if city_match:
+            return True, _MS_CITY_BY_KEY[fold_term(city_match.group(1))]
+        if _MS_STATE_RE.search(normalized_text):
+            return True, "Mato Grosso do Sul"
+        return False, ""
 class InfoJobsIndependentScraper:
     def __init__(self):
         self.base_url = "https://www.infojobs.com.br/empregos.aspx?provincia=175"
@@ -264,27 +303,21 @@ class InfoJobsIndependentScraper:
                 full_description = desc_element.text.strip()
                 if full_description:
                     job_data['descricao'] = full_description
-                    if "MISSÃO" in full_description:
-                        mission_section = full_description.split("MISSÃO")[1].split("PRINCIPAIS ATIVIDADES")[0].strip()
-                        job_data['responsabilidades'] = mission_section if mission_section else ""
-                    if "PRINCIPAIS ATIVIDADES" in full_description:
-                        activities_section = full_description.split("PRINCIPAIS ATIVIDADES")[1].strip()
-                        activities_clean = activities_section.replace("*", "\n•").replace(";", ";\n")
-                        job_data['requisitos'] = activities_clean[:800] + "..." if len(activities_clean) > 800 else activities_clean
+                    apply_sections(job_data, parse_sections(full_description))
             except:
                 try:
                     requirements_element = driver.find_element(By.XPATH, '//*[@id="vacancylistDetail"]/div[2]/p[1]')
-                    job_data['requisitos'] = requirements_element.text.strip()
+                    job_data['requisitos'] = split_items(requirements_element.text.strip())
                 except:
                     try:
                         req_elements = driver.find_elements(By.CSS_SELECTOR, "p, div[class*='description'], [class*='requirement']")
                         for elem in req_elements:
                             text = elem.text.strip()
                             if len(text) > 50 and any(word in text.lower() for word in ['requisito', 'experiência', 'formação', 'escolaridade']):
-                                job_data['requisitos'] = text
+                                job_data['requisitos'] = split_items(text)
                                 break
                     except:
-                        job_data['requisitos'] = ""
+                        job_data['requisitos'] = []
                 try:
                     desc_elements = driver.find_elements(By.CSS_SELECTOR, "[class*='description'], [class*='detail'], .job-description, #vacancylistDetail")
                     for elem in desc_elements:
@@ -303,31 +336,7 @@ class InfoJobsIndependentScraper:
                         break
             except:
                 job_data['data_publicacao'] = ""
-            page_text = driver.page_source.lower()
-            if any(keyword in page_text for keyword in ['clt', 'efetiv', 'carteira']):
-                job_data['tipo_contrato'] = "CLT"
-            elif any(keyword in page_text for keyword in ['pj', 'pessoa jurídica', 'freelancer']):
-                job_data['tipo_contrato'] = "PJ"
-            elif any(keyword in page_text for keyword in ['estágio', 'estagiário']):
-                job_data['tipo_contrato'] = "Estágio"
-            elif any(keyword in page_text for keyword in ['terceiriz', 'temporár']):
-                job_data['tipo_contrato'] = "Temporário"
-            else:
-                job_data['tipo_contrato'] = "Não informado"
-            if any(keyword in page_text for keyword in ['tecnologia', 'ti', 'software', 'desenvolviment']):
-                job_data['setor'] = "Tecnologia"
-            elif any(keyword in page_text for keyword in ['saúde', 'médic', 'hospital', 'clínic']):
-                job_data['setor'] = "Saúde"
-            elif any(keyword in page_text for keyword in ['educação', 'ensino', 'escola', 'professor']):
-                job_data['setor'] = "Educação"
-            elif any(keyword in page_text for keyword in ['vendas', 'comercial', 'marketing']):
-                job_data['setor'] = "Comercial"
-            elif any(keyword in page_text for keyword in ['construção', 'engenharia', 'obras']):
-                job_data['setor'] = "Construção"
-            elif any(keyword in page_text for keyword in ['financeiro', 'banco', 'contábil']):
-                job_data['setor'] = "Financeiro"
-            else:
-                job_data['setor'] = "Diversos"
+            job_data.update(job_classifier.classify_job(job_data))
             try:
                 location_div = driver.find_element(By.CSS_SELECTOR, "div.mb-8")
                 location_text = location_div.text.strip()
@@ -350,7 +359,7 @@ class InfoJobsIndependentScraper:
                     location_elements = driver.find_elements(By.CSS_SELECTOR, "[class*='location'], [class*='cidade']")
                     for elem in location_elements:
                         text = elem.text.strip()
-                        if any(city in text for city in ms_cities + ['MS', 'Mato Grosso']):
+                        if MSLocationValidator.is_ms_location(text)[0]:
                             job_data['localizacao'] = text
                             break
                 except:
@@ -359,24 +368,17 @@ class InfoJobsIndependentScraper:
                 job_type_elements = driver.find_elements(By.CSS_SELECTOR, "div svg.icon-buildings")
                 for elem in job_type_elements:
                     parent_div = elem.find_element(By.XPATH, "..")
-                    job_type_text = parent_div.text.strip().lower()
-                    if "presencial" in job_type_text:
-                        job_data['trabalho_remoto'] = False
-                        job_data['tipo_contrato'] = "Presencial"
-                        break
-                    elif "remoto" in job_type_text or "home office" in job_type_text:
-                        job_data['trabalho_remoto'] = True
-                        job_data['tipo_contrato'] = "Remoto"
-                        break
-                    elif "híbrido" in job_type_text:
-                        job_data['trabalho_remoto'] = True
-                        job_data['tipo_contrato'] = "Híbrido"
+                    work_mode = parse_work_mode(parent_div.text)
+                    if work_mode != WorkMode.NAO_INFORMADO:
+                        job_data['modalidade'] = work_mode.value
+                        job_data['trabalho_remoto'] = work_mode != WorkMode.PRESENCIAL
                         break
             except:
                 pass
-            page_text = driver.page_source.lower()
-            if 'trabalho_remoto' not in job_data or job_data['trabalho_remoto'] is None:
-                job_data['trabalho_remoto'] = any(keyword in page_text for keyword in ['remoto', 'home office', 'híbrido', 'trabalho remoto', 'remote'])
+            if 'modalidade' not in job_data:
+                work_mode = parse_work_mode(job_data.get('localizacao', ''), job_data.get('descricao', ''))
+                job_data['modalidade'] = work_mode.value
+                job_data['trabalho_remoto'] = work_mode in (WorkMode.REMOTO, WorkMode.HIBRIDO)
             if job_data['titulo'] == "Título não encontrado":
                 return None
             return InfoJobsIndependentScraper._format_job_data(job_data, index, ms_cities)
@@ -393,7 +395,7 @@ class InfoJobsIndependentScraper:
             if city_part in ms_cities:
                 city = city_part
         return MSJob(
-            id=f"infojobs-{index:04d}-{int(time.time()) % 10000}",
+            id=stable_job_id({'link': job_data.get('link', ''), 'titulo': job_data.get('titulo', ''), 'empresa': job_data.get('empresa', ''), 'cidade': city}),
             titulo=job_data.get('titulo', 'Título não encontrado'),
             empresa=job_data.get('empresa', 'Empresa não informada'),
             empresa_id=9999,
@@ -402,10 +404,12 @@ class InfoJobsIndependentScraper:
             setor=job_data.get('setor', 'Diversos'),
             tipo_contrato=job_data.get('tipo_contrato', 'Não informado'),
             trabalho_remoto=job_data.get('trabalho_remoto', False),
+            modalidade=job_data.get('modalidade', WorkMode.NAO_INFORMADO.value),
             localizacao_completa=loc_completa if loc_completa else job_data.get('localizacao', ''),
             salario=job_data.get('salario', 'A combinar'),
-            requisitos=job_data.get('requisitos', ''),
-            responsabilidades=job_data.get('responsabilidades', ''),
+            requisitos=job_data.get('requisitos', []),
+            responsabilidades=job_data.get('responsabilidades', []),
+            beneficios=job_data.get('beneficios', []),
             descricao=job_data.get('descricao', ''),
             data_publicacao=job_data.get('data_publicacao', ''),
             latitude=job_data.get('latitude'),
@@ -413,7 +417,7 @@ class InfoJobsIndependentScraper:
             data_coleta=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             extraction_method="infojobs_unified_enhanced",
             portal_origem="InfoJobs"
-        ).to_dict()
+        ).enriched_dict()
 class SimpleGupyScraper:
     def __init__(self, company: Company):
         self.company = company
@@ -455,7 +459,7 @@ class SimpleGupyScraper:
                         title_elem = element.find_element(By.CSS_SELECTOR, "td[data-testid^='job-list__cell-job-name']")
                         title = title_elem.text
                         link = element.find_element(By.CSS_SELECTOR, "a").get_attribute('href')
-                        job_id = f"gupy-{self.company.id}-{len(jobs_data)+1:03d}"
+                        job_id = stable_job_id({'link': link, 'titulo': title, 'empresa': self.company.nome, 'cidade': city})
                         job = MSJob(
                             id=job_id,
                             titulo=title,
@@ -471,7 +475,7 @@ class SimpleGupyScraper:
                             extraction_method="gupy_unified",
                             portal_origem="Gupy"
                         )
-                        jobs_data.append(job.to_dict())
+                        jobs_data.append(job.enriched_dict())
                 except Exception:
                     continue
             logger.info(f"Gupy ({self.company.nome}): Extraídas {len(jobs_data)} vagas de MS.")
@@ -482,10 +486,9 @@ class SimpleGupyScraper:
         finally:
             if self.driver:
                 self.driver.quit()
-def save_jobs_to_json(jobs: List[Dict[str, Any]], output_file: str):
+def save_jobs_to_json(jobs: List[Dict[str, Any]], output_file: str, mode: str = 'pretty'):
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(jobs, f, ensure_ascii=False, indent=2)
+        write_jobs(jobs, output_file, mode)
         logger.info(f"Resultados salvos com sucesso em {output_file}")
     except Exception as e:
         logger.error(f"Erro ao salvar vagas em JSON: {e}")
@@ -521,6 +524,10 @@ def load_gupy_companies_from_json(file_path: str) -> List[Company]:
 def main():
     parser = argparse.ArgumentParser(description='Scraper Unificado para Gupy e InfoJobs.')
     parser.add_argument('--limit', type=int, help='Limita o número de rolagens de página para o InfoJobs.')
+    parser.add_argument('--output-format', choices=OUTPUT_MODES, default='pretty', help='Formato do arquivo de vagas: JSON indentado, JSON compacto ou NDJSON.')
+    parser.add_argument('--compression', choices=AVAILABLE_COMPRESSIONS, default='none', help='Compressão do arquivo de vagas (gzip, ou zstd com o pacote zstandard instalado).')
+    parser.add_argument('--parquet', action='store_true', help='Também exporta as vagas em formato colunar Parquet.')
+    parser.add_argument('--dedupe-threshold', type=float, default=DEFAULT_THRESHOLD, help='Similaridade mínima (0-1) para considerar duas vagas duplicadas.')
     args = parser.parse_args()
     logger.info("🚀 Iniciando Scraper Unificado para Gupy e InfoJobs 🚀")
     all_jobs = []
@@ -554,18 +561,18 @@ def main():
                 logger.error(f"Erro fatal no scraper Gupy para {company.nome}: {e}")
     logger.info("="*20 + " FASE 3: FINALIZAÇÃO " + "="*20)
     if all_jobs:
-        seen = set()
-        unique_jobs = []
-        for job in all_jobs:
-            job_key = (job.get('titulo'), job.get('empresa'), job.get('cidade'))
-            if job_key not in seen:
-                seen.add(job_key)
-                unique_jobs.append(job)
+        unique_jobs = deduplicate_jobs(all_jobs, threshold=args.dedupe_threshold)
         output_dir = "output"
         import os
         os.makedirs(output_dir, exist_ok=True)
-        output_file = f"{output_dir}/unified_ms_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        save_jobs_to_json(unique_jobs, output_file)
+        output_file = f"{output_dir}/" + output_file_name(f"unified_ms_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}", args.output_format, args.compression)
+        save_jobs_to_json(unique_jobs, output_file, args.output_format)
+        run_files = [output_file]
+        if args.parquet and save_jobs_to_parquet(unique_jobs, str(parquet_path_for(output_file))):
+            run_files.append(parquet_path_for(output_file))
+        run_files.append(write_delta(unique_jobs, output_file))
+        record_output_run(run_files, unique_jobs, output_dir)
+        save_jobs_to_store(unique_jobs, output_file)
         logger.info(f"🎉 Processo concluído! Total de {len(unique_jobs)} vagas únicas salvas. 🎉")
         infojobs_count = len([j for j in unique_jobs if j.get('portal_origem') == 'InfoJobs'])
         gupy_count = len(unique_jobs) - infojobs_count